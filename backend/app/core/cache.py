@@ -0,0 +1,91 @@
+"""
+In-process caching helpers for the Caja backend application.
+"""
+
+import time
+from collections.abc import Hashable
+from typing import Any, Optional
+
+
+class TTLCache:
+    """Small in-memory cache whose entries expire after a fixed time.
+
+    Intended for hot read paths that many clients poll with the same key,
+    so that a burst of identical requests costs a single database lookup.
+    Entries are per-process; writers are expected to call ``delete`` for
+    keys they change. Expired entries are kept until replaced or purged so
+    callers can fall back to them with ``get_stale`` when a reload fails.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid after being set
+            max_entries: Size at which expired entries are purged on write
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            return None
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value even if it has expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The last value set for the key, or None if there is none
+        """
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for the configured TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            self._purge_expired(now)
+        self._entries[key] = (now + self.ttl_seconds, value)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries, or everything if none have expired yet."""
+        expired = [key for key, (exp, _) in self._entries.items() if exp <= now]
+        if not expired:
+            self._entries.clear()
+            return
+        for key in expired:
+            del self._entries[key]
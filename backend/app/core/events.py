@@ -0,0 +1,82 @@
+"""
+In-process publish/subscribe for pushing live updates to clients.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class EventBroker:
+    """Fan out events published on a channel to every current subscriber.
+
+    Each subscriber gets its own bounded queue; when a slow subscriber's
+    queue is full the oldest pending event is dropped so publishers never
+    block.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        """Initialize the broker.
+
+        Args:
+            max_queue_size: Pending events kept per subscriber
+        """
+        self.max_queue_size = max_queue_size
+        self._subscribers: dict[Hashable, set[asyncio.Queue]] = defaultdict(set)
+
+    def publish(self, channel: Hashable, event: dict[str, Any]) -> int:
+        """Publish an event to all subscribers of a channel.
+
+        Args:
+            channel: Channel identifier
+            event: JSON-serializable event payload
+
+        Returns:
+            Number of subscribers the event was delivered to
+        """
+        queues = self._subscribers.get(channel)
+        if not queues:
+            return 0
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+        return len(queues)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: Hashable) -> AsyncIterator[asyncio.Queue]:
+        """Subscribe to a channel for the duration of the block.
+
+        Args:
+            channel: Channel identifier
+
+        Yields:
+            Queue receiving events published on the channel
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(channel)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self, channel: Hashable) -> int:
+        """Get the number of subscribers on a channel.
+
+        Args:
+            channel: Channel identifier
+
+        Returns:
+            Number of active subscribers
+        """
+        return len(self._subscribers.get(channel, ()))
+
+
+# Activity status changes, published per activity_id
+activity_events = EventBroker()
@@ -11,6 +11,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(..., description="Database URL for PostgreSQL")
+    db_pool_size: int = Field(
+        default=20, description="Persistent connections kept in the pool"
+    )
+    db_max_overflow: int = Field(
+        default=40, description="Extra connections allowed above the pool size"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True, description="Check pooled connections before use"
+    )
+    db_query_cache_size: int = Field(
+        default=1200, description="Compiled SQL statements cached per engine"
+    )
 
     # Security
     secret_key: str = Field(..., description="Secret key for JWT token signing")
@@ -45,6 +57,31 @@ class Settings(BaseSettings):
     polling_interval_seconds: int = Field(
         default=2, description="Polling interval in seconds"
     )
+    status_cache_ttl_seconds: float = Field(
+        default=1.0,
+        description="How long polled activity status is cached; keep it below "
+        "the polling interval",
+    )
+    event_keepalive_seconds: float = Field(
+        default=15.0,
+        description="Idle time after which event streams send a keepalive",
+    )
+    response_batch_size: int = Field(
+        default=500, description="Maximum responses written per batched INSERT"
+    )
+    response_batch_wait_seconds: float = Field(
+        default=0.05,
+        description="How long a response batch waits for more votes before "
+        "it is written",
+    )
+    heartbeat_batch_size: int = Field(
+        default=500, description="Maximum participant heartbeats written per flush"
+    )
+    heartbeat_batch_wait_seconds: float = Field(
+        default=0.2,
+        description="How long a heartbeat batch waits for more beats before "
+        "it is written",
+    )
 
     # API
     api_v1_prefix: str = "/api/v1"
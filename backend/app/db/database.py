@@ -3,30 +3,86 @@ Database configuration and connection management.
 """
 
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
 from app.core.settings import settings
 
+# Async driver for each backend. PostgreSQL URLs naming a sync driver (e.g.
+# postgresql+psycopg2://) are switched too, since a sync driver behind the
+# async engine would block the event loop on every query.
+_ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Convert a database URL to use the backend's async driver.
+
+    Args:
+        database_url: Configured database URL
+
+    Returns:
+        The URL with its driver replaced, or unchanged for unknown backends
+    """
+    scheme, sep, rest = database_url.partition("://")
+    driver = _ASYNC_DRIVERS.get(scheme.split("+", 1)[0])
+    return f"{driver}{sep}{rest}" if sep and driver else database_url
+
+
 # Convert database URLs for async operations
-async_database_url = settings.database_url
-if async_database_url.startswith("postgresql://"):
-    async_database_url = async_database_url.replace(
-        "postgresql://", "postgresql+asyncpg://"
-    )
-elif async_database_url.startswith("sqlite://"):
-    async_database_url = async_database_url.replace("sqlite://", "sqlite+aiosqlite://")
+async_database_url = to_async_url(settings.database_url)
+
+# Size the pool for concurrent sessions (e.g. asyncio.gather fan-outs).
+# SQLite uses single-connection or file pools that take no sizing options.
+pool_options = (
+    {}
+    if async_database_url.startswith("sqlite")
+    else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+)
 
-# Create async engine
+# Create async engine; the compiled statement cache is sized to hold every
+# statement shape the services issue so repeated queries skip compilation
 async_engine = create_async_engine(
     async_database_url,
     echo=settings.debug,
     future=True,
+    query_cache_size=settings.db_query_cache_size,
+    **pool_options,
 )
 
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Turn on foreign key enforcement for new SQLite connections.
+
+    SQLite ignores foreign keys unless asked to, while PostgreSQL always
+    enforces them; services rely on the database rejecting dangling ids.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if async_engine.dialect.name == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -56,6 +112,34 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def session_scope(
+    bind: Optional[AsyncEngine] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Open a standalone session, e.g. for queries run alongside a request.
+
+    Args:
+        bind: Engine to bind to (defaults to the application engine)
+
+    Yields:
+        A session that is closed when the block exits
+    """
+    session = AsyncSessionLocal(bind=bind) if bind else AsyncSessionLocal()
+    async with session:
+        yield session
+
+
+def supports_concurrent_sessions(db: AsyncSession) -> bool:
+    """Check whether the engine behind ``db`` hands out independent connections.
+
+    Single-connection pools (e.g. in-memory SQLite) share one DBAPI connection
+    between sessions, so concurrent queries must stay on ``db`` there.
+    """
+    return db.bind is not None and not isinstance(
+        db.bind.pool, (StaticPool, SingletonThreadPool)
+    )
+
+
 def get_sync_db():
     """Get synchronous database session for migrations."""
     db = SessionLocal()
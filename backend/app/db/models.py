@@ -2,7 +2,7 @@
 SQLAlchemy models for the Caja application.
 """
 
-from datetime import datetime
+from datetime import datetime, UTC
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -14,11 +14,13 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -28,6 +30,11 @@ from sqlalchemy.types import TypeDecorator
 from app.db.database import Base
 
 
+def _utcnow() -> datetime:
+    """Current UTC time, for Python-side timestamp defaults."""
+    return datetime.now(UTC)
+
+
 class JSONBType(TypeDecorator):
     """Database-agnostic JSONB type that works with both PostgreSQL and SQLite."""
 
@@ -109,6 +116,21 @@ class Activity(Base):
     """Activity model with JSONB configuration storage and framework support."""
 
     __tablename__ = "activities"
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE so
+    # writers do not need a refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Partial index for get_active_activity: only active rows are indexed
+        Index(
+            "ix_activities_active_session_updated",
+            "session_id",
+            "updated_at",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        # Session activity lists are paged in order_index order
+        Index("ix_activities_session_order", "session_id", "order_index"),
+    )
 
     id: Mapped[UUID] = mapped_column(UUIDType, primary_key=True, default=uuid4)
     session_id: Mapped[int] = mapped_column(
@@ -211,12 +233,34 @@ class UserResponse(Base):
         Integer, ForeignKey("participants.id", ondelete="CASCADE")
     )
     response_data: Mapped[dict] = mapped_column(JSONBType)
+    # Set in Python so the stored value has the same precision and format as
+    # the (created_at, id) page cursors compared against it; SQLite's
+    # CURRENT_TIMESTAMP default has whole seconds in a different format
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+    __table_args__ = (
+        # Responses are always read per activity, often scoped by session too,
+        # and listed newest first or polled for rows after a timestamp
+        Index(
+            "ix_user_responses_activity_session_created",
+            "activity_id",
+            "session_id",
+            "created_at",
+        ),
+        # Per-participant history within a session, newest first
+        Index(
+            "ix_user_responses_session_participant_created",
+            "session_id",
+            "participant_id",
+            "created_at",
+        ),
+    )
+
     # Relationships
     session = relationship("Session", back_populates="user_responses")
     activity = relationship("Activity", back_populates="user_responses")
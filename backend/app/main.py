@@ -12,6 +12,8 @@ from app.core.logging import configure_logging, get_logger
 from app.core.settings import settings
 from app.routes import health, sessions, user_responses, activities, participants
 from app.services.activity_framework.registration import register_activity_types
+from app.services.heartbeat_writer import heartbeat_writer
+from app.services.response_writer import response_writer
 
 # Configure logging
 configure_logging()
@@ -63,6 +65,10 @@ async def shutdown_event():
     """Application shutdown event handler."""
     logger.info("Shutting down Caja backend application")
 
+    # Write out responses and heartbeats still waiting in a batch
+    await response_writer.flush()
+    await heartbeat_writer.flush()
+
 
 @app.get("/")
 async def root():
@@ -53,3 +53,6 @@ class UserResponseList(BaseModel):
 
     responses: list[UserResponse]
     summary: UserResponseSummary
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or None on the last page"
+    )
@@ -268,6 +268,9 @@ class IncrementalResponseList(BaseModel):
     items: list[UserResponse] = []
     since: datetime
     count: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor to pass on the next poll to resume after items"
+    )
 
 
 # Error models
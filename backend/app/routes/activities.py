@@ -1,12 +1,28 @@
 """API routes for Activity operations."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.events import activity_events
+from app.core.settings import settings
 from app.db.database import get_db
 from app.db.enums import ActivityStatus
 from app.models.jsonb_schemas.activity import (
@@ -32,6 +48,37 @@ from app.services.activity_service import ActivityService
 router = APIRouter(prefix="/api/v1", tags=["activities"])
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic's native JSON encoder.
+
+    Returning a Response skips FastAPI's re-validation against the route's
+    response_model and its jsonable_encoder pass; response_model is kept on
+    the route for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _status_etag(status_data: dict) -> str:
+    """Build an entity tag for polled activity status.
+
+    The status only changes when the activity is updated or a response
+    arrives, so these fields identify a version without serializing it.
+    """
+    return '"{}-{}-{}"'.format(
+        status_data["status"],
+        status_data["response_count"],
+        status_data["last_updated"].timestamp(),
+    )
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an If-None-Match header against an entity tag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @router.post(
     "/sessions/{session_id}/activities",
     response_model=Activity,
@@ -65,6 +112,9 @@ async def get_session_activities(
     status: Optional[ActivityStatus] = Query(
         None, description="Filter activities by status"
     ),
+    include_config: bool = Query(
+        True, description="Include each activity's config (omit for summaries)"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> ActivityList:
     """Get all activities for a session."""
@@ -78,8 +128,11 @@ async def get_session_activities(
             offset=offset,
             limit=limit,
             status=status,
+            include_config=include_config,
+        )
+        return _json_response(
+            ActivityList.model_construct(activities=activities, total=total_count)
         )
-        return ActivityList(activities=activities, total=total_count)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -94,7 +147,7 @@ async def get_session_activities(
 async def get_activity_types():
     """Get all available activity types from the framework."""
     try:
-        activity_types = await ActivityService.get_activity_types()
+        activity_types = ActivityService.get_activity_types()
         return ActivityTypesListResponse(activity_types=activity_types)
     except Exception as e:
         raise HTTPException(
@@ -110,7 +163,7 @@ async def get_activity_types():
 async def get_activity_type_schema(activity_type: str):
     """Get JSON schema for a specific activity type."""
     try:
-        schema = await ActivityService.get_activity_type_schema(activity_type)
+        schema = ActivityService.get_activity_type_schema(activity_type)
         return ActivityTypeSchemaResponse(activity_type=activity_type, schema=schema)
     except ValueError as e:
         raise HTTPException(
@@ -130,7 +183,7 @@ async def validate_activity_configuration(
 ):
     """Validate activity configuration against type schema."""
     try:
-        result = await ActivityService.validate_activity_config(
+        result = ActivityService.validate_activity_config(
             activity_type=validation_request.activity_type,
             configuration=validation_request.configuration,
         )
@@ -163,7 +216,7 @@ async def get_activity(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activity not found",
             )
-        return activity
+        return _json_response(activity)
     except HTTPException:
         raise
     except Exception as e:
@@ -265,7 +318,7 @@ async def get_active_activity(
             db=db,
             session_id=session_id,
         )
-        return activity
+        return _json_response(activity) if activity else None
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -280,9 +333,14 @@ async def get_active_activity(
 async def get_activity_status(
     session_id: int,
     activity_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ) -> ActivityStatusResponse:
-    """Get activity status for real-time polling."""
+    """Get activity status for real-time polling.
+
+    Responses carry an ETag; pollers that send it back in If-None-Match get
+    an empty 304 until the status changes.
+    """
     try:
         status_data = await ActivityService.get_activity_status(
             db=db,
@@ -294,7 +352,14 @@ async def get_activity_status(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Activity not found",
             )
-        return ActivityStatusResponse(**status_data)
+        etag = _status_etag(status_data)
+        if _etag_matches(etag, if_none_match):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response = _json_response(ActivityStatusResponse(**status_data))
+        response.headers["ETag"] = etag
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -453,3 +518,64 @@ async def get_framework_activity_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get framework activity status: {str(e)}",
         )
+
+
+@router.get("/activities/{activity_id}/events")
+async def activity_events_stream(activity_id: UUID) -> StreamingResponse:
+    """Stream activity status changes as Server-Sent Events.
+
+    Carries the same events as the WebSocket endpoint on this path, for
+    clients that only need server-to-client updates (e.g. EventSource).
+    """
+    return StreamingResponse(
+        _server_sent_events(activity_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _server_sent_events(activity_id: UUID) -> AsyncIterator[str]:
+    """Format events published for an activity as an SSE stream."""
+    async with activity_events.subscribe(activity_id) as queue:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), settings.event_keepalive_seconds
+                )
+            except TimeoutError:
+                # Comment line so proxies do not drop an idle connection
+                yield ": keepalive\n\n"
+                continue
+            name = event.get("event", "message")
+            yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.websocket("/activities/{activity_id}/events")
+async def activity_events_socket(websocket: WebSocket, activity_id: UUID):
+    """Push activity status changes to a connected client.
+
+    Each message names what changed (new response, state change, update or
+    deletion) so clients can refresh on demand instead of polling the status
+    endpoints, which remain available as a fallback.
+    """
+    await websocket.accept()
+    async with activity_events.subscribe(activity_id) as queue:
+        receive = asyncio.ensure_future(websocket.receive())
+        try:
+            while True:
+                next_event = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {receive, next_event}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if receive in done:
+                    if receive.result()["type"] == "websocket.disconnect":
+                        next_event.cancel()
+                        return
+                    # Client messages are ignored; keep listening
+                    receive = asyncio.ensure_future(websocket.receive())
+                if next_event in done:
+                    await websocket.send_json(next_event.result())
+                else:
+                    next_event.cancel()
+        finally:
+            receive.cancel()
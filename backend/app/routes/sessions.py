@@ -74,27 +74,9 @@ async def list_sessions(
     """
     try:
         sessions = await SessionService.list_sessions(db, offset, limit)
-        session_responses = []
-
-        for session in sessions:
-            stats = await SessionService.get_session_stats(db, session.id)
-            session_responses.append(
-                SessionResponse(
-                    id=session.id,
-                    title=session.title,
-                    description=session.description,
-                    status=session.status,
-                    qr_code=session.qr_code,
-                    admin_code=session.admin_code,
-                    max_participants=session.max_participants,
-                    created_at=session.created_at,
-                    updated_at=session.updated_at,
-                    started_at=session.started_at,
-                    completed_at=session.completed_at,
-                    participant_count=stats.get("participant_count", 0),
-                    activity_count=stats.get("activity_count", 0),
-                )
-            )
+        session_responses = [
+            SessionResponse.model_validate(session._mapping) for session in sessions
+        ]
 
         return SessionList(
             sessions=session_responses,
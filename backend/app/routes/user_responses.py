@@ -1,9 +1,11 @@
 """API routes for User Response operations."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
@@ -58,9 +60,14 @@ async def get_activity_responses(
     activity_id: UUID,
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ) -> UserResponseList:
-    """Get all responses for a specific activity with summary."""
+    """Get all responses for a specific activity with summary.
+
+    Pages can be walked with ``offset`` or, cheaper for deep pages, by passing
+    back the ``next_cursor`` of the previous page as ``cursor``.
+    """
     try:
         responses = await UserResponseService.get_activity_responses(
             db=db,
@@ -68,6 +75,7 @@ async def get_activity_responses(
             activity_id=activity_id,
             offset=offset,
             limit=limit,
+            cursor=UserResponseService.decode_cursor(cursor) if cursor else None,
         )
         summary_data = await UserResponseService.get_response_summary(
             db=db,
@@ -76,7 +84,15 @@ async def get_activity_responses(
         )
         summary = UserResponseSummary(**summary_data)
 
-        return UserResponseList(responses=responses, summary=summary)
+        next_cursor = (
+            UserResponseService.encode_cursor(responses[-1])
+            if len(responses) == limit
+            else None
+        )
+
+        return UserResponseList(
+            responses=responses, summary=summary, next_cursor=next_cursor
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -84,6 +100,24 @@ async def get_activity_responses(
         )
 
 
+@router.get("/sessions/{session_id}/activities/{activity_id}/responses/export")
+async def export_activity_responses(
+    session_id: int,
+    activity_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream all responses for an activity as newline-delimited JSON."""
+
+    async def lines() -> AsyncIterator[str]:
+        responses = UserResponseService.stream_activity_responses(
+            db=db, session_id=session_id, activity_id=activity_id
+        )
+        async for response in responses:
+            yield UserResponse.model_validate(response).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/sessions/{session_id}/activities/{activity_id}/responses/{participant_id}",
     response_model=UserResponse | None,
@@ -200,9 +234,15 @@ async def get_responses_since(
     activity_id: UUID,
     timestamp: str,  # ISO format timestamp
     limit: int = Query(1000, ge=1, le=10000),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ) -> IncrementalResponseList:
-    """Get responses created since a specific timestamp for incremental updates."""
+    """Get responses created since a specific timestamp for incremental updates.
+
+    Clients should pass back the ``next_cursor`` of the previous poll as
+    ``cursor``; it takes precedence over the timestamp, which only marks
+    where the first poll starts.
+    """
     try:
         # Parse the timestamp
         since_datetime = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
@@ -213,6 +253,11 @@ async def get_responses_since(
             activity_id=activity_id,
             since=since_datetime,
             limit=limit,
+            cursor=UserResponseService.decode_cursor(cursor) if cursor else None,
+        )
+        items = response_data["items"]
+        response_data["next_cursor"] = (
+            UserResponseService.encode_cursor(items[-1]) if items else cursor
         )
 
         return IncrementalResponseList(**response_data)
@@ -111,7 +111,10 @@ class BaseActivity(ABC):
         """Get default metadata for this activity type.
 
         Override this method to provide activity-type-specific
-        default metadata values.
+        default metadata values. Callers must not mutate the result, so
+        overrides can return one shared read-only mapping (e.g. a
+        ``MappingProxyType`` class constant) instead of building a new dict
+        on every call.
 
         Returns:
             Dictionary of default metadata values
@@ -123,11 +126,13 @@ class BaseActivity(ABC):
             "show_live_results": True,
         }
 
+    @abstractmethod
     def calculate_results(self, responses: list[dict[str, Any]]) -> dict[str, Any]:
         """Calculate aggregated results from responses.
 
-        Override this method to provide activity-specific result
-        calculation and aggregation logic.
+        Implement this method to provide activity-specific result
+        calculation and aggregation logic. Subclasses may call the base
+        implementation for a minimal response count summary.
 
         Args:
             responses: List of participant responses
@@ -0,0 +1,79 @@
+"""Activity Config Checks
+
+Fast configuration checkers compiled from activity JSON schemas.
+"""
+
+from collections.abc import Callable
+from typing import Any, Optional
+
+# Returns an error message for an invalid config, else None
+ConfigCheck = Callable[[dict[str, Any]], Optional[str]]
+
+
+def compile_config_checker(
+    schema: dict[str, Any], *extra_checks: ConfigCheck
+) -> Callable[[Any], Optional[str]]:
+    """Build a config checker from an activity configuration schema.
+
+    Config validation runs on every activity create and update, so the
+    required fields, string length limits, integer ranges and boolean fields
+    are read from the schema once here and each call only runs the
+    comparisons. Activity types pass ``extra_checks`` for rules the generic
+    checks do not cover; they run after the generic checks, in order.
+
+    Args:
+        schema: Activity configuration JSON schema
+        *extra_checks: Type-specific checks run on a structurally valid config
+
+    Returns:
+        Function returning an error message for an invalid config, else None
+    """
+    properties = schema["properties"]
+    required = tuple(schema.get("required", ()))
+    string_limits = tuple(
+        (field, spec.get("maxLength"))
+        for field, spec in properties.items()
+        if spec["type"] == "string"
+    )
+    int_ranges = tuple(
+        (field, spec["minimum"], spec["maximum"])
+        for field, spec in properties.items()
+        if spec["type"] == "integer"
+    )
+    bool_fields = tuple(
+        field for field, spec in properties.items() if spec["type"] == "boolean"
+    )
+
+    def check(config: Any) -> Optional[str]:
+        if not isinstance(config, dict):
+            return "config must be an object"
+        for field in required:
+            if field not in config:
+                return f"missing '{field}' field"
+
+        for field, max_length in string_limits:
+            if field not in config:
+                continue
+            value = config[field]
+            if not isinstance(value, str) or not value.strip():
+                return f"{field} must be a non-empty string"
+            if max_length is not None and len(value) > max_length:
+                return f"{field} exceeds maximum length of {max_length} characters"
+
+        for field, min_val, max_val in int_ranges:
+            if field in config:
+                value = config[field]
+                if not isinstance(value, int) or not min_val <= value <= max_val:
+                    return f"{field} must be integer between {min_val} and {max_val}"
+
+        for field in bool_fields:
+            if field in config and not isinstance(config[field], bool):
+                return f"field '{field}' must be boolean"
+
+        for extra_check in extra_checks:
+            error = extra_check(config)
+            if error is not None:
+                return error
+        return None
+
+    return check
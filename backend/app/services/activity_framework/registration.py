@@ -13,6 +13,9 @@ from app.services.activity_types.word_cloud import WordCloudActivity
 
 logger = logging.getLogger(__name__)
 
+# (activity_type, id(activity_class)) pairs that have already passed validation
+_validated: set[tuple[str, int]] = set()
+
 
 def register_activity_types() -> None:
     """Register all activity types at startup.
@@ -59,14 +62,16 @@ def register_activity_types() -> None:
         # Log registration summary
         registered_types = ActivityRegistry.get_all_types()
         logger.info(
-            f"Activity type registration complete. Registered {len(registered_types)} types: {list(registered_types.keys())}"
+            "Activity type registration complete. Registered %d types: %s",
+            len(registered_types),
+            list(registered_types),
         )
 
         # Validate all registrations
         _validate_registrations()
 
     except Exception as e:
-        logger.error(f"Failed to register activity types: {e}")
+        logger.error("Failed to register activity types: %s", e)
         raise
 
 
@@ -81,35 +86,36 @@ def _validate_registrations() -> None:
 
         for activity_type in registered_types.keys():
             # Test that we can get the activity class
-            ActivityRegistry.get_activity_class(activity_type)
+            activity_class = ActivityRegistry.get_activity_class(activity_type)
+
+            # Skip registrations that were already validated
+            key = (activity_type, id(activity_class))
+            if key in _validated:
+                continue
 
             # Test that we can get the schema
             ActivityRegistry.get_schema(activity_type)
 
-            # Test that we can create an instance with empty config
+            # Test that we can create an instance with empty config. The
+            # required interface is enforced by BaseActivity's abstract methods.
             try:
-                instance = ActivityRegistry.create_activity(activity_type, None, {})
-                # Test that the instance has the required methods
-                assert hasattr(
-                    instance, "validate_config"
-                ), f"Activity {activity_type} missing validate_config method"
-                assert hasattr(
-                    instance, "get_schema"
-                ), f"Activity {activity_type} missing get_schema method"
-                assert hasattr(
-                    instance, "process_response"
-                ), f"Activity {activity_type} missing process_response method"
-
-                logger.debug(f"Activity type {activity_type} validated successfully")
+                ActivityRegistry.create_activity(activity_type, None, {})
+                _validated.add(key)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Activity type %s validated successfully", activity_type
+                    )
             except Exception as e:
-                logger.warning(f"Activity type {activity_type} validation warning: {e}")
+                logger.warning(
+                    "Activity type %s validation warning: %s", activity_type, e
+                )
 
         logger.info(
-            f"All {len(registered_types)} activity type registrations validated"
+            "All %d activity type registrations validated", len(registered_types)
         )
 
     except Exception as e:
-        logger.error(f"Activity type registration validation failed: {e}")
+        logger.error("Activity type registration validation failed: %s", e)
         raise
 
 
@@ -130,7 +136,7 @@ def get_registration_info() -> dict[str, Any]:
             "registry_details": registry_info,
         }
     except Exception as e:
-        logger.error(f"Failed to get registration info: {e}")
+        logger.error("Failed to get registration info: %s", e)
         return {
             "error": str(e),
             "total_registered": 0,
@@ -145,6 +151,7 @@ def clear_registrations() -> None:
     """
     logger.warning("Clearing all activity type registrations")
     ActivityRegistry.clear_registry()
+    _validated.clear()
 
 
 # Convenience function for testing individual activity types
@@ -3,6 +3,10 @@
 Manages registration and discovery of activity types.
 """
 
+import inspect
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Any, Optional
 from .base import BaseActivity
 
@@ -29,6 +33,14 @@ class ActivityRegistry:
     """
 
     _registry: dict[str, ActivityTypeInfo] = {}
+    # Bumped on every registry change so callers can invalidate derived caches
+    _version: int = 0
+    # Stateless per-type instances and default metadata, built on first use
+    _validators: dict[str, BaseActivity] = {}
+    _default_metadata: dict[str, Mapping[str, Any]] = {}
+    # Validation outcomes keyed by (activity_type, canonical config JSON)
+    _validation_results: OrderedDict[tuple[str, str], bool] = OrderedDict()
+    _max_validation_results: int = 256
 
     @classmethod
     def register(
@@ -51,7 +63,8 @@ class ActivityRegistry:
             version: Version of the activity type
 
         Raises:
-            ValueError: If activity type is already registered
+            ValueError: If activity type is already registered or the class
+                does not implement the BaseActivity interface
         """
         if activity_type in cls._registry:
             raise ValueError(f"Activity type '{activity_type}' is already registered")
@@ -59,6 +72,13 @@ class ActivityRegistry:
         if not issubclass(activity_class, BaseActivity):
             raise ValueError("Activity class must extend BaseActivity")
 
+        if inspect.isabstract(activity_class):
+            missing = ", ".join(sorted(activity_class.__abstractmethods__))
+            raise ValueError(
+                f"Activity class {activity_class.__name__} does not implement: "
+                f"{missing}"
+            )
+
         metadata = {
             "id": activity_type,
             "name": name or activity_type.replace("_", " ").title(),
@@ -69,6 +89,7 @@ class ActivityRegistry:
         cls._registry[activity_type] = ActivityTypeInfo(
             activity_class=activity_class, schema=schema, metadata=metadata
         )
+        cls._invalidate_caches(activity_type)
 
     @classmethod
     def unregister(cls, activity_type: str) -> bool:
@@ -82,6 +103,7 @@ class ActivityRegistry:
         """
         if activity_type in cls._registry:
             del cls._registry[activity_type]
+            cls._invalidate_caches(activity_type)
             return True
         return False
 
@@ -159,6 +181,15 @@ class ActivityRegistry:
             activity_type: info.schema for activity_type, info in cls._registry.items()
         }
 
+    @classmethod
+    def get_version(cls) -> int:
+        """Get a counter that changes whenever the registry is modified.
+
+        Returns:
+            Current registry version
+        """
+        return cls._version
+
     @classmethod
     def is_registered(cls, activity_type: str) -> bool:
         """Check if activity type is registered.
@@ -191,6 +222,88 @@ class ActivityRegistry:
         activity_class = cls.get_activity_class(activity_type)
         return activity_class(activity_id, config)
 
+    @classmethod
+    def validate_config_static(
+        cls, activity_type: str, configuration: dict[str, Any]
+    ) -> bool:
+        """Validate a configuration without creating a dedicated instance.
+
+        Config validation does not depend on instance state, so a single
+        shared instance per activity type is reused for every call. Results
+        are also memoized per canonical (sorted-key JSON) form of the config,
+        since the same configuration is typically validated many times.
+
+        Args:
+            activity_type: Activity type identifier
+            configuration: Configuration to validate
+
+        Returns:
+            True if configuration is valid, False otherwise
+
+        Raises:
+            ValueError: If activity type is not registered
+        """
+        try:
+            key = (activity_type, json.dumps(configuration, sort_keys=True))
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so it cannot be cached by content
+            return cls._get_validator(activity_type).validate_config(configuration)
+
+        results = cls._validation_results
+        is_valid = results.get(key)
+        if is_valid is not None:
+            results.move_to_end(key)
+            return is_valid
+
+        is_valid = cls._get_validator(activity_type).validate_config(configuration)
+        results[key] = is_valid
+        if len(results) > cls._max_validation_results:
+            results.popitem(last=False)
+        return is_valid
+
+    @classmethod
+    def _get_validator(cls, activity_type: str) -> BaseActivity:
+        """Get the shared validation instance for an activity type."""
+        validator = cls._validators.get(activity_type)
+        if validator is None:
+            validator = cls.create_activity(activity_type, None, {})
+            cls._validators[activity_type] = validator
+        return validator
+
+    @classmethod
+    def get_default_metadata(cls, activity_type: str) -> Mapping[str, Any]:
+        """Get default metadata for activity type.
+
+        The dictionary is computed once per type and shared between callers,
+        so it must not be mutated.
+
+        Args:
+            activity_type: Activity type identifier
+
+        Returns:
+            Default metadata for new activities of this type
+
+        Raises:
+            ValueError: If activity type is not registered
+        """
+        metadata = cls._default_metadata.get(activity_type)
+        if metadata is None:
+            metadata = cls.create_activity(
+                activity_type, None, {}
+            ).get_default_metadata()
+            cls._default_metadata[activity_type] = metadata
+        return metadata
+
+    @classmethod
+    def _invalidate_caches(cls, activity_type: str) -> None:
+        """Drop cached per-type lookups after the registry changes."""
+        cls._validators.pop(activity_type, None)
+        cls._default_metadata.pop(activity_type, None)
+        stale = [key for key in cls._validation_results if key[0] == activity_type]
+        for key in stale:
+            del cls._validation_results[key]
+        cls._version += 1
+
     @classmethod
     def clear_registry(cls) -> None:
         """Clear all registered activity types.
@@ -198,6 +311,10 @@ class ActivityRegistry:
         This method is primarily intended for testing purposes.
         """
         cls._registry.clear()
+        cls._validators.clear()
+        cls._default_metadata.clear()
+        cls._validation_results.clear()
+        cls._version += 1
 
     @classmethod
     def get_registry_info(cls) -> list[dict[str, Any]]:
@@ -6,8 +6,12 @@ Manages activity state transitions and validation.
 from typing import Optional, Any
 from datetime import datetime, timedelta
 import logging
+import warnings
 
-from app.db.enums import ActivityState
+from sqlalchemy import Row, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.enums import ActivityState, ActivityStatus
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +23,27 @@ class ActivityStateMachine:
     with proper validation and business rule enforcement.
     """
 
-    # Valid state transitions mapping
-    TRANSITIONS: dict[ActivityState, list[ActivityState]] = {
-        ActivityState.DRAFT: [ActivityState.PUBLISHED],
-        ActivityState.PUBLISHED: [ActivityState.ACTIVE, ActivityState.DRAFT],
-        ActivityState.ACTIVE: [ActivityState.EXPIRED],
-        ActivityState.EXPIRED: [],  # Terminal state
+    # Valid state transitions in display order (used for stable iteration)
+    ORDERED_TRANSITIONS: dict[ActivityState, tuple[ActivityState, ...]] = {
+        ActivityState.DRAFT: (ActivityState.PUBLISHED,),
+        ActivityState.PUBLISHED: (ActivityState.ACTIVE, ActivityState.DRAFT),
+        ActivityState.ACTIVE: (ActivityState.EXPIRED,),
+        ActivityState.EXPIRED: (),  # Terminal state
+    }
+
+    # Valid state transitions mapping (for O(1) membership checks)
+    TRANSITIONS: dict[ActivityState, frozenset[ActivityState]] = {
+        state: frozenset(targets) for state, targets in ORDERED_TRANSITIONS.items()
     }
 
+    # Valid transitions as (current, target) state value pairs, so a request
+    # is checked with a single membership test instead of enum construction
+    _ALLOWED_TRANSITION_VALUES: frozenset[tuple[str, str]] = frozenset(
+        (state.value, target.value)
+        for state, targets in TRANSITIONS.items()
+        for target in targets
+    )
+
     @classmethod
     def can_transition(cls, current_state: str, target_state: str) -> bool:
         """Check if transition from current state to target state is valid.
@@ -41,7 +58,7 @@ class ActivityStateMachine:
         try:
             current_enum = ActivityState(current_state)
             target_enum = ActivityState(target_state)
-            return target_enum in cls.TRANSITIONS.get(current_enum, [])
+            return target_enum in cls.TRANSITIONS.get(current_enum, frozenset())
         except ValueError:
             # Invalid state value
             return False
@@ -58,7 +75,9 @@ class ActivityStateMachine:
         """
         try:
             current_enum = ActivityState(current_state)
-            return [state.value for state in cls.TRANSITIONS.get(current_enum, [])]
+            return [
+                state.value for state in cls.ORDERED_TRANSITIONS.get(current_enum, ())
+            ]
         except ValueError:
             return []
 
@@ -69,6 +88,7 @@ class ActivityStateMachine:
         target_state: str,
         reason: Optional[str] = None,
         force: bool = False,
+        _batch: bool = False,
     ) -> bool:
         """Perform state transition on activity.
 
@@ -77,6 +97,8 @@ class ActivityStateMachine:
             target_state: Target state to transition to
             reason: Optional reason for the transition
             force: If True, skip validation (use with caution)
+            _batch: If True, log per-activity details at DEBUG instead of INFO
+                (used by sweeps that emit a single summary line)
 
         Returns:
             True if transition was successful, False otherwise
@@ -95,10 +117,14 @@ class ActivityStateMachine:
         activity.updated_at = datetime.utcnow()
 
         # Handle state-specific logic
-        cls._handle_state_transition(activity, old_state, target_state, reason)
+        cls._handle_state_transition(
+            activity, old_state, target_state, reason, _batch=_batch
+        )
 
+        log_level = logging.DEBUG if _batch else logging.INFO
         if reason:
-            logger.info(
+            logger.log(
+                log_level,
                 "Activity %s transitioned from %s to %s (reason: %s)",
                 activity.id,
                 old_state,
@@ -106,7 +132,8 @@ class ActivityStateMachine:
                 reason,
             )
         else:
-            logger.info(
+            logger.log(
+                log_level,
                 "Activity %s transitioned from %s to %s",
                 activity.id,
                 old_state,
@@ -117,7 +144,12 @@ class ActivityStateMachine:
 
     @classmethod
     def _handle_state_transition(
-        cls, activity: Any, old_state: str, new_state: str, reason: Optional[str]
+        cls,
+        activity: Any,
+        old_state: str,
+        new_state: str,
+        reason: Optional[str],
+        _batch: bool = False,
     ) -> None:
         """Handle state transition side effects.
 
@@ -126,6 +158,7 @@ class ActivityStateMachine:
             old_state: Previous state
             new_state: New state
             reason: Optional reason for transition
+            _batch: If True, suppress per-activity INFO logging
         """
         # Handle ACTIVE state logic
         if new_state == ActivityState.ACTIVE:
@@ -133,7 +166,7 @@ class ActivityStateMachine:
 
         # Handle EXPIRED state logic
         elif new_state == ActivityState.EXPIRED:
-            cls._handle_expiration(activity)
+            cls._handle_expiration(activity, _batch=_batch)
 
     @classmethod
     def _handle_activation(cls, activity: Any) -> None:
@@ -148,26 +181,73 @@ class ActivityStateMachine:
             activity.expires_at = datetime.utcnow() + timedelta(
                 seconds=duration_seconds
             )
-            logger.info(f"Activity {activity.id} will expire at {activity.expires_at}")
+            logger.info(
+                "Activity %s will expire at %s", activity.id, activity.expires_at
+            )
 
     @classmethod
-    def _handle_expiration(cls, activity: Any) -> None:
+    def _handle_expiration(cls, activity: Any, _batch: bool = False) -> None:
         """Handle activity expiration.
 
         Args:
             activity: Activity model instance
+            _batch: If True, log at DEBUG instead of INFO
         """
         # Mark expiration time if not already set
         if not activity.expires_at:
             activity.expires_at = datetime.utcnow()
-            logger.info(f"Activity {activity.id} expired at {activity.expires_at}")
+            logger.log(
+                logging.DEBUG if _batch else logging.INFO,
+                "Activity %s expired at %s",
+                activity.id,
+                activity.expires_at,
+            )
+
+    @classmethod
+    async def expire_due_activities(
+        cls, session: AsyncSession, now: Optional[datetime] = None
+    ) -> list[Row]:
+        """Expire all active activities whose expiration time has passed.
+
+        Performs the sweep as a single bulk UPDATE instead of loading and
+        transitioning each activity individually, mirroring the legacy status
+        the same way ``transition_activity_state`` does. The caller is
+        responsible for committing the session.
+
+        Args:
+            session: Database session to execute the update on
+            now: Reference time for the sweep (defaults to current UTC time)
+
+        Returns:
+            ``(id, session_id)`` rows of the activities that were expired
+        """
+        # Imported here so the framework can be loaded without a database
+        from app.db.models import Activity
+
+        now = now or datetime.utcnow()
+        result = await session.execute(
+            update(Activity)
+            .where(
+                Activity.state == ActivityState.ACTIVE,
+                Activity.expires_at <= now,
+            )
+            .values(
+                state=ActivityState.EXPIRED,
+                status=ActivityStatus.COMPLETED,
+                updated_at=now,
+            )
+            .returning(Activity.id, Activity.session_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.all()
 
     @classmethod
     def check_expired_activities(cls, activities: list[Any]) -> list[Any]:
         """Check for activities that should be automatically expired.
 
-        This method can be called periodically to automatically transition
-        activities that have reached their expiration time.
+        Deprecated: use ``ActivityService.check_and_expire_activities`` when a
+        database session is available. This per-object fallback is kept for callers that only
+        hold already-loaded activity instances.
 
         Args:
             activities: List of active activities to check
@@ -175,6 +255,12 @@ class ActivityStateMachine:
         Returns:
             List of activities that were transitioned to expired state
         """
+        warnings.warn(
+            "check_expired_activities is deprecated; "
+            "use ActivityService.check_and_expire_activities instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         expired_activities = []
         current_time = datetime.utcnow()
 
@@ -185,10 +271,14 @@ class ActivityStateMachine:
                 and current_time >= activity.expires_at
             ):
                 if cls.transition(
-                    activity, ActivityState.EXPIRED, "Automatic expiration"
+                    activity,
+                    ActivityState.EXPIRED,
+                    "Automatic expiration",
+                    _batch=True,
                 ):
                     expired_activities.append(activity)
 
+        logger.info("Expired %d activities", len(expired_activities))
         return expired_activities
 
     @classmethod
@@ -210,28 +300,26 @@ class ActivityStateMachine:
         Returns:
             Dictionary with validation results and error messages
         """
-        result = {
-            "valid": False,
-            "errors": [],
-            "warnings": [],
+        if (current_state, target_state) not in cls._ALLOWED_TRANSITION_VALUES:
+            return {
+                "valid": False,
+                "errors": [
+                    f"Invalid state transition: {current_state} -> {target_state}"
+                ],
+                "warnings": [],
+            }
+
+        if target_state != ActivityState.ACTIVE.value:
+            return {"valid": True, "errors": [], "warnings": []}
+
+        requirements = cls._validate_activation_requirements(activity_config)
+        errors = list(requirements.get("errors", []))
+        return {
+            "valid": not errors,
+            "errors": errors,
+            "warnings": list(requirements.get("warnings", [])),
         }
 
-        # Check basic state transition validity
-        if not cls.can_transition(current_state, target_state):
-            result["errors"].append(
-                f"Invalid state transition: {current_state} -> {target_state}"
-            )
-            return result
-
-        # Check state-specific requirements
-        if target_state == ActivityState.ACTIVE:
-            validation_result = cls._validate_activation_requirements(activity_config)
-            result["errors"].extend(validation_result.get("errors", []))
-            result["warnings"].extend(validation_result.get("warnings", []))
-
-        result["valid"] = len(result["errors"]) == 0
-        return result
-
     @classmethod
     def _validate_activation_requirements(
         cls, activity_config: dict[str, Any]
@@ -266,9 +354,11 @@ class ActivityStateMachine:
             "states": [state.value for state in ActivityState],
             "transitions": {
                 state.value: [target.value for target in targets]
-                for state, targets in cls.TRANSITIONS.items()
+                for state, targets in cls.ORDERED_TRANSITIONS.items()
             },
             "terminal_states": [
-                state.value for state, targets in cls.TRANSITIONS.items() if not targets
+                state.value
+                for state, targets in cls.ORDERED_TRANSITIONS.items()
+                if not targets
             ],
         }
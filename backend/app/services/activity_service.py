@@ -1,23 +1,288 @@
 """Service layer for Activity operations with framework integration."""
 
 import logging
+from datetime import datetime
+from collections.abc import Awaitable, Callable, Iterable
+from functools import cache
+from operator import attrgetter
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import (
+    JSON,
+    Row,
+    Select,
+    Update,
+    bindparam,
+    delete,
+    desc,
+    func,
+    literal_column,
+    select,
+    text,
+    true,
+    update,
+)
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.db.models import Activity as DBActivity, UserResponse
+from app.core.cache import TTLCache
+from app.core.events import activity_events
+from app.core.settings import settings
+from app.db.database import supports_concurrent_sessions
+from app.db.models import Activity as DBActivity, UserResponse, UUIDType
 from app.db.enums import ActivityStatus, ActivityState
 from app.models.jsonb_schemas.activity import Activity, ActivityCreate, ActivityUpdate
 from app.services.activity_framework import ActivityRegistry, ActivityStateMachine
+from app.services.activity_types.polling import PollingActivity
+from app.services.response_writer import response_writer
+
+__all__ = ["ActivityService"]
 
 logger = logging.getLogger(__name__)
 
 
+# Short-lived cache for the polling endpoints, keyed by
+# ("activity" | "status" | "framework" | "results", activity_id) or
+# ("active", session_id)
+_status_cache = TTLCache(ttl_seconds=settings.status_cache_ttl_seconds)
+
+
+def _invalidate_status_cache(*activity_ids: UUID) -> None:
+    """Drop cached lookups for activities that were just written."""
+    for activity_id in activity_ids:
+        _status_cache.delete(("activity", activity_id))
+        _status_cache.delete(("status", activity_id))
+        _status_cache.delete(("framework", activity_id))
+        _status_cache.delete(("results", activity_id))
+
+
+def _invalidate_active_activity(*session_ids: int) -> None:
+    """Drop the cached active activity for sessions whose activities changed."""
+    for session_id in session_ids:
+        _status_cache.delete(("active", session_id))
+
+
+async def _cached_status(
+    key: tuple[str, Any],
+    load: Callable[[], Awaitable[Optional[Any]]],
+) -> Optional[Any]:
+    """Serve polled status from the cache, loading it on a miss.
+
+    If the database fails while an expired entry is still around, the stale
+    entry is served instead of surfacing the error to every poller.
+    """
+    cached = _status_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        value = await load()
+    except SQLAlchemyError:
+        stale = _status_cache.get_stale(key)
+        if stale is None:
+            raise
+        logger.warning("Serving stale %s data for %s after a database error", *key)
+        return stale
+
+    if value is not None:
+        _status_cache.set(key, value)
+    return value
+
+
+def _notify_activity_change(event: str, *activity_ids: UUID, **data: Any) -> None:
+    """Invalidate cached status and push a change event to live subscribers."""
+    _invalidate_status_cache(*activity_ids)
+    for activity_id in activity_ids:
+        activity_events.publish(
+            activity_id, {"event": event, "activity_id": str(activity_id), **data}
+        )
+
+
+# Status filters built once per status. The status is rendered inline rather
+# than bound so Postgres can match partial indexes on it (e.g. the active
+# activity index) even when running a generic prepared plan
+_STATUS_CLAUSES = {
+    status: DBActivity.status == literal_column(f"'{status.value}'")
+    for status in ActivityStatus
+}
+
+# Hot lookups built once and executed with bound parameters
+_SELECT_ACTIVITY_BY_ID = select(DBActivity).where(
+    DBActivity.id == bindparam("activity_id")
+)
+_SELECT_ACTIVE_ACTIVITY = (
+    select(DBActivity)
+    .where(
+        DBActivity.session_id == bindparam("session_id"),
+        _STATUS_CLAUSES[ActivityStatus.ACTIVE],
+    )
+    .order_by(desc(DBActivity.updated_at))
+    .limit(1)
+)
+
+# Polling status in one round-trip: the response aggregates come from a
+# subquery joined onto the activity row (an aggregate always yields one row)
+_response_stats = (
+    select(
+        func.count(UserResponse.id).label("response_count"),
+        func.max(UserResponse.created_at).label("last_response_at"),
+    )
+    .where(UserResponse.activity_id == bindparam("activity_id"))
+    .subquery()
+)
+_SELECT_ACTIVITY_STATUS = (
+    select(
+        DBActivity.session_id,
+        DBActivity.status,
+        DBActivity.updated_at,
+        _response_stats.c.response_count,
+        _response_stats.c.last_response_at,
+    )
+    .join_from(DBActivity, _response_stats, true())
+    .where(DBActivity.id == bindparam("activity_id"))
+)
+
+_SELECT_ACTIVITY_WITH_RESPONSE_COUNT = (
+    select(DBActivity, _response_stats.c.response_count)
+    .join_from(DBActivity, _response_stats, true())
+    .where(DBActivity.id == bindparam("activity_id"))
+)
+
+# Votes per selected option, counted in the database so a poll's responses
+# come back as one row per option rather than one JSON blob per vote
+_VOTE_TALLY_SQL = {
+    "postgresql": """
+        SELECT opt AS option, count(*) AS votes
+        FROM user_responses,
+             jsonb_array_elements_text(response_data -> 'selected_options') AS opt
+        WHERE activity_id = :activity_id
+          AND jsonb_typeof(response_data -> 'selected_options') = 'array'
+        GROUP BY opt
+    """,
+    "sqlite": """
+        SELECT opt.value AS option, count(*) AS votes
+        FROM user_responses,
+             json_each(user_responses.response_data, '$.selected_options') AS opt
+        WHERE user_responses.activity_id = :activity_id
+          AND json_type(user_responses.response_data, '$.selected_options') = 'array'
+        GROUP BY opt.value
+    """,
+}
+_VOTE_TALLY = {
+    dialect: text(sql).bindparams(bindparam("activity_id", type_=UUIDType()))
+    for dialect, sql in _VOTE_TALLY_SQL.items()
+}
+# Response timestamps in the order calculate_results sees them: every
+# response that has the key (even when it is null), with its JSON value intact
+_RESPONSE_TIMESTAMPS_SQL = {
+    "postgresql": """
+        SELECT response_data -> 'timestamp' AS timestamp
+        FROM user_responses
+        WHERE activity_id = :activity_id
+          AND jsonb_typeof(response_data -> 'timestamp') IS NOT NULL
+        ORDER BY created_at, id
+    """,
+    "sqlite": """
+        SELECT json_quote(json_extract(response_data, '$.timestamp')) AS timestamp
+        FROM user_responses
+        WHERE activity_id = :activity_id
+          AND json_type(response_data, '$.timestamp') IS NOT NULL
+        ORDER BY created_at, id
+    """,
+}
+_RESPONSE_TIMESTAMPS = {
+    dialect: text(sql)
+    .bindparams(bindparam("activity_id", type_=UUIDType()))
+    .columns(timestamp=JSON)
+    for dialect, sql in _RESPONSE_TIMESTAMPS_SQL.items()
+}
+
+# Just the fields calculate_results reads, streamed in chunks so large
+# activities never hold every response as an ORM object in the session
+_STREAM_RESPONSE_DATA = (
+    select(UserResponse.response_data, UserResponse.created_at)
+    .where(UserResponse.activity_id == bindparam("activity_id"))
+    .order_by(UserResponse.created_at, UserResponse.id)
+    .execution_options(yield_per=500)
+)
+
+_ACTIVITY_FIELDS = tuple(Activity.model_fields)
+_get_activity_fields = attrgetter(*_ACTIVITY_FIELDS)
+# Only the columns the Activity schema exposes; list queries select these so
+# the framework JSONB blobs (configuration, activity_metadata) are not loaded
+_ACTIVITY_COLUMNS = tuple(getattr(DBActivity, name) for name in _ACTIVITY_FIELDS)
+# The same without the config JSONB, for list views that only render summaries
+_SUMMARY_FIELDS = tuple(name for name in _ACTIVITY_FIELDS if name != "config")
+_get_summary_fields = attrgetter(*_SUMMARY_FIELDS)
+_SUMMARY_COLUMNS = tuple(getattr(DBActivity, name) for name in _SUMMARY_FIELDS)
+
+
+@cache
+def _session_activities_query(
+    include_config: bool,
+    status: Optional[ActivityStatus],
+    with_total: bool,
+) -> Select:
+    """Build (once per variant) the paged session activity list query.
+
+    The statement takes ``session_id``, ``offset`` and ``limit`` as bound
+    parameters, so each variant is constructed a single time per process.
+    """
+    columns = _ACTIVITY_COLUMNS if include_config else _SUMMARY_COLUMNS
+    if with_total:
+        columns = (*columns, func.count().over().label("total"))
+    query = select(*columns).where(DBActivity.session_id == bindparam("session_id"))
+    if status:
+        query = query.where(_STATUS_CLAUSES[status])
+    return (
+        query.order_by(DBActivity.order_index)
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+
+
+def _activity_from_orm(
+    db_activity: DBActivity | Row, include_config: bool = True
+) -> Activity:
+    """Build an Activity schema from a database row without re-validating it.
+
+    Accepts either an ORM instance or a Core row selected from
+    ``_ACTIVITY_COLUMNS`` (or ``_SUMMARY_COLUMNS`` when ``include_config`` is
+    False, leaving config empty), since both expose the fields as attributes.
+
+    Validation is safe to skip here: the values come from our own columns, so
+    they already have the types the schema declares.
+    """
+    if include_config:
+        data = dict(
+            zip(_ACTIVITY_FIELDS, _get_activity_fields(db_activity), strict=True)
+        )
+    else:
+        data = dict(zip(_SUMMARY_FIELDS, _get_summary_fields(db_activity), strict=True))
+        data["config"] = {}
+    # Mirror use_enum_values=True on the schema
+    data["status"] = ActivityStatus(data["status"]).value
+    return Activity.model_construct(**data)
+
+
+def _activities_from_orm(
+    db_activities: Iterable[DBActivity | Row],
+    include_config: bool = True,
+) -> list[Activity]:
+    """Convert a batch of database rows for list endpoints."""
+    return [
+        _activity_from_orm(db_activity, include_config) for db_activity in db_activities
+    ]
+
+
 class ActivityService:
     """Service class for Activity operations with framework integration."""
 
+    # (registry version, activity type list) built by get_activity_types
+    _activity_types_cache: Optional[tuple[int, list[dict[str, Any]]]] = None
+
     @staticmethod
     async def create_activity(
         db: AsyncSession,
@@ -25,13 +290,6 @@ class ActivityService:
         activity_data: ActivityCreate,
     ) -> Activity:
         """Create a new activity."""
-        # First validate that the session exists
-        from app.services.session_service import SessionService
-
-        session = await SessionService.get_session(db, session_id)
-        if not session:
-            raise ValueError(f"Session with id {session_id} not found")
-
         db_activity = DBActivity(
             session_id=session_id,
             type=activity_data.type,
@@ -39,23 +297,56 @@ class ActivityService:
             order_index=activity_data.order_index,
             status=activity_data.status,
         )
-        db.add(db_activity)
-        await db.commit()
-        await db.refresh(db_activity)
+        await ActivityService._insert_activity(db, db_activity)
 
         # Convert DB model to JSONB schema model
-        return Activity.model_validate(db_activity)
+        return _activity_from_orm(db_activity)
+
+    @staticmethod
+    async def _insert_activity(db: AsyncSession, db_activity: DBActivity) -> None:
+        """Insert and commit a new activity row.
+
+        Session existence is enforced by the foreign key rather than a
+        separate lookup, saving a round-trip on every create.
+
+        Raises:
+            ValueError: If the referenced session does not exist
+        """
+        db.add(db_activity)
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            if "foreign key" in str(e.orig).lower():
+                raise ValueError(
+                    f"Session with id {db_activity.session_id} not found"
+                ) from e
+            raise
+        _invalidate_active_activity(db_activity.session_id)
 
     @staticmethod
     async def get_activity(
         db: AsyncSession,
         activity_id: UUID,
     ) -> Activity | None:
-        """Get a specific activity by ID."""
-        query = select(DBActivity).where(DBActivity.id == activity_id)
-        result = await db.execute(query)
+        """Get a specific activity by ID.
+
+        Results are cached briefly and dropped whenever the activity is written.
+        """
+        return await _cached_status(
+            ("activity", activity_id),
+            lambda: ActivityService._load_activity(db, activity_id),
+        )
+
+    @staticmethod
+    async def _load_activity(
+        db: AsyncSession,
+        activity_id: UUID,
+    ) -> Activity | None:
+        """Load an activity by ID from the database."""
+        result = await db.execute(_SELECT_ACTIVITY_BY_ID, {"activity_id": activity_id})
         db_activity = result.scalar_one_or_none()
-        return Activity.model_validate(db_activity) if db_activity else None
+        return _activity_from_orm(db_activity) if db_activity else None
 
     @staticmethod
     async def get_session_activities(
@@ -63,18 +354,18 @@ class ActivityService:
         session_id: int,
         offset: int = 0,
         limit: int = 100,
+        include_config: bool = True,
     ) -> list[Activity]:
-        """Get all activities for a session."""
-        query = (
-            select(DBActivity)
-            .where(DBActivity.session_id == session_id)
-            .order_by(DBActivity.order_index)
-            .offset(offset)
-            .limit(limit)
+        """Get all activities for a session.
+
+        Pass ``include_config=False`` to skip loading each activity's config
+        JSONB; the returned activities then have an empty config.
+        """
+        query = _session_activities_query(include_config, None, with_total=False)
+        result = await db.execute(
+            query, {"session_id": session_id, "offset": offset, "limit": limit}
         )
-        result = await db.execute(query)
-        db_activities = list(result.scalars().all())
-        return [Activity.model_validate(db_activity) for db_activity in db_activities]
+        return _activities_from_orm(result, include_config)
 
     @staticmethod
     async def get_session_activities_with_count(
@@ -83,31 +374,32 @@ class ActivityService:
         offset: int = 0,
         limit: int = 100,
         status: Optional[ActivityStatus] = None,
+        include_config: bool = True,
     ) -> tuple[list[Activity], int]:
-        """Get all activities for a session with total count."""
-        # Build base query conditions
-        conditions = [DBActivity.session_id == session_id]
-        if status:
-            conditions.append(DBActivity.status == status)
-
-        # Get total count
-        count_query = select(func.count(DBActivity.id)).where(*conditions)
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar()
-
-        # Get activities
-        query = (
-            select(DBActivity)
-            .where(*conditions)
-            .order_by(DBActivity.order_index)
-            .offset(offset)
-            .limit(limit)
+        """Get all activities for a session with total count.
+
+        Pass ``include_config=False`` to skip loading each activity's config
+        JSONB; the returned activities then have an empty config.
+        """
+        # Fetch the page and the total match count in one round-trip
+        query = _session_activities_query(include_config, status, with_total=True)
+        result = await db.execute(
+            query, {"session_id": session_id, "offset": offset, "limit": limit}
         )
-        result = await db.execute(query)
-        db_activities = list(result.scalars().all())
-        activities = [
-            Activity.model_validate(db_activity) for db_activity in db_activities
-        ]
+        rows = result.all()
+        activities = _activities_from_orm(rows, include_config)
+
+        if rows:
+            total_count = rows[0].total
+        elif offset:
+            # Past the last page the window has no rows to report the total on
+            conditions = [DBActivity.session_id == session_id]
+            if status:
+                conditions.append(_STATUS_CLAUSES[status])
+            count_query = select(func.count(DBActivity.id)).where(*conditions)
+            total_count = (await db.execute(count_query)).scalar()
+        else:
+            total_count = 0
 
         return activities, total_count
 
@@ -118,26 +410,23 @@ class ActivityService:
         activity_data: ActivityUpdate,
     ) -> Activity | None:
         """Update an existing activity."""
-        query = select(DBActivity).where(DBActivity.id == activity_id)
-        result = await db.execute(query)
-        db_activity = result.scalar_one_or_none()
-
-        if not db_activity:
-            return None
-
         # Update fields that are provided
-        if activity_data.type is not None:
-            db_activity.type = activity_data.type
-        if activity_data.config is not None:
-            db_activity.config = activity_data.config
-        if activity_data.order_index is not None:
-            db_activity.order_index = activity_data.order_index
-        if activity_data.status is not None:
-            db_activity.status = activity_data.status
+        values = {
+            field: value
+            for field, value in activity_data.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        if not values:
+            return await ActivityService.get_activity(db, activity_id)
 
-        await db.commit()
-        await db.refresh(db_activity)
-        return Activity.model_validate(db_activity)
+        query = (
+            update(DBActivity)
+            .where(DBActivity.id == activity_id)
+            .values(**values)
+            .returning(DBActivity)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        return await ActivityService._execute_activity_update(db, query)
 
     @staticmethod
     async def delete_activity(
@@ -145,15 +434,19 @@ class ActivityService:
         activity_id: UUID,
     ) -> bool:
         """Delete an activity."""
-        query = select(DBActivity).where(DBActivity.id == activity_id)
+        query = (
+            delete(DBActivity)
+            .where(DBActivity.id == activity_id)
+            .returning(DBActivity.session_id)
+            .execution_options(synchronize_session=False)
+        )
         result = await db.execute(query)
-        db_activity = result.scalar_one_or_none()
-
-        if not db_activity:
-            return False
-
-        await db.delete(db_activity)
+        session_id = result.scalar_one_or_none()
         await db.commit()
+        if session_id is None:
+            return False
+        _invalidate_active_activity(session_id)
+        _notify_activity_change("deleted", activity_id)
         return True
 
     @staticmethod
@@ -163,36 +456,54 @@ class ActivityService:
         status: ActivityStatus,
     ) -> Activity | None:
         """Update activity status."""
-        query = select(DBActivity).where(DBActivity.id == activity_id)
+        query = (
+            update(DBActivity)
+            .where(DBActivity.id == activity_id)
+            .values(status=status)
+            .returning(DBActivity)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        return await ActivityService._execute_activity_update(db, query)
+
+    @staticmethod
+    async def _execute_activity_update(
+        db: AsyncSession,
+        query: Update,
+    ) -> Activity | None:
+        """Run an UPDATE ... RETURNING statement and commit the result."""
         result = await db.execute(query)
         db_activity = result.scalar_one_or_none()
-
-        if not db_activity:
-            return None
-
-        db_activity.status = status
+        activity = _activity_from_orm(db_activity) if db_activity else None
         await db.commit()
-        await db.refresh(db_activity)
-        return Activity.model_validate(db_activity)
+        if activity:
+            _invalidate_active_activity(activity.session_id)
+            _notify_activity_change("updated", activity.id, status=activity.status)
+        return activity
 
     @staticmethod
     async def get_active_activity(
         db: AsyncSession,
         session_id: int,
     ) -> Activity | None:
-        """Get the currently active activity for a session."""
-        query = (
-            select(DBActivity)
-            .where(
-                DBActivity.session_id == session_id,
-                DBActivity.status == ActivityStatus.ACTIVE,
-            )
-            .order_by(desc(DBActivity.updated_at))
-            .limit(1)
+        """Get the currently active activity for a session.
+
+        Viewers poll this on every refresh, so the result is cached briefly
+        and dropped whenever an activity in the session is written.
+        """
+        return await _cached_status(
+            ("active", session_id),
+            lambda: ActivityService._load_active_activity(db, session_id),
         )
-        result = await db.execute(query)
+
+    @staticmethod
+    async def _load_active_activity(
+        db: AsyncSession,
+        session_id: int,
+    ) -> Activity | None:
+        """Load the most recently updated active activity for a session."""
+        result = await db.execute(_SELECT_ACTIVE_ACTIVITY, {"session_id": session_id})
         db_activity = result.scalar_one_or_none()
-        return Activity.model_validate(db_activity) if db_activity else None
+        return _activity_from_orm(db_activity) if db_activity else None
 
     @staticmethod
     async def get_activity_status(
@@ -200,32 +511,36 @@ class ActivityService:
         session_id: int,
         activity_id: UUID,
     ) -> dict[str, Any]:
-        """Get activity status information for polling."""
-        # Get the activity
-        activity = await ActivityService.get_activity(db, activity_id)
-        if not activity or activity.session_id != session_id:
-            return None
+        """Get activity status information for polling.
 
-        # Count responses for this activity
-        response_count_query = select(func.count(UserResponse.id)).where(
-            UserResponse.activity_id == activity_id
+        Results are cached briefly so concurrent pollers share one lookup.
+        """
+        cached = await _cached_status(
+            ("status", activity_id),
+            lambda: ActivityService._load_activity_status(db, activity_id),
         )
-        response_count_result = await db.execute(response_count_query)
-        response_count = response_count_result.scalar() or 0
+        if cached is None:
+            return None
+        owner_session_id, status_data = cached
+        return status_data if owner_session_id == session_id else None
 
-        # Get last response time
-        last_response_query = select(func.max(UserResponse.created_at)).where(
-            UserResponse.activity_id == activity_id
-        )
-        last_response_result = await db.execute(last_response_query)
-        last_response_at = last_response_result.scalar()
+    @staticmethod
+    async def _load_activity_status(
+        db: AsyncSession,
+        activity_id: UUID,
+    ) -> Optional[tuple[int, dict[str, Any]]]:
+        """Load polling status for an activity along with its session id."""
+        result = await db.execute(_SELECT_ACTIVITY_STATUS, {"activity_id": activity_id})
+        row = result.one_or_none()
+        if row is None:
+            return None
 
-        return {
+        return row.session_id, {
             "activity_id": activity_id,
-            "status": activity.status,
-            "response_count": response_count,
-            "last_response_at": last_response_at,
-            "last_updated": activity.updated_at,
+            "status": row.status,
+            "response_count": row.response_count,
+            "last_response_at": row.last_response_at,
+            "last_updated": row.updated_at,
         }
 
     # ===== Framework-Enhanced Methods =====
@@ -263,24 +578,13 @@ class ActivityService:
         if not ActivityRegistry.is_registered(activity_type):
             raise ValueError(f"Unknown activity type: {activity_type}")
 
-        # Get activity class and validate configuration
+        # Validate configuration
         configuration = configuration or {}
-        activity_instance = ActivityRegistry.create_activity(
-            activity_type, None, configuration
-        )
-
-        if not activity_instance.validate_config(configuration):
+        if not ActivityRegistry.validate_config_static(activity_type, configuration):
             raise ValueError("Invalid activity configuration")
 
-        # First validate that the session exists
-        from app.services.session_service import SessionService
-
-        session = await SessionService.get_session(db, session_id)
-        if not session:
-            raise ValueError(f"Session with id {session_id} not found")
-
         # Merge default metadata with provided metadata
-        default_metadata = activity_instance.get_default_metadata()
+        default_metadata = ActivityRegistry.get_default_metadata(activity_type)
         final_metadata = {**default_metadata, **(activity_metadata or {})}
 
         # Create database record
@@ -297,12 +601,10 @@ class ActivityService:
             state=ActivityState.DRAFT,  # New framework field
         )
 
-        db.add(db_activity)
-        await db.commit()
-        await db.refresh(db_activity)
+        await ActivityService._insert_activity(db, db_activity)
 
         logger.info("Created activity %s of type %s", db_activity.id, activity_type)
-        return Activity.model_validate(db_activity)
+        return _activity_from_orm(db_activity)
 
     @staticmethod
     async def transition_activity_state(
@@ -327,8 +629,7 @@ class ActivityService:
         Raises:
             ValueError: If activity not found or transition is invalid
         """
-        query = select(DBActivity).where(DBActivity.id == activity_id)
-        result = await db.execute(query)
+        result = await db.execute(_SELECT_ACTIVITY_BY_ID, {"activity_id": activity_id})
         db_activity = result.scalar_one_or_none()
 
         if not db_activity:
@@ -353,19 +654,30 @@ class ActivityService:
             db_activity.status = ActivityStatus.COMPLETED
 
         await db.commit()
-        await db.refresh(db_activity)
+        _invalidate_active_activity(db_activity.session_id)
+        _notify_activity_change(
+            "state_changed",
+            activity_id,
+            state=db_activity.state,
+            status=db_activity.status,
+        )
 
         logger.info("Activity %s transitioned to %s", activity_id, target_state)
-        return Activity.model_validate(db_activity)
+        return _activity_from_orm(db_activity)
 
     @staticmethod
-    async def get_activity_types() -> list[dict[str, Any]]:
+    def get_activity_types() -> list[dict[str, Any]]:
         """Get all available activity types.
 
         Returns:
             List of activity type metadata
         """
-        return [
+        version = ActivityRegistry.get_version()
+        cached = ActivityService._activity_types_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        activity_types = [
             {
                 "id": activity_type,
                 "name": metadata["name"],
@@ -374,9 +686,11 @@ class ActivityService:
             }
             for activity_type, metadata in ActivityRegistry.get_all_types().items()
         ]
+        ActivityService._activity_types_cache = (version, activity_types)
+        return activity_types
 
     @staticmethod
-    async def get_activity_type_schema(activity_type: str) -> dict[str, Any]:
+    def get_activity_type_schema(activity_type: str) -> dict[str, Any]:
         """Get JSON schema for activity type.
 
         Args:
@@ -391,7 +705,7 @@ class ActivityService:
         return ActivityRegistry.get_schema(activity_type)
 
     @staticmethod
-    async def validate_activity_config(
+    def validate_activity_config(
         activity_type: str,
         configuration: dict[str, Any],
     ) -> dict[str, Any]:
@@ -405,10 +719,9 @@ class ActivityService:
             Validation result with success status and errors
         """
         try:
-            activity_instance = ActivityRegistry.create_activity(
-                activity_type, None, configuration
+            is_valid = ActivityRegistry.validate_config_static(
+                activity_type, configuration
             )
-            is_valid = activity_instance.validate_config(configuration)
 
             return {
                 "valid": is_valid,
@@ -442,8 +755,7 @@ class ActivityService:
             ValueError: If activity not found, not active, or response is invalid
         """
         # Get the activity
-        query = select(DBActivity).where(DBActivity.id == activity_id)
-        result = await db.execute(query)
+        result = await db.execute(_SELECT_ACTIVITY_BY_ID, {"activity_id": activity_id})
         db_activity = result.scalar_one_or_none()
 
         if not db_activity:
@@ -467,16 +779,17 @@ class ActivityService:
         except Exception as e:
             raise ValueError(f"Response processing failed: {str(e)}") from e
 
-        # Store the response (use existing UserResponse storage)
-        from app.services.user_response_service import UserResponseService
-
-        await UserResponseService.create_user_response(
-            db=db,
+        # Store the response; concurrent submissions for the same activity
+        # are coalesced into batched INSERTs when the pool allows it
+        await response_writer.write(
+            db,
             session_id=db_activity.session_id,
             activity_id=activity_id,
             participant_id=participant_id,
             response_data=processed_response,
+            batched=supports_concurrent_sessions(db),
         )
+        _notify_activity_change("response_received", activity_id)
 
         logger.info(
             "Processed response for activity %s from participant %s",
@@ -498,34 +811,98 @@ class ActivityService:
 
         Returns:
             Calculated activity results
+
+        Raises:
+            ValueError: If activity not found
         """
-        # Get the activity
-        query = select(DBActivity).where(DBActivity.id == activity_id)
-        result = await db.execute(query)
-        db_activity = result.scalar_one_or_none()
+        # Get the activity with its current response count
+        result = await db.execute(
+            _SELECT_ACTIVITY_WITH_RESPONSE_COUNT, {"activity_id": activity_id}
+        )
+        row = result.one_or_none()
 
-        if not db_activity:
+        if not row:
             raise ValueError(f"Activity with id {activity_id} not found")
+        db_activity, response_count = row
 
-        # Get all responses for this activity
-        responses_query = select(UserResponse).where(
-            UserResponse.activity_id == activity_id
+        # Reuse the last tally while no response has arrived and the activity
+        # is unchanged; writes also drop it, and the TTL bounds staleness
+        key = ("results", activity_id)
+        fingerprint = (response_count, db_activity.updated_at)
+        cached = _status_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        activity_instance = ActivityRegistry.create_activity(
+            db_activity.type, db_activity.id, db_activity.configuration
         )
-        responses_result = await db.execute(responses_query)
-        responses = responses_result.scalars().all()
+        if not response_count:
+            # Nothing to aggregate, so skip the response queries entirely
+            results = activity_instance.calculate_results([])
+        elif (
+            isinstance(activity_instance, PollingActivity)
+            and db.bind.dialect.name in _VOTE_TALLY
+        ):
+            # Polls only need per-option counts, so aggregate in the database
+            tally = await ActivityService.get_vote_tally(db, activity_id)
+            timestamps = await db.scalars(
+                _RESPONSE_TIMESTAMPS[db.bind.dialect.name],
+                {"activity_id": activity_id},
+            )
+            results = activity_instance.results_from_tally(
+                tally, response_count, list(timestamps)
+            )
+        else:
+            rows = await db.stream(_STREAM_RESPONSE_DATA, {"activity_id": activity_id})
+            response_data = [
+                {"response_data": row.response_data, "created_at": row.created_at}
+                async for row in rows
+            ]
+            results = activity_instance.calculate_results(response_data)
+
+        _status_cache.set(key, (fingerprint, results))
+        return results
+
+    @staticmethod
+    async def get_vote_tally(
+        db: AsyncSession,
+        activity_id: UUID,
+    ) -> dict[str, int]:
+        """Count votes per selected option for a poll in the database.
 
-        # Create activity instance and calculate results
+        Args:
+            db: Database session
+            activity_id: ID of the poll activity
+
+        Returns:
+            Mapping of selected option to number of votes
+
+        Raises:
+            ValueError: If the database dialect has no tally query
+        """
+        query = _VOTE_TALLY.get(db.bind.dialect.name)
+        if query is None:
+            raise ValueError(
+                f"Vote tally is not supported on {db.bind.dialect.name} databases"
+            )
+        result = await db.execute(query, {"activity_id": activity_id})
+        return {row.option: row.votes for row in result}
+
+    @staticmethod
+    def _calculate_results(
+        db_activity: DBActivity,
+        responses: Iterable[UserResponse],
+    ) -> dict[str, Any]:
+        """Calculate results for an activity from already loaded responses."""
         activity_instance = ActivityRegistry.create_activity(
-            db_activity.type, activity_id, db_activity.configuration
+            db_activity.type, db_activity.id, db_activity.configuration
         )
 
         response_data = [
             {"response_data": r.response_data, "created_at": r.created_at}
             for r in responses
         ]
-        results = activity_instance.calculate_results(response_data)
-
-        return results
+        return activity_instance.calculate_results(response_data)
 
     @staticmethod
     async def check_and_expire_activities(db: AsyncSession) -> list[UUID]:
@@ -540,21 +917,21 @@ class ActivityService:
         Returns:
             List of activity IDs that were expired
         """
-        # Get all active activities with expiration times
-        query = select(DBActivity).where(
-            DBActivity.state == ActivityState.ACTIVE,
-            DBActivity.expires_at.isnot(None),
-        )
-        result = await db.execute(query)
-        activities = result.scalars().all()
-
-        expired_activities = ActivityStateMachine.check_expired_activities(activities)
+        expired = await ActivityStateMachine.expire_due_activities(db)
+        expired_ids = [row.id for row in expired]
 
-        if expired_activities:
+        if expired_ids:
             await db.commit()
-            logger.info(f"Auto-expired {len(expired_activities)} activities")
+            _invalidate_active_activity(*{row.session_id for row in expired})
+            _notify_activity_change(
+                "state_changed",
+                *expired_ids,
+                state=ActivityState.EXPIRED,
+                status=ActivityStatus.COMPLETED,
+            )
+            logger.info("Auto-expired %d activities", len(expired_ids))
 
-        return [activity.id for activity in expired_activities]
+        return expired_ids
 
     @staticmethod
     async def get_framework_activity_status(
@@ -570,27 +947,37 @@ class ActivityService:
         Returns:
             Enhanced activity status information
         """
-        # Get basic status using existing method
-        basic_status = await ActivityService.get_activity_status(
-            db,
-            None,
-            activity_id,  # session_id not needed for this query
+        return await _cached_status(
+            ("framework", activity_id),
+            lambda: ActivityService._load_framework_activity_status(db, activity_id),
         )
 
-        if not basic_status:
-            return None
-
-        # Get the activity for enhanced information
-        query = select(DBActivity).where(DBActivity.id == activity_id)
+    @staticmethod
+    async def _load_framework_activity_status(
+        db: AsyncSession,
+        activity_id: UUID,
+    ) -> Optional[dict[str, Any]]:
+        """Load framework status, counts and results for an activity."""
+        # Load the activity together with its responses so status, counts
+        # and results are all derived from a single fetch
+        query = (
+            select(DBActivity)
+            .options(selectinload(DBActivity.user_responses))
+            .where(DBActivity.id == activity_id)
+        )
         result = await db.execute(query)
         db_activity = result.scalar_one_or_none()
 
         if not db_activity:
             return None
 
-        # Add framework-specific status information
+        responses = db_activity.user_responses
         enhanced_status = {
-            **basic_status,
+            "activity_id": activity_id,
+            "status": db_activity.status,
+            "response_count": len(responses),
+            "last_response_at": max((r.created_at for r in responses), default=None),
+            "last_updated": db_activity.updated_at,
             "state": db_activity.state,
             "expires_at": db_activity.expires_at,
             "activity_metadata": db_activity.activity_metadata,
@@ -601,8 +988,9 @@ class ActivityService:
 
         # Add calculated results if available
         try:
-            results = await ActivityService.get_activity_results(db, activity_id)
-            enhanced_status["results"] = results
+            enhanced_status["results"] = ActivityService._calculate_results(
+                db_activity, responses
+            )
         except Exception as e:
             logger.warning(
                 "Could not calculate results for activity %s: %s", activity_id, e
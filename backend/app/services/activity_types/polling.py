@@ -3,15 +3,53 @@
 Polling/Survey activity that allows participants to vote on multiple choice questions.
 """
 
-from typing import Any
+from collections import Counter
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
+from uuid import UUID
 from datetime import datetime
 import logging
 
 from app.services.activity_framework.base import BaseActivity
+from app.services.activity_framework.config_checks import (
+    ConfigCheck,
+    compile_config_checker,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_options_check(schema: dict[str, Any]) -> ConfigCheck:
+    """Build the poll options check from the configuration schema.
+
+    Args:
+        schema: Polling configuration JSON schema
+
+    Returns:
+        Check returning an error message for invalid options, else None
+    """
+    options_schema = schema["properties"]["options"]
+    min_options = options_schema["minItems"]
+    max_options = options_schema["maxItems"]
+    option_max = options_schema["items"]["maxLength"]
+
+    def check_options(config: dict[str, Any]) -> Optional[str]:
+        options = config["options"]
+        if not isinstance(options, list):
+            return "options must be a list"
+        if not min_options <= len(options) <= max_options:
+            return f"must have between {min_options} and {max_options} options"
+        for i, option in enumerate(options):
+            if not isinstance(option, str) or not option.strip():
+                return f"option {i} must be a non-empty string"
+            if len(option) > option_max:
+                return f"option {i} exceeds maximum length of {option_max} characters"
+        return None
+
+    return check_options
+
+
 class PollingActivity(BaseActivity):
     """Polling/Survey activity implementation.
 
@@ -56,6 +94,33 @@ class PollingActivity(BaseActivity):
         "additionalProperties": False,
     }
 
+    _DEFAULT_METADATA = MappingProxyType(
+        {
+            "duration_seconds": 300,  # 5 minutes default
+            "max_responses": None,  # No limit by default
+            "allow_multiple_responses": False,  # One response per participant
+            "show_live_results": True,
+            "activity_type": "poll",
+            "requires_moderation": False,
+        }
+    )
+
+    _check_config = staticmethod(
+        compile_config_checker(SCHEMA, _compile_options_check(SCHEMA))
+    )
+
+    def __init__(self, activity_id: Optional[UUID], config: dict[str, Any]):
+        """Initialize the poll and precompute per-response lookups.
+
+        Args:
+            activity_id: The UUID of the activity instance (None for new activities)
+            config: The configuration dictionary for this activity
+        """
+        super().__init__(activity_id, config)
+        self._valid_options = frozenset(config.get("options", ()))
+        self._allow_multiple = config.get("allow_multiple_choice", False)
+        self._anonymous = config.get("anonymous_voting", True)
+
     def validate_config(self, config: dict[str, Any]) -> bool:
         """Validate polling configuration.
 
@@ -65,69 +130,11 @@ class PollingActivity(BaseActivity):
         Returns:
             True if configuration is valid, False otherwise
         """
-        try:
-            # Check required fields
-            if "question" not in config:
-                logger.warning("Polling config missing 'question' field")
-                return False
-
-            if "options" not in config:
-                logger.warning("Polling config missing 'options' field")
-                return False
-
-            # Validate question
-            question = config["question"]
-            if not isinstance(question, str) or len(question.strip()) == 0:
-                logger.warning("Polling question must be a non-empty string")
-                return False
-
-            if len(question) > 500:
-                logger.warning(
-                    "Polling question exceeds maximum length of 500 characters"
-                )
-                return False
-
-            # Validate options
-            options = config["options"]
-            if not isinstance(options, list):
-                logger.warning("Polling options must be a list")
-                return False
-
-            if len(options) < 2:
-                logger.warning("Polling must have at least 2 options")
-                return False
-
-            if len(options) > 10:
-                logger.warning("Polling cannot have more than 10 options")
-                return False
-
-            # Validate each option
-            for i, option in enumerate(options):
-                if not isinstance(option, str) or len(option.strip()) == 0:
-                    logger.warning(f"Polling option {i} must be a non-empty string")
-                    return False
-
-                if len(option) > 200:
-                    logger.warning(
-                        f"Polling option {i} exceeds maximum length of 200 characters"
-                    )
-                    return False
-
-            # Validate optional boolean fields
-            bool_fields = [
-                "allow_multiple_choice",
-                "show_live_results",
-                "anonymous_voting",
-            ]
-            for field in bool_fields:
-                if field in config and not isinstance(config[field], bool):
-                    logger.warning(f"Polling config field '{field}' must be boolean")
-                    return False
-
-            return True
-        except Exception as e:
-            logger.error(f"Error validating polling config: {e}")
+        error = self._check_config(config)
+        if error is not None:
+            logger.warning(f"Invalid polling config: {error}")
             return False
+        return True
 
     def get_schema(self) -> dict[str, Any]:
         """Return JSON schema for polling configuration.
@@ -161,18 +168,20 @@ class PollingActivity(BaseActivity):
                 raise ValueError("Response must contain 'selected_options' as a list")
 
             # Validate selected options against configuration
-            valid_options = self.config.get("options", [])
-            if not valid_options:
+            if not self._valid_options:
                 raise ValueError("Activity configuration has no valid options")
 
             # Check that all selected options are valid
-            for option in selected_options:
-                if option not in valid_options:
-                    raise ValueError(f"Invalid option selected: '{option}'")
+            if not self._valid_options.issuperset(selected_options):
+                invalid = next(
+                    option
+                    for option in selected_options
+                    if option not in self._valid_options
+                )
+                raise ValueError(f"Invalid option selected: '{invalid}'")
 
             # Check multiple choice rules
-            allow_multiple = self.config.get("allow_multiple_choice", False)
-            if not allow_multiple and len(selected_options) > 1:
+            if not self._allow_multiple and len(selected_options) > 1:
                 raise ValueError("Multiple choices not allowed for this poll")
 
             # Validate at least one option selected
@@ -185,11 +194,11 @@ class PollingActivity(BaseActivity):
                 "participant_id": participant_id,
                 "selected_options": selected_options,
                 "timestamp": datetime.utcnow().isoformat(),
-                "anonymous": self.config.get("anonymous_voting", True),
+                "anonymous": self._anonymous,
             }
 
             # Add participant info if not anonymous
-            if not self.config.get("anonymous_voting", True):
+            if not self._anonymous:
                 processed_response["participant_info"] = {
                     "id": participant_id,
                     # Additional participant info could be added here
@@ -211,58 +220,24 @@ class PollingActivity(BaseActivity):
             Dictionary containing calculated results with vote counts
         """
         try:
-            # Initialize vote counts for all options
-            options = self.config.get("options", [])
-            vote_counts = {option: 0 for option in options}
+            valid_options = self._valid_options
 
-            # Count votes from responses
-            total_responses = 0
+            # Tally all selections in one pass; Counter counts in C
+            tally = Counter()
             response_timestamps = []
-
             for response in responses:
-                response_data = response.get("response_data", {})
-                selected_options = response_data.get("selected_options", [])
-
-                # Count votes for each selected option
-                for option in selected_options:
-                    if option in vote_counts:
-                        vote_counts[option] += 1
-
-                total_responses += 1
+                response_data = response.get("response_data") or {}
+                tally.update(
+                    option
+                    for option in response_data.get("selected_options") or ()
+                    if option in valid_options
+                )
 
                 # Track response timing
                 if "timestamp" in response_data:
                     response_timestamps.append(response_data["timestamp"])
 
-            # Calculate percentages
-            percentages = {}
-            if total_responses > 0:
-                for option, count in vote_counts.items():
-                    percentages[option] = round((count / total_responses) * 100, 1)
-            else:
-                percentages = {option: 0.0 for option in options}
-
-            # Find most popular option(s)
-            max_votes = max(vote_counts.values()) if vote_counts.values() else 0
-            most_popular = [
-                option for option, count in vote_counts.items() if count == max_votes
-            ]
-
-            return {
-                "type": "poll_results",
-                "question": self.config.get("question", ""),
-                "options": options,
-                "vote_counts": vote_counts,
-                "percentages": percentages,
-                "total_responses": total_responses,
-                "most_popular": most_popular,
-                "allow_multiple_choice": self.config.get(
-                    "allow_multiple_choice", False
-                ),
-                "show_live_results": self.config.get("show_live_results", True),
-                "last_updated": datetime.utcnow().isoformat(),
-                "response_timestamps": response_timestamps,
-            }
+            return self.results_from_tally(tally, len(responses), response_timestamps)
 
         except Exception as e:
             logger.error(f"Error calculating polling results: {e}")
@@ -273,21 +248,62 @@ class PollingActivity(BaseActivity):
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
-    def get_default_metadata(self) -> dict[str, Any]:
-        """Get default metadata for polling activities.
+    def results_from_tally(
+        self,
+        vote_tally: Mapping[str, int],
+        total_responses: int,
+        response_timestamps: list[Any],
+    ) -> dict[str, Any]:
+        """Build polling results from per-option vote counts.
+
+        Lets callers that aggregate votes elsewhere (e.g. in the database)
+        produce the same result shape as ``calculate_results``.
+
+        Args:
+            vote_tally: Votes per option; options not in the config are ignored
+            total_responses: Number of responses received
+            response_timestamps: Timestamps recorded on the responses
 
         Returns:
-            Dictionary of default metadata values
+            Dictionary containing calculated results with vote counts
         """
+        options = self.config.get("options", [])
+        vote_counts = {option: vote_tally.get(option, 0) for option in options}
+
+        # Calculate percentages
+        scale = 100 / total_responses if total_responses else 0.0
+        percentages = {
+            option: round(count * scale, 1) for option, count in vote_counts.items()
+        }
+
+        # Find most popular option(s)
+        max_votes = max(vote_counts.values()) if vote_counts.values() else 0
+        most_popular = [
+            option for option, count in vote_counts.items() if count == max_votes
+        ]
+
         return {
-            "duration_seconds": 300,  # 5 minutes default
-            "max_responses": None,  # No limit by default
-            "allow_multiple_responses": False,  # One response per participant
-            "show_live_results": True,
-            "activity_type": "poll",
-            "requires_moderation": False,
+            "type": "poll_results",
+            "question": self.config.get("question", ""),
+            "options": options,
+            "vote_counts": vote_counts,
+            "percentages": percentages,
+            "total_responses": total_responses,
+            "most_popular": most_popular,
+            "allow_multiple_choice": self.config.get("allow_multiple_choice", False),
+            "show_live_results": self.config.get("show_live_results", True),
+            "last_updated": datetime.utcnow().isoformat(),
+            "response_timestamps": response_timestamps,
         }
 
+    def get_default_metadata(self) -> Mapping[str, Any]:
+        """Get default metadata for polling activities.
+
+        Returns:
+            Read-only mapping of default metadata values
+        """
+        return self._DEFAULT_METADATA
+
     def can_transition_to(self, current_state: str, target_state: str) -> bool:
         """Check if polling activity can transition to target state.
 
@@ -3,14 +3,24 @@
 Q&A activity that allows participants to submit questions and vote on them.
 """
 
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
+from uuid import UUID
 from datetime import datetime
 import logging
+from collections import defaultdict
+from itertools import count
+from operator import itemgetter
 
 from app.services.activity_framework.base import BaseActivity
+from app.services.activity_framework.config_checks import compile_config_checker
 
 logger = logging.getLogger(__name__)
 
+# Per-process sequence that keeps question IDs unique within a millisecond
+_question_sequence = count()
+
 
 class QnaActivity(BaseActivity):
     """Q&A activity implementation.
@@ -66,6 +76,33 @@ class QnaActivity(BaseActivity):
         "additionalProperties": False,
     }
 
+    _DEFAULT_METADATA = MappingProxyType(
+        {
+            "duration_seconds": 900,  # 15 minutes default
+            "max_responses": None,  # No limit by default
+            "allow_multiple_responses": True,  # Can submit questions and votes
+            "show_live_results": True,
+            "activity_type": "qna",
+            "requires_moderation": True,  # Q&A often needs moderation
+        }
+    )
+
+    _check_config = staticmethod(compile_config_checker(SCHEMA))
+
+    def __init__(self, activity_id: Optional[UUID], config: dict[str, Any]):
+        """Initialize the Q&A and precompute per-submission settings.
+
+        Args:
+            activity_id: The UUID of the activity instance (None for new activities)
+            config: The configuration dictionary for this activity
+        """
+        super().__init__(activity_id, config)
+        self._max_question_length = config.get("max_question_length", 500)
+        self._allow_anonymous = config.get("allow_anonymous", True)
+        self._enable_voting = config.get("enable_voting", True)
+        self._moderate_questions = config.get("moderate_questions", False)
+        self._question_status = "pending" if self._moderate_questions else "approved"
+
     def validate_config(self, config: dict[str, Any]) -> bool:
         """Validate Q&A configuration.
 
@@ -75,52 +112,11 @@ class QnaActivity(BaseActivity):
         Returns:
             True if configuration is valid, False otherwise
         """
-        try:
-            # Check required fields
-            if "topic" not in config:
-                logger.warning("Q&A config missing 'topic' field")
-                return False
-
-            # Validate topic
-            topic = config["topic"]
-            if not isinstance(topic, str) or len(topic.strip()) == 0:
-                logger.warning("Q&A topic must be a non-empty string")
-                return False
-
-            if len(topic) > 200:
-                logger.warning("Q&A topic exceeds maximum length of 200 characters")
-                return False
-
-            # Validate optional boolean fields
-            bool_fields = [
-                "allow_anonymous",
-                "enable_voting",
-                "moderate_questions",
-                "allow_multiple_votes",
-                "show_vote_counts",
-            ]
-            for field in bool_fields:
-                if field in config and not isinstance(config[field], bool):
-                    logger.warning(f"Q&A config field '{field}' must be boolean")
-                    return False
-
-            # Validate max_question_length
-            if "max_question_length" in config:
-                max_length = config["max_question_length"]
-                if (
-                    not isinstance(max_length, int)
-                    or max_length < 10
-                    or max_length > 1000
-                ):
-                    logger.warning(
-                        "Q&A max_question_length must be integer between 10 and 1000"
-                    )
-                    return False
-
-            return True
-        except Exception as e:
-            logger.error(f"Error validating Q&A config: {e}")
+        error = self._check_config(config)
+        if error is not None:
+            logger.warning(f"Invalid Q&A config: {error}")
             return False
+        return True
 
     def get_schema(self) -> dict[str, Any]:
         """Return JSON schema for Q&A configuration.
@@ -179,21 +175,24 @@ class QnaActivity(BaseActivity):
         if not question_text:
             raise ValueError("Question text cannot be empty")
 
-        max_length = self.config.get("max_question_length", 500)
-        if len(question_text) > max_length:
+        if len(question_text) > self._max_question_length:
             raise ValueError(
-                f"Question exceeds maximum length of {max_length} characters"
+                "Question exceeds maximum length of "
+                f"{self._max_question_length} characters"
             )
 
         # Check if anonymous submissions are allowed
-        is_anonymous = response_data.get(
-            "anonymous", self.config.get("allow_anonymous", True)
-        )
-        if is_anonymous and not self.config.get("allow_anonymous", True):
+        is_anonymous = response_data.get("anonymous", self._allow_anonymous)
+        if is_anonymous and not self._allow_anonymous:
             raise ValueError("Anonymous question submissions are not allowed")
 
-        # Generate unique question ID (timestamp-based for now)
-        question_id = f"q_{int(datetime.utcnow().timestamp() * 1000)}_{participant_id}"
+        # Generate unique question ID (timestamp-based for now), reading the
+        # clock once so the ID and timestamp agree
+        now = datetime.utcnow()
+        question_id = (
+            f"q_{int(now.timestamp() * 1000)}_{participant_id}"
+            f"_{next(_question_sequence)}"
+        )
 
         processed_response = {
             "type": "question",
@@ -201,10 +200,8 @@ class QnaActivity(BaseActivity):
             "participant_id": participant_id,
             "question_text": question_text,
             "anonymous": is_anonymous,
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": "pending"
-            if self.config.get("moderate_questions", False)
-            else "approved",
+            "timestamp": now.isoformat(),
+            "status": self._question_status,
             "vote_count": 0,
             "voters": [],
         }
@@ -228,7 +225,7 @@ class QnaActivity(BaseActivity):
             raise ValueError("Vote must specify question_id")
 
         # Check if voting is enabled
-        if not self.config.get("enable_voting", True):
+        if not self._enable_voting:
             raise ValueError("Voting is not enabled for this Q&A session")
 
         processed_response = {
@@ -251,7 +248,11 @@ class QnaActivity(BaseActivity):
         """
         try:
             questions = {}
-            votes = {}
+            # Voters per question; a set dedupes repeat votes on the way in
+            # unless every vote counts
+            allow_multiple_votes = self.config.get("allow_multiple_votes", False)
+            votes = defaultdict(list if allow_multiple_votes else set)
+            total_votes = 0
 
             # Process all responses to build questions and votes
             for response in responses:
@@ -276,61 +277,46 @@ class QnaActivity(BaseActivity):
                     question_id = response_data.get("question_id")
                     participant_id = response_data.get("participant_id")
                     if question_id and participant_id:
-                        if question_id not in votes:
-                            votes[question_id] = []
-                        votes[question_id].append(
-                            {
-                                "participant_id": participant_id,
-                                "timestamp": response_data.get("timestamp"),
-                            }
-                        )
+                        if allow_multiple_votes:
+                            votes[question_id].append(participant_id)
+                        else:
+                            votes[question_id].add(participant_id)
+                        total_votes += 1
 
             # Apply votes to questions
-            for question_id, question_votes in votes.items():
+            for question_id, voters in votes.items():
                 if question_id in questions:
-                    # Handle multiple votes logic
-                    if self.config.get("allow_multiple_votes", False):
-                        # Count all votes
-                        questions[question_id]["vote_count"] = len(question_votes)
-                        questions[question_id]["voters"] = [
-                            v["participant_id"] for v in question_votes
-                        ]
-                    else:
-                        # Count unique voters only
-                        unique_voters = list(
-                            set(v["participant_id"] for v in question_votes)
-                        )
-                        questions[question_id]["vote_count"] = len(unique_voters)
-                        questions[question_id]["voters"] = unique_voters
-
-            # Sort questions by vote count (most popular first)
-            sorted_questions = sorted(
-                questions.values(), key=lambda q: q["vote_count"], reverse=True
-            )
+                    questions[question_id]["vote_count"] = len(voters)
+                    questions[question_id]["voters"] = list(voters)
 
-            # Filter approved questions only for public display
+            # Filter approved questions only for public display, then sort
+            # by vote count (most popular first); pending questions are
+            # only sorted when they are returned
+            by_votes = itemgetter("vote_count")
             approved_questions = [
-                q for q in sorted_questions if q.get("status") == "approved"
-            ]
-            pending_questions = [
-                q for q in sorted_questions if q.get("status") == "pending"
+                q for q in questions.values() if q.get("status") == "approved"
             ]
+            approved_questions.sort(key=by_votes, reverse=True)
+            pending_questions = []
+            if not self._moderate_questions:
+                pending_questions = [
+                    q for q in questions.values() if q.get("status") == "pending"
+                ]
+                pending_questions.sort(key=by_votes, reverse=True)
 
             return {
                 "type": "qna_results",
                 "topic": self.config.get("topic", ""),
                 "total_questions": len(questions),
-                "total_votes": sum(len(v) for v in votes.values()),
+                "total_votes": total_votes,
                 "approved_questions": approved_questions,
-                "pending_questions": pending_questions
-                if not self.config.get("moderate_questions", False)
-                else [],
+                "pending_questions": pending_questions,
                 "most_popular_question": approved_questions[0]
                 if approved_questions
                 else None,
-                "enable_voting": self.config.get("enable_voting", True),
+                "enable_voting": self._enable_voting,
                 "show_vote_counts": self.config.get("show_vote_counts", True),
-                "allow_anonymous": self.config.get("allow_anonymous", True),
+                "allow_anonymous": self._allow_anonymous,
                 "last_updated": datetime.utcnow().isoformat(),
             }
 
@@ -343,20 +329,13 @@ class QnaActivity(BaseActivity):
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
-    def get_default_metadata(self) -> dict[str, Any]:
+    def get_default_metadata(self) -> Mapping[str, Any]:
         """Get default metadata for Q&A activities.
 
         Returns:
-            Dictionary of default metadata values
+            Read-only mapping of default metadata values
         """
-        return {
-            "duration_seconds": 900,  # 15 minutes default
-            "max_responses": None,  # No limit by default
-            "allow_multiple_responses": True,  # Can submit questions and votes
-            "show_live_results": True,
-            "activity_type": "qna",
-            "requires_moderation": True,  # Q&A often needs moderation
-        }
+        return self._DEFAULT_METADATA
 
     def can_transition_to(self, current_state: str, target_state: str) -> bool:
         """Check if Q&A activity can transition to target state.
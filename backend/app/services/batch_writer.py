@@ -0,0 +1,94 @@
+"""Base class for writers that coalesce concurrent writes into batches."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class BatchWriter(ABC):
+    """Gather rows from concurrent producers and write them in batches.
+
+    Producers enqueue a row and await the value its write resolves to. A
+    single flusher task per queue key gathers rows for up to ``max_wait``
+    seconds (or ``max_batch`` rows) and hands them to ``_flush``, which
+    subclasses implement to write the batch and resolve each producer's
+    future.
+    """
+
+    def __init__(self, max_batch: int, max_wait: float):
+        """Initialize the writer.
+
+        Args:
+            max_batch: Maximum rows written per flush
+            max_wait: Seconds to wait for more rows before flushing
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queues: dict[tuple[AsyncEngine, Hashable], asyncio.Queue] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def flush(self) -> None:
+        """Wait until every queued row has been written."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _enqueue(
+        self, bind: AsyncEngine, row: dict, group: Hashable = None
+    ) -> Any:
+        """Queue a row for the next batch and wait for its result.
+
+        Args:
+            bind: Engine the batch is written through
+            row: Row to write
+            group: Extra queue key, so unrelated rows are batched separately
+
+        Returns:
+            The value ``_flush`` resolved the row's future with
+        """
+        key = (bind, group)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+            task = asyncio.get_running_loop().create_task(self._drain(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((row, future))
+        return await future
+
+    async def _drain(self, key: tuple[AsyncEngine, Hashable]) -> None:
+        """Flush queued rows for one key until its queue is empty."""
+        queue = self._queues[key]
+        loop = asyncio.get_running_loop()
+        try:
+            while not queue.empty():
+                batch = [queue.get_nowait()]
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                await self._flush(key[0], batch)
+        finally:
+            del self._queues[key]
+
+    @abstractmethod
+    async def _flush(
+        self, bind: AsyncEngine, batch: list[tuple[dict, asyncio.Future]]
+    ) -> None:
+        """Write a batch and resolve each producer's future."""
+
+    @staticmethod
+    def _fail(batch: list[tuple[dict, asyncio.Future]], error: Exception) -> None:
+        """Propagate a write failure to each waiting producer."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
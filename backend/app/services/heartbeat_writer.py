@@ -0,0 +1,121 @@
+"""Batched writer for participant heartbeats."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.settings import settings
+from app.db.database import session_scope
+from app.db.models import Participant
+from app.services.batch_writer import BatchWriter
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatWriter(BatchWriter):
+    """Coalesce participant heartbeats into batched UPDATEs.
+
+    Producers enqueue a heartbeat and await the participant's session id. A
+    single flusher task per engine gathers heartbeats for up to ``max_wait``
+    seconds (or ``max_batch`` heartbeats) and writes them with one
+    executemany UPDATE and one commit, so a room full of clients beating
+    every few seconds does not cost a commit per participant.
+    """
+
+    def __init__(self, max_batch: int = 500, max_wait: float = 0.2):
+        """Initialize the writer.
+
+        Args:
+            max_batch: Maximum heartbeats written per flush
+            max_wait: Seconds to wait for more heartbeats before flushing
+        """
+        super().__init__(max_batch, max_wait)
+
+    async def write(
+        self,
+        db: AsyncSession,
+        participant_id: int,
+        last_seen: datetime,
+        connection_data: Optional[dict[str, Any]] = None,
+        batched: bool = True,
+    ) -> int:
+        """Record a heartbeat and return the participant's session id.
+
+        Args:
+            db: Request database session (its engine is used for the batch)
+            participant_id: ID of the participant
+            last_seen: Time the heartbeat was received
+            connection_data: Client context to store, if any
+            batched: If False, update directly on ``db`` instead of queueing
+
+        Returns:
+            ID of the session the participant belongs to
+
+        Raises:
+            ValueError: If the participant does not exist
+        """
+        row = {"id": participant_id, "last_seen": last_seen}
+        if connection_data:
+            row["connection_data"] = connection_data
+        if not batched:
+            values = {key: value for key, value in row.items() if key != "id"}
+            result = await db.execute(
+                update(Participant)
+                .where(Participant.id == participant_id)
+                .values(**values)
+                .returning(Participant.session_id)
+                .execution_options(synchronize_session=False)
+            )
+            session_id = result.scalar_one_or_none()
+            if session_id is None:
+                raise ValueError("Participant not found")
+            await db.commit()
+            return session_id
+
+        return await self._enqueue(db.bind, row)
+
+    async def _flush(
+        self, bind: AsyncEngine, batch: list[tuple[dict, asyncio.Future]]
+    ) -> None:
+        """Update a batch and resolve each producer's future."""
+        # Later beats from the same participant supersede earlier ones
+        rows: dict[int, dict] = {}
+        for row, _ in batch:
+            rows.setdefault(row["id"], {}).update(row)
+
+        try:
+            async with session_scope(bind) as db:
+                result = await db.execute(
+                    select(Participant.id, Participant.session_id).where(
+                        Participant.id.in_(rows)
+                    )
+                )
+                session_ids = dict(result.tuples().all())
+                found = [rows[pid] for pid in rows if pid in session_ids]
+                if found:
+                    await db.execute(update(Participant), found)
+                    await db.commit()
+        except Exception as e:
+            logger.error("Failed to write %d heartbeats: %s", len(batch), e)
+            self._fail(batch, e)
+            return
+
+        for row, future in batch:
+            if future.done():
+                continue
+            session_id = session_ids.get(row["id"])
+            if session_id is None:
+                future.set_exception(ValueError("Participant not found"))
+            else:
+                future.set_result(session_id)
+
+
+# Shared writer used by the participant service
+heartbeat_writer = HeartbeatWriter(
+    max_batch=settings.heartbeat_batch_size,
+    max_wait=settings.heartbeat_batch_wait_seconds,
+)
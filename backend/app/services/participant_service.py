@@ -2,13 +2,14 @@
 Participant service for handling session joining, heartbeat, and management operations.
 """
 
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select, func, delete
+from sqlalchemy import Row, and_, case, select, func, delete, insert
 from sqlalchemy.exc import IntegrityError
 
+from app.db.database import supports_concurrent_sessions
 from app.db.models import Participant, Session as SessionModel, Activity
 from app.models.schemas import (
     ParticipantJoinRequest,
@@ -18,6 +19,9 @@ from app.models.schemas import (
     ParticipantStatus,
     NicknameValidationResponse,
 )
+from app.models.jsonb_schemas.activity import Activity as ActivitySchema
+from app.services.activity_service import ActivityService
+from app.services.heartbeat_writer import heartbeat_writer
 
 
 class ParticipantService:
@@ -47,45 +51,76 @@ class ParticipantService:
         Raises:
             ValueError: If session not found or nickname taken
         """
-        # Validate session exists
+        # Load the session, its participant count, whether the nickname is
+        # taken and the active activity in one query
         result = await self.db.execute(
-            select(SessionModel).where(SessionModel.id == session_id)
+            select(
+                SessionModel.title,
+                SessionModel.status,
+                SessionModel.max_participants,
+                self._participant_count_subquery(session_id).label("participant_count"),
+                self._nickname_taken_clause(session_id, join_request.nickname).label(
+                    "nickname_taken"
+                ),
+                Activity.id.label("activity_id"),
+                Activity.type.label("activity_type"),
+                Activity.config.label("activity_config"),
+            )
+            .outerjoin(
+                Activity,
+                and_(
+                    Activity.session_id == SessionModel.id,
+                    Activity.status == "active",
+                ),
+            )
+            .where(SessionModel.id == session_id)
+            # Same pick as ActivityService.get_active_activity if several match
+            .order_by(Activity.updated_at.desc())
+            .limit(1)
         )
-        session = result.scalar_one_or_none()
+        session = result.one_or_none()
         if not session:
             raise ValueError("Session not found")
 
         # Check if session allows new participants
-        current_count = await self.get_participant_count(session_id)
-        if current_count >= session.max_participants:
+        if session.participant_count >= session.max_participants:
             raise ValueError("Session is full")
 
         # Validate nickname availability
-        validation = await self.validate_nickname(session_id, join_request.nickname)
-        if not validation.available:
-            if validation.suggested_nickname:
-                join_request.nickname = validation.suggested_nickname
+        if session.nickname_taken:
+            suggested = await self._generate_nickname_suggestion(
+                session_id, join_request.nickname
+            )
+            if suggested:
+                join_request.nickname = suggested
             else:
                 raise ValueError("Nickname not available and no alternatives found")
 
         # Create participant
-        participant = Participant(
-            session_id=session_id, nickname=join_request.nickname, connection_data={}
-        )
-
         try:
-            self.db.add(participant)
+            result = await self.db.execute(
+                insert(Participant)
+                .values(
+                    session_id=session_id,
+                    nickname=join_request.nickname,
+                    display_name=join_request.nickname,
+                    connection_data={},
+                )
+                .returning(Participant.id)
+            )
+            participant_id = result.scalar_one()
             await self.db.commit()
-            await self.db.refresh(participant)
         except IntegrityError:
             await self.db.rollback()
             raise ValueError("Nickname already taken")
 
-        # Get current session state
-        session_state = await self._get_session_state(session_id)
+        # Build session state from the row loaded above
+        session_state = self._build_session_state(
+            session_id, session, participant_count=session.participant_count + 1
+        )
 
         return ParticipantJoinResponse(
-            participant_id=str(participant.id), session_state=session_state
+            participant_id=str(participant_id), session_state=session_state
         )
 
     async def validate_nickname(
@@ -136,30 +171,31 @@ class ParticipantService:
         Raises:
             ValueError: If participant not found
         """
-        result = await self.db.execute(
-            select(Participant).where(Participant.id == participant_id)
+        # Update last_seen and connection_data; concurrent heartbeats are
+        # coalesced into batched UPDATEs when the pool allows it
+        last_seen = datetime.now(UTC)
+        session_id = await heartbeat_writer.write(
+            self.db,
+            participant_id=participant_id,
+            last_seen=last_seen,
+            connection_data=heartbeat_request.activity_context,
+            batched=supports_concurrent_sessions(self.db),
         )
-        participant = result.scalar_one_or_none()
-        if not participant:
-            raise ValueError("Participant not found")
 
-        # Update last_seen and connection_data
-        participant.last_seen = datetime.now(UTC)
-        if heartbeat_request.activity_context:
-            participant.connection_data = heartbeat_request.activity_context
-
-        await self.db.commit()
+        # Compute status based on last_seen, which is also the current time
+        status = self._status_at(last_seen, *self._status_cutoffs(last_seen))
 
-        # Compute status based on last_seen
-        status = self._compute_participant_status(participant.last_seen)
-
-        # Get current activity context for session
-        activity_context = await self._get_activity_context(participant.session_id)
+        # Get current activity context for session; the active activity is
+        # cached across requests, so concurrent heartbeats share one lookup
+        current_activity = await ActivityService.get_active_activity(
+            self.db, session_id
+        )
+        activity_context = self._build_activity_context(current_activity)
 
         return ParticipantHeartbeatResponse(
             status=status,
             activity_context=activity_context,
-            updated_at=participant.last_seen,
+            updated_at=last_seen,
         )
 
     async def get_session_participants(
@@ -174,25 +210,34 @@ class ParticipantService:
         Returns:
             List of ParticipantStatus with computed online/idle/disconnected status
         """
+        # Classify in SQL against cutoffs computed once, so rows come back as
+        # plain columns instead of hydrated Participant objects
+        online_since, idle_since = self._status_cutoffs(datetime.now(UTC))
+        status = case(
+            (Participant.last_seen > online_since, "online"),
+            (Participant.last_seen > idle_since, "idle"),
+            else_="disconnected",
+        )
         result = await self.db.execute(
-            select(Participant).where(Participant.session_id == session_id)
+            select(
+                Participant.id,
+                Participant.nickname,
+                Participant.joined_at,
+                Participant.last_seen,
+                status.label("status"),
+            ).where(Participant.session_id == session_id)
         )
-        participants = result.scalars().all()
-
-        participant_statuses = []
-        for p in participants:
-            status = self._compute_participant_status(p.last_seen)
-            participant_statuses.append(
-                ParticipantStatus(
-                    participant_id=str(p.id),
-                    nickname=p.nickname,
-                    status=status,
-                    joined_at=p.joined_at,
-                    last_seen=p.last_seen,
-                )
-            )
 
-        return participant_statuses
+        return [
+            ParticipantStatus(
+                participant_id=str(row["id"]),
+                nickname=row["nickname"],
+                status=row["status"],
+                joined_at=row["joined_at"],
+                last_seen=row["last_seen"],
+            )
+            for row in result.mappings()
+        ]
 
     async def remove_participant(self, participant_id: UUID) -> bool:
         """
@@ -225,6 +270,27 @@ class ParticipantService:
         )
         return result.scalar()
 
+    @staticmethod
+    def _participant_count_subquery(session_id: int):
+        """Scalar subquery counting the participants of a session."""
+        return (
+            select(func.count(Participant.id))
+            .where(Participant.session_id == session_id)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _nickname_taken_clause(session_id: int, nickname: str):
+        """EXISTS clause for a nickname already used in a session."""
+        return (
+            select(Participant.id)
+            .where(
+                Participant.session_id == session_id,
+                Participant.nickname == nickname,
+            )
+            .exists()
+        )
+
     def _compute_participant_status(self, last_seen: datetime) -> str:
         """
         Compute participant status based on last_seen timestamp.
@@ -240,76 +306,88 @@ class ParticipantService:
             # For naive datetime, assume it's in UTC (consistent with our database storage)
             last_seen = last_seen.replace(tzinfo=UTC)
 
-        now = datetime.now(UTC)
-        seconds_since_seen = (now - last_seen).total_seconds()
+        return self._status_at(last_seen, *self._status_cutoffs(datetime.now(UTC)))
 
-        if seconds_since_seen < self.ONLINE_THRESHOLD:
-            return "online"
-        elif seconds_since_seen < self.IDLE_THRESHOLD:
-            return "idle"
-        else:
-            return "disconnected"
-
-    async def _get_session_state(self, session_id: int) -> dict[str, Any]:
+    def _status_cutoffs(self, now: datetime) -> tuple[datetime, datetime]:
         """
-        Get current session state including active activity and configuration.
+        Get the last_seen times after which a participant is online or idle.
 
         Args:
-            session_id: Session ID to get state for
+            now: Time to measure from
 
         Returns:
-            Dictionary with current session state
+            Tuple of (online cutoff, idle cutoff)
         """
-        result = await self.db.execute(
-            select(SessionModel).where(SessionModel.id == session_id)
+        return (
+            now - timedelta(seconds=self.ONLINE_THRESHOLD),
+            now - timedelta(seconds=self.IDLE_THRESHOLD),
         )
-        session = result.scalar_one_or_none()
-        if not session:
-            return {}
 
-        # Get current active activity
-        activity_result = await self.db.execute(
-            select(Activity).where(
-                and_(Activity.session_id == session_id, Activity.status == "active")
-            )
-        )
-        current_activity = activity_result.scalar_one_or_none()
+    @staticmethod
+    def _status_at(
+        last_seen: datetime, online_cutoff: datetime, idle_cutoff: datetime
+    ) -> str:
+        """
+        Classify a timezone-aware last_seen against precomputed cutoffs.
 
-        participant_count = await self.get_participant_count(session_id)
+        Args:
+            last_seen: When participant was last seen
+            online_cutoff: Seen after this means online
+            idle_cutoff: Seen after this (but not online) means idle
 
+        Returns:
+            Status string: "online", "idle", or "disconnected"
+        """
+        if last_seen > online_cutoff:
+            return "online"
+        if last_seen > idle_cutoff:
+            return "idle"
+        return "disconnected"
+
+    @staticmethod
+    def _build_session_state(
+        session_id: int, session: Row, participant_count: int
+    ) -> dict[str, Any]:
+        """
+        Build the session state from a joined session/active activity row.
+
+        Args:
+            session_id: Session ID the state is for
+            session: Row with session title/status and active activity columns
+            participant_count: Number of participants in the session
+
+        Returns:
+            Dictionary with current session state
+        """
         return {
             "session_id": session_id,
             "session_title": session.title,
             "session_status": session.status,
             "current_activity": (
                 {
-                    "id": str(current_activity.id) if current_activity else None,
-                    "type": current_activity.type if current_activity else None,
-                    "config": current_activity.config if current_activity else None,
+                    "id": str(session.activity_id),
+                    "type": session.activity_type,
+                    "config": session.activity_config,
                 }
-                if current_activity
+                if session.activity_id
                 else None
             ),
             "participant_count": participant_count,
         }
 
-    async def _get_activity_context(self, session_id: int) -> dict[str, Any]:
+    @staticmethod
+    def _build_activity_context(
+        current_activity: Optional[ActivitySchema],
+    ) -> dict[str, Any]:
         """
-        Get current activity context for heartbeat responses.
+        Build the activity context for heartbeat responses.
 
         Args:
-            session_id: Session ID to get activity context for
+            current_activity: The session's active activity, if any
 
         Returns:
             Dictionary with current activity context
         """
-        result = await self.db.execute(
-            select(Activity).where(
-                and_(Activity.session_id == session_id, Activity.status == "active")
-            )
-        )
-        current_activity = result.scalar_one_or_none()
-
         if not current_activity:
             return {"message": "No active activity"}
 
@@ -334,21 +412,22 @@ class ParticipantService:
         Returns:
             Suggested unique nickname or None if no alternatives found
         """
-        # Try appending numbers 1-99
-        for i in range(1, 100):
-            suggested = f"{base_nickname}{i}"
-            if len(suggested) <= 50:  # Respect max length
-                result = await self.db.execute(
-                    select(Participant).where(
-                        and_(
-                            Participant.session_id == session_id,
-                            Participant.nickname == suggested,
-                        )
-                    )
-                )
-                existing = result.scalar_one_or_none()
+        # Try appending numbers 1-99, checking every candidate in one query
+        candidates = [
+            suggested
+            for suggested in (f"{base_nickname}{i}" for i in range(1, 100))
+            if len(suggested) <= 50  # Respect max length
+        ]
+        if not candidates:
+            return None
 
-                if not existing:
-                    return suggested
-
-        return None
+        result = await self.db.execute(
+            select(Participant.nickname).where(
+                and_(
+                    Participant.session_id == session_id,
+                    Participant.nickname.in_(candidates),
+                )
+            )
+        )
+        taken = set(result.scalars())
+        return next((c for c in candidates if c not in taken), None)
@@ -0,0 +1,106 @@
+"""Batched writer for participant responses."""
+
+import asyncio
+import logging
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.settings import settings
+from app.db.database import session_scope
+from app.services.batch_writer import BatchWriter
+from app.services.user_response_service import UserResponseService
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseWriter(BatchWriter):
+    """Coalesce response inserts for the same activity into batched INSERTs.
+
+    Producers enqueue a row and await its id. A single flusher task per
+    activity gathers rows for up to ``max_wait`` seconds (or ``max_batch``
+    rows) and writes them in one statement on its own session, so a burst of
+    votes costs one round-trip instead of one commit per participant.
+    """
+
+    def __init__(self, max_batch: int = 100, max_wait: float = 0.025):
+        """Initialize the writer.
+
+        Args:
+            max_batch: Maximum rows written per INSERT
+            max_wait: Seconds to wait for more rows before flushing
+        """
+        super().__init__(max_batch, max_wait)
+
+    async def write(
+        self,
+        db: AsyncSession,
+        session_id: int,
+        activity_id: UUID,
+        participant_id: int,
+        response_data: dict[str, Any],
+        batched: bool = True,
+    ) -> UUID:
+        """Store a response and return its id once it is committed.
+
+        Args:
+            db: Request database session (its engine is used for the batch)
+            session_id: ID of the session
+            activity_id: ID of the activity
+            participant_id: ID of the participant
+            response_data: Processed response data
+            batched: If False, insert directly on ``db`` instead of queueing
+
+        Returns:
+            ID of the stored response
+
+        Raises:
+            IntegrityError: If the row violates a database constraint
+        """
+        row = {
+            "id": uuid4(),
+            "session_id": session_id,
+            "activity_id": activity_id,
+            "participant_id": participant_id,
+            "response_data": response_data,
+        }
+        if not batched:
+            await UserResponseService.create_responses_bulk(db, [row])
+            return row["id"]
+
+        return await self._enqueue(db.bind, row, group=activity_id)
+
+    async def _flush(
+        self, bind: AsyncEngine, batch: list[tuple[dict, asyncio.Future]]
+    ) -> None:
+        """Insert a batch and resolve each producer's future."""
+        try:
+            async with session_scope(bind) as db:
+                await UserResponseService.create_responses_bulk(
+                    db, [row for row, _ in batch]
+                )
+        except IntegrityError as e:
+            if len(batch) > 1:
+                # Retry row by row so one bad row does not fail the others
+                for item in batch:
+                    await self._flush(bind, [item])
+            else:
+                self._fail(batch, e)
+            return
+        except Exception as e:
+            logger.error("Failed to write %d responses: %s", len(batch), e)
+            self._fail(batch, e)
+            return
+
+        for row, future in batch:
+            if not future.done():
+                future.set_result(row["id"])
+
+
+# Shared writer used by the activity service
+response_writer = ResponseWriter(
+    max_batch=settings.response_batch_size,
+    max_wait=settings.response_batch_wait_seconds,
+)
@@ -7,7 +7,8 @@ import string
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import Row, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -19,46 +20,80 @@ from app.models.schemas import SessionCreate, SessionUpdate
 
 logger = get_logger(__name__)
 
+# Characters used in session codes
+_CODE_ALPHABET = string.ascii_uppercase + string.digits
+_CODE_BYTE_LIMIT = 256 - 256 % len(_CODE_ALPHABET)
+
+# Session columns shown in list views, selected as plain rows
+_SESSION_COLUMNS = (
+    Session.id,
+    Session.title,
+    Session.description,
+    Session.status,
+    Session.qr_code,
+    Session.admin_code,
+    Session.max_participants,
+    Session.created_at,
+    Session.updated_at,
+    Session.started_at,
+    Session.completed_at,
+)
+
 
 class SessionService:
     """Service class for session operations."""
 
+    # Inserts tried before giving up on generating unique codes
+    MAX_CODE_ATTEMPTS = 5
+
     @staticmethod
     def _generate_code(length: int = 6) -> str:
         """Generate a random alphanumeric code."""
-        alphabet = string.ascii_uppercase + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        # One urandom read per batch of characters instead of one per choice;
+        # bytes past the last whole multiple of the alphabet are rejected so
+        # every character stays equally likely
+        chars: list[str] = []
+        while len(chars) < length:
+            chars.extend(
+                _CODE_ALPHABET[byte % len(_CODE_ALPHABET)]
+                for byte in secrets.token_bytes(length)
+                if byte < _CODE_BYTE_LIMIT
+            )
+        return "".join(chars[:length])
 
     @staticmethod
     async def create_session(db: AsyncSession, session_data: SessionCreate) -> Session:
         """Create a new session."""
         logger.info("Creating new session", title=session_data.title)
 
-        # Generate unique codes
-        qr_code = SessionService._generate_code(8)
-        admin_code = SessionService._generate_code(6)
-
-        # Ensure uniqueness (simplified for MVP)
-        while await SessionService._code_exists(db, qr_code=qr_code):
-            qr_code = SessionService._generate_code(8)
-
-        while await SessionService._code_exists(db, admin_code=admin_code):
-            admin_code = SessionService._generate_code(6)
-
-        session = Session(
-            title=session_data.title,
-            description=session_data.description,
-            max_participants=session_data.max_participants,
-            qr_code=qr_code,
-            admin_code=admin_code,
-            status=SessionStatus.DRAFT,
-        )
+        # Codes are unique in the database, so insert optimistically and only
+        # regenerate them on the (very rare) collision
+        for attempt in range(1, SessionService.MAX_CODE_ATTEMPTS + 1):
+            session = Session(
+                title=session_data.title,
+                description=session_data.description,
+                max_participants=session_data.max_participants,
+                qr_code=SessionService._generate_code(8),
+                admin_code=SessionService._generate_code(6),
+                status=SessionStatus.DRAFT,
+            )
+            db.add(session)
+            try:
+                await db.commit()
+                break
+            except IntegrityError as e:
+                await db.rollback()
+                # Only a duplicate code is worth retrying with fresh ones
+                message = str(e.orig).lower()
+                if "qr_code" not in message and "admin_code" not in message:
+                    raise
+                logger.warning("Session code collision", attempt=attempt)
+        else:
+            raise ValueError("Could not generate unique session codes")
 
-        db.add(session)
-        await db.commit()
         await db.refresh(session)
 
-        logger.info("Session created", session_id=session.id, qr_code=qr_code)
+        logger.info("Session created", session_id=session.id, qr_code=session.qr_code)
         return session
 
     @staticmethod
@@ -94,16 +129,34 @@ class SessionService:
     @staticmethod
     async def list_sessions(
         db: AsyncSession, offset: int = 0, limit: int = 100
-    ) -> list[Session]:
-        """List sessions with pagination."""
+    ) -> list[Row]:
+        """List sessions with pagination.
+
+        Rows carry the SessionResponse columns plus ``participant_count`` and
+        ``activity_count``, so callers need no per-session stats query.
+        """
+        participant_count = (
+            select(func.count(Participant.id))
+            .where(Participant.session_id == Session.id)
+            .scalar_subquery()
+        )
+        activity_count = (
+            select(func.count(Activity.id))
+            .where(Activity.session_id == Session.id)
+            .scalar_subquery()
+        )
         query = (
-            select(Session)
+            select(
+                *_SESSION_COLUMNS,
+                participant_count.label("participant_count"),
+                activity_count.label("activity_count"),
+            )
             .offset(offset)
             .limit(limit)
             .order_by(Session.created_at.desc())
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     @staticmethod
     async def update_session(
@@ -160,42 +213,32 @@ class SessionService:
     @staticmethod
     async def get_session_stats(db: AsyncSession, session_id: int) -> dict:
         """Get session statistics."""
-        session = await SessionService.get_session(db, session_id)
-        if not session:
-            return {}
-
-        # Count participants
-        participant_count = await db.execute(
-            select(func.count(Participant.id)).where(
-                Participant.session_id == session_id
-            )
+        # Load the session fields and both counts in one query
+        participant_count = (
+            select(func.count(Participant.id))
+            .where(Participant.session_id == session_id)
+            .scalar_subquery()
         )
-
-        # Count activities
-        activity_count = await db.execute(
-            select(func.count(Activity.id)).where(Activity.session_id == session_id)
+        activity_count = (
+            select(func.count(Activity.id))
+            .where(Activity.session_id == session_id)
+            .scalar_subquery()
         )
+        result = await db.execute(
+            select(
+                participant_count.label("participant_count"),
+                activity_count.label("activity_count"),
+                Session.status,
+                Session.created_at,
+            ).where(Session.id == session_id)
+        )
+        row = result.one_or_none()
+        if not row:
+            return {}
 
         return {
-            "participant_count": participant_count.scalar() or 0,
-            "activity_count": activity_count.scalar() or 0,
-            "status": session.status,
-            "created_at": session.created_at,
+            "participant_count": row.participant_count or 0,
+            "activity_count": row.activity_count or 0,
+            "status": row.status,
+            "created_at": row.created_at,
         }
-
-    @staticmethod
-    async def _code_exists(
-        db: AsyncSession, qr_code: str | None = None, admin_code: str | None = None
-    ) -> bool:
-        """Check if a code already exists."""
-        if qr_code:
-            result = await db.execute(select(Session).where(Session.qr_code == qr_code))
-            return result.scalar_one_or_none() is not None
-
-        if admin_code:
-            result = await db.execute(
-                select(Session).where(Session.admin_code == admin_code)
-            )
-            return result.scalar_one_or_none() is not None
-
-        return False
@@ -1,18 +1,47 @@
 """Service layer for User Response operations."""
 
+import base64
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import Row, bindparam, desc, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import UserResponse
 from app.models.jsonb_schemas.user_response import (
+    UserResponse as UserResponseSchema,
     UserResponseCreate,
     UserResponseUpdate,
 )
 
+# Only the columns the UserResponse schema exposes; list queries select these
+# as plain rows so pages of responses skip ORM identity-map bookkeeping
+_RESPONSE_COLUMNS = tuple(
+    getattr(UserResponse, name) for name in UserResponseSchema.model_fields
+)
+
+# Statements for hot lookups, built once so each call only binds values
+_SELECT_RESPONSE_BY_ID = select(UserResponse).where(
+    UserResponse.id == bindparam("response_id")
+)
+_SELECT_PARTICIPANT_RESPONSE = select(UserResponse).where(
+    UserResponse.session_id == bindparam("session_id"),
+    UserResponse.activity_id == bindparam("activity_id"),
+    UserResponse.participant_id == bindparam("participant_id"),
+)
+# Full export of an activity's responses, fetched from the server in chunks
+_STREAM_ACTIVITY_RESPONSES = (
+    select(*_RESPONSE_COLUMNS)
+    .where(
+        UserResponse.session_id == bindparam("session_id"),
+        UserResponse.activity_id == bindparam("activity_id"),
+    )
+    .order_by(UserResponse.created_at, UserResponse.id)
+    .execution_options(yield_per=500)
+)
+
 
 class UserResponseService:
     """Service class for User Response operations."""
@@ -35,8 +64,28 @@ class UserResponseService:
         db.add(db_response)
         await db.commit()
         await db.refresh(db_response)
+
+        # Imported here since the activity service depends on this module
+        from app.services.activity_service import _notify_activity_change
+
+        _notify_activity_change("response_received", activity_id)
         return db_response
 
+    @staticmethod
+    async def create_responses_bulk(
+        db: AsyncSession,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Insert many responses in one executemany INSERT and one commit.
+
+        Each row maps UserResponse column names to values and needs at least
+        session_id, activity_id, participant_id and response_data.
+        """
+        if not rows:
+            return
+        await db.execute(insert(UserResponse), rows)
+        await db.commit()
+
     @staticmethod
     async def get_activity_responses(
         db: AsyncSession,
@@ -44,20 +93,70 @@ class UserResponseService:
         activity_id: UUID,
         offset: int = 0,
         limit: int = 100,
-    ) -> list[UserResponse]:
-        """Get all responses for a specific activity."""
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[Row]:
+        """Get all responses for a specific activity, newest first.
+
+        Pass the ``(created_at, id)`` of the last row of a page as ``cursor``
+        to get the next page by seeking past it instead of skipping
+        ``offset`` rows, which costs the same at any depth.
+        """
         query = (
-            select(UserResponse)
+            select(*_RESPONSE_COLUMNS)
             .where(
                 UserResponse.session_id == session_id,
                 UserResponse.activity_id == activity_id,
             )
-            .order_by(desc(UserResponse.created_at))
-            .offset(offset)
+            .order_by(desc(UserResponse.created_at), desc(UserResponse.id))
             .limit(limit)
         )
+        if cursor:
+            position = (UserResponse.created_at, UserResponse.id)
+            query = query.where(
+                tuple_(*position) < tuple_(*cursor, types=[c.type for c in position])
+            )
+        elif offset:
+            query = query.offset(offset)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    @staticmethod
+    async def stream_activity_responses(
+        db: AsyncSession,
+        session_id: int,
+        activity_id: UUID,
+    ) -> AsyncIterator[Row]:
+        """Yield every response for an activity, oldest first.
+
+        Rows are fetched in chunks through a server-side cursor, so exports
+        of large activities never hold the whole result in memory.
+        """
+        rows = await db.stream(
+            _STREAM_ACTIVITY_RESPONSES,
+            {"session_id": session_id, "activity_id": activity_id},
+        )
+        async for row in rows:
+            yield row
+
+    @staticmethod
+    def encode_cursor(row: Row) -> str:
+        """Encode a response row's position as an opaque page cursor."""
+        position = f"{row.created_at.isoformat()}|{row.id}"
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        """Decode a page cursor made by ``encode_cursor``.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            position = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at, response_id = position.split("|")
+            return datetime.fromisoformat(created_at), UUID(response_id)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError("Invalid cursor") from e
 
     @staticmethod
     async def get_participant_response(
@@ -67,12 +166,14 @@ class UserResponseService:
         participant_id: int,
     ) -> UserResponse | None:
         """Get a specific participant's response for an activity."""
-        query = select(UserResponse).where(
-            UserResponse.session_id == session_id,
-            UserResponse.activity_id == activity_id,
-            UserResponse.participant_id == participant_id,
+        result = await db.execute(
+            _SELECT_PARTICIPANT_RESPONSE,
+            {
+                "session_id": session_id,
+                "activity_id": activity_id,
+                "participant_id": participant_id,
+            },
         )
-        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -82,8 +183,7 @@ class UserResponseService:
         response_data: UserResponseUpdate,
     ) -> UserResponse | None:
         """Update an existing user response."""
-        query = select(UserResponse).where(UserResponse.id == response_id)
-        result = await db.execute(query)
+        result = await db.execute(_SELECT_RESPONSE_BY_ID, {"response_id": response_id})
         db_response = result.scalar_one_or_none()
 
         if db_response:
@@ -99,8 +199,7 @@ class UserResponseService:
         response_id: UUID,
     ) -> bool:
         """Delete a user response."""
-        query = select(UserResponse).where(UserResponse.id == response_id)
-        result = await db.execute(query)
+        result = await db.execute(_SELECT_RESPONSE_BY_ID, {"response_id": response_id})
         db_response = result.scalar_one_or_none()
 
         if db_response:
@@ -117,29 +216,21 @@ class UserResponseService:
         activity_id: UUID,
     ) -> dict:
         """Get summary statistics for activity responses."""
-        total_query = select(func.count(UserResponse.id)).where(
-            UserResponse.session_id == session_id,
-            UserResponse.activity_id == activity_id,
-        )
-        unique_query = select(
-            func.count(func.distinct(UserResponse.participant_id))
+        summary_query = select(
+            func.count(UserResponse.id),
+            func.count(func.distinct(UserResponse.participant_id)),
+            func.max(UserResponse.updated_at),
         ).where(
             UserResponse.session_id == session_id,
             UserResponse.activity_id == activity_id,
         )
-        last_updated_query = select(func.max(UserResponse.updated_at)).where(
-            UserResponse.session_id == session_id,
-            UserResponse.activity_id == activity_id,
-        )
-
-        total_result = await db.execute(total_query)
-        unique_result = await db.execute(unique_query)
-        last_updated_result = await db.execute(last_updated_query)
+        result = await db.execute(summary_query)
+        total_responses, unique_participants, last_updated = result.one()
 
         return {
-            "total_responses": total_result.scalar() or 0,
-            "unique_participants": unique_result.scalar() or 0,
-            "last_updated": last_updated_result.scalar(),
+            "total_responses": total_responses or 0,
+            "unique_participants": unique_participants or 0,
+            "last_updated": last_updated,
         }
 
     @staticmethod
@@ -149,10 +240,10 @@ class UserResponseService:
         participant_id: int,
         offset: int = 0,
         limit: int = 100,
-    ) -> list[UserResponse]:
+    ) -> list[Row]:
         """Get all responses by a specific participant in a session."""
         query = (
-            select(UserResponse)
+            select(*_RESPONSE_COLUMNS)
             .where(
                 UserResponse.session_id == session_id,
                 UserResponse.participant_id == participant_id,
@@ -162,7 +253,7 @@ class UserResponseService:
             .limit(limit)
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     @staticmethod
     async def get_responses_since(
@@ -171,20 +262,34 @@ class UserResponseService:
         activity_id: UUID,
         since: datetime,
         limit: int = 1000,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> dict[str, Any]:
-        """Get responses created since a specific timestamp for incremental updates."""
+        """Get responses created since a specific timestamp for incremental updates.
+
+        Pass the ``(created_at, id)`` of the last response already seen as
+        ``cursor`` to resume strictly after it instead of after ``since``;
+        unlike a bare timestamp this neither skips nor repeats responses
+        that share a ``created_at``.
+        """
         query = (
-            select(UserResponse)
+            select(*_RESPONSE_COLUMNS)
             .where(
                 UserResponse.session_id == session_id,
                 UserResponse.activity_id == activity_id,
-                UserResponse.created_at > since,
             )
-            .order_by(UserResponse.created_at)
+            .order_by(UserResponse.created_at, UserResponse.id)
             .limit(limit)
         )
+        if cursor:
+            position = (UserResponse.created_at, UserResponse.id)
+            query = query.where(
+                tuple_(*position) > tuple_(*cursor, types=[c.type for c in position])
+            )
+            since = cursor[0]
+        else:
+            query = query.where(UserResponse.created_at > since)
         result = await db.execute(query)
-        responses = list(result.scalars().all())
+        responses = list(result.all())
 
         return {
             "items": responses,
@@ -10,8 +10,8 @@ from collections.abc import Generator
 import pytest
 
 # TestClient import removed - using only AsyncClient
-from httpx import AsyncClient
-from sqlalchemy import create_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -21,7 +21,7 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-only")
 os.environ.setdefault("ENVIRONMENT", "testing")
 os.environ.setdefault("DEBUG", "true")
 
-from app.db.database import Base, get_db
+from app.db.database import Base, enable_sqlite_foreign_keys, get_db
 
 # Test database URLs - Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -34,6 +34,8 @@ test_engine = create_async_engine(
     future=True,
 )
 
+event.listen(test_engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
 sync_test_engine = create_engine(
     SYNC_TEST_DATABASE_URL,
     echo=False,
@@ -98,10 +100,32 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+    # Ids are reused once the tables are recreated, so drop cached lookups too
+    from app.services.activity_service import _status_cache
+
+    _status_cache.clear()
+
 
 # Removed sync_db_session - using only async database now
 
 
+@pytest.fixture
+async def file_engine(tmp_path):
+    """File database engine with a real connection pool.
+
+    Unlike the shared in-memory engine, its sessions get separate connections,
+    so code that runs queries concurrently can be exercised.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/test.db")
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
 @pytest.fixture
 async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create async HTTP client with shared test database session."""
@@ -112,7 +136,8 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
 
     app.dependency_overrides[get_db] = get_test_db_override
 
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
     # Clean up dependency overrides
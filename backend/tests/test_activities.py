@@ -120,6 +120,56 @@ class TestActivityAPI:
         assert "activities" in result
         assert len(result["activities"]) == 2
         assert result["total"] == 2
+        assert result["activities"][0]["config"] == {"question": "Question 1?"}
+
+        response = await async_client.get(
+            f"/api/v1/sessions/{session_id}/activities",
+            params={"include_config": "false"},
+        )
+        assert response.status_code == 200
+        summaries = response.json()["activities"]
+        assert [a["type"] for a in summaries] == ["poll", "word_cloud"]
+        assert all(a["config"] == {} for a in summaries)
+
+    async def test_get_activity_status_etag(
+        self, async_client: AsyncClient, sample_session, sample_activity_data
+    ):
+        """Test status polling answers 304 while the ETag still matches."""
+        session_id = sample_session["id"]
+        create_response = await async_client.post(
+            f"/api/v1/sessions/{session_id}/activities", json=sample_activity_data
+        )
+        activity_id = create_response.json()["id"]
+        url = f"/api/v1/sessions/{session_id}/activities/{activity_id}/status"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert response.json()["response_count"] == 0
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        # Weak tags, tag lists and the wildcard also match
+        for if_none_match in (f"W/{etag}", f'"stale", {etag}', "*"):
+            response = await async_client.get(
+                url, headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+
+        response = await async_client.get(url, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["response_count"] == 0
+
+        await async_client.put(
+            f"/api/v1/activities/{activity_id}", json={"status": "completed"}
+        )
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
 
     async def test_get_activity(
         self, async_client: AsyncClient, sample_session, sample_activity_data
@@ -256,6 +306,22 @@ class TestActivityAPI:
         assert len(activities) == 1
         assert activities[0]["status"] == "active"
 
+    async def test_activity_type_metadata_routes(self, async_client: AsyncClient):
+        """Test the synchronous metadata helpers behind the type routes."""
+        response = await async_client.get("/api/v1/activities/types")
+        assert response.status_code == 200
+        assert "activity_types" in response.json()
+
+        response = await async_client.get("/api/v1/activities/types/unknown/schema")
+        assert response.status_code == 404
+
+        response = await async_client.post(
+            "/api/v1/activities/validate",
+            json={"activity_type": "unknown", "configuration": {}},
+        )
+        assert response.status_code == 200
+        assert response.json()["valid"] is False
+
 
 class TestActivityService:
     """Test Activity service layer functions."""
@@ -389,3 +455,603 @@ class TestActivityService:
             db=db_session, activity_id=activity.id
         )
         assert deleted_activity is None
+
+    async def _seed_status_data(self, db: AsyncSession):
+        """Create a session, an activity and two responses for status tests."""
+        from app.db.models import Participant, UserResponse
+        from app.services.session_service import SessionService
+        from app.models.schemas import SessionCreate
+
+        session = await SessionService.create_session(
+            db, SessionCreate(title="Status Session", max_participants=10)
+        )
+        activity = await ActivityService.create_activity(
+            db=db,
+            session_id=session.id,
+            activity_data=ActivityCreate(
+                type="poll", config={}, order_index=1, status=ActivityStatus.ACTIVE
+            ),
+        )
+        participant = Participant(session_id=session.id, nickname="poller")
+        db.add(participant)
+        await db.flush()
+        db.add_all(
+            UserResponse(
+                session_id=session.id,
+                activity_id=activity.id,
+                participant_id=participant.id,
+                response_data={"choice": i},
+            )
+            for i in range(2)
+        )
+        await db.commit()
+        return session, activity
+
+    async def test_get_activity_status_service(self, db_session: AsyncSession):
+        """Test ActivityService.get_activity_status on a single-connection pool."""
+        session, activity = await self._seed_status_data(db_session)
+
+        status_data = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+
+        assert status_data["response_count"] == 2
+        assert status_data["last_response_at"] is not None
+        assert status_data["status"] == ActivityStatus.ACTIVE
+
+        assert (
+            await ActivityService.get_activity_status(
+                db=db_session, session_id=session.id + 1, activity_id=activity.id
+            )
+            is None
+        )
+
+    async def test_get_activity_status_concurrent_sessions(self, file_engine):
+        """Test ActivityService.get_activity_status on a pooled file database."""
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, activity = await self._seed_status_data(db)
+            status_data = await ActivityService.get_activity_status(
+                db=db, session_id=session.id, activity_id=activity.id
+            )
+
+        assert status_data["response_count"] == 2
+        assert status_data["activity_id"] == activity.id
+
+    async def test_activity_from_orm_matches_validation(self, db_session: AsyncSession):
+        """Test the unvalidated ORM conversion matches model_validate output."""
+        from app.db.models import Activity as DBActivity
+        from app.models.jsonb_schemas.activity import Activity
+        from app.services.activity_service import _activity_from_orm
+
+        session, activity = await self._seed_status_data(db_session)
+        db_activity = await db_session.get(DBActivity, activity.id)
+
+        constructed = _activity_from_orm(db_activity)
+        assert constructed == Activity.model_validate(db_activity)
+        assert constructed.status == "active"
+
+    async def test_get_session_activities_with_count_service(
+        self, db_session: AsyncSession
+    ):
+        """Test paged activity listing reports the full match count."""
+        from app.services.session_service import SessionService
+        from app.models.schemas import SessionCreate
+
+        session = await SessionService.create_session(
+            db_session, SessionCreate(title="Paging Session", max_participants=10)
+        )
+        for index in range(3):
+            await ActivityService.create_activity(
+                db=db_session,
+                session_id=session.id,
+                activity_data=ActivityCreate(type="poll", config={}, order_index=index),
+            )
+
+        activities, total = await ActivityService.get_session_activities_with_count(
+            db=db_session, session_id=session.id, offset=1, limit=1
+        )
+        assert [a.order_index for a in activities] == [1]
+        assert total == 3
+
+        activities = await ActivityService.get_session_activities(
+            db=db_session, session_id=session.id
+        )
+        assert [a.order_index for a in activities] == [0, 1, 2]
+        assert all(a.status == "draft" and a.config == {} for a in activities)
+
+        activities, total = await ActivityService.get_session_activities_with_count(
+            db=db_session, session_id=session.id, offset=10, limit=1
+        )
+        assert activities == []
+        assert total == 3
+
+        activities, total = await ActivityService.get_session_activities_with_count(
+            db=db_session, session_id=session.id, status=ActivityStatus.ACTIVE
+        )
+        assert activities == []
+        assert total == 0
+
+    async def test_update_activity_status_service(self, db_session: AsyncSession):
+        """Test ActivityService.update_activity_status method."""
+        session, activity = await self._seed_status_data(db_session)
+
+        updated = await ActivityService.update_activity_status(
+            db=db_session, activity_id=activity.id, status=ActivityStatus.COMPLETED
+        )
+        assert updated.status == "completed"
+        assert updated.type == activity.type
+
+        unchanged = await ActivityService.update_activity(
+            db=db_session, activity_id=activity.id, activity_data=ActivityUpdate()
+        )
+        assert unchanged.status == "completed"
+
+        assert (
+            await ActivityService.update_activity_status(
+                db=db_session, activity_id=uuid4(), status=ActivityStatus.ACTIVE
+            )
+            is None
+        )
+        assert not await ActivityService.delete_activity(
+            db=db_session, activity_id=uuid4()
+        )
+
+    async def test_check_and_expire_activities_service(self, db_session: AsyncSession):
+        """Test overdue active activities are expired and marked completed."""
+        from datetime import datetime, timedelta
+
+        from app.core.events import activity_events
+        from app.db.enums import ActivityState
+        from app.db.models import Activity as DBActivity
+
+        session, activity = await self._seed_status_data(db_session)
+        overdue = DBActivity(
+            session_id=session.id,
+            type="poll",
+            order_index=2,
+            status=ActivityStatus.ACTIVE,
+            state=ActivityState.ACTIVE,
+            expires_at=datetime.utcnow() - timedelta(minutes=1),
+        )
+        db_session.add(overdue)
+        await db_session.commit()
+
+        async with activity_events.subscribe(overdue.id) as queue:
+            expired_ids = await ActivityService.check_and_expire_activities(db_session)
+            assert queue.get_nowait()["event"] == "state_changed"
+        assert expired_ids == [overdue.id]
+
+        await db_session.refresh(overdue)
+        assert overdue.state == ActivityState.EXPIRED
+        assert overdue.status == ActivityStatus.COMPLETED
+
+        assert await ActivityService.check_and_expire_activities(db_session) == []
+
+    async def test_get_framework_activity_status_service(
+        self, db_session: AsyncSession
+    ):
+        """Test framework status derives counts from the loaded responses."""
+        session, activity = await self._seed_status_data(db_session)
+
+        status_data = await ActivityService.get_framework_activity_status(
+            db=db_session, activity_id=activity.id
+        )
+
+        assert status_data["activity_id"] == activity.id
+        assert status_data["response_count"] == 2
+        assert status_data["last_response_at"] is not None
+        assert status_data["state"] == "draft"
+        assert status_data["valid_transitions"] == ["published"]
+
+        assert (
+            await ActivityService.get_framework_activity_status(
+                db=db_session, activity_id=uuid4()
+            )
+            is None
+        )
+
+    async def test_create_activity_missing_session_service(
+        self, db_session: AsyncSession
+    ):
+        """Test both create paths report a missing session as ValueError."""
+        with pytest.raises(ValueError, match="Session with id 99999 not found"):
+            await ActivityService.create_activity(
+                db=db_session,
+                session_id=99999,
+                activity_data=ActivityCreate(type="poll", config={}),
+            )
+
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            with pytest.raises(ValueError, match="Session with id 99999 not found"):
+                await ActivityService.create_framework_activity(
+                    db=db_session,
+                    session_id=99999,
+                    activity_type="poll",
+                    title="Orphan poll",
+                    configuration={"question": "Pick one", "options": ["A", "B"]},
+                )
+        finally:
+            registration.clear_registrations()
+
+    def test_get_activity_types_cached_until_registry_changes(self):
+        """Test the activity type list is reused until the registry changes."""
+        from app.services.activity_framework import ActivityRegistry, registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            types = ActivityService.get_activity_types()
+            assert {t["id"] for t in types} == {"poll", "qna", "word_cloud"}
+            assert ActivityService.get_activity_types() is types
+
+            ActivityRegistry.unregister("qna")
+            types = ActivityService.get_activity_types()
+            assert {t["id"] for t in types} == {"poll", "word_cloud"}
+        finally:
+            registration.clear_registrations()
+
+    async def test_get_activity_status_cached_until_write(
+        self, db_session: AsyncSession
+    ):
+        """Test polled status is cached and invalidated by activity writes."""
+        session, activity = await self._seed_status_data(db_session)
+
+        first = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+        second = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+        assert second is first
+        assert (
+            await ActivityService.get_activity_status(
+                db=db_session, session_id=session.id + 1, activity_id=activity.id
+            )
+            is None
+        )
+
+        await ActivityService.update_activity_status(
+            db=db_session, activity_id=activity.id, status=ActivityStatus.COMPLETED
+        )
+        refreshed = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+        assert refreshed is not first
+        assert refreshed["status"] == "completed"
+
+    async def test_get_activity_cached_until_write(self, db_session: AsyncSession):
+        """Test activity lookups are cached and dropped by updates."""
+        session, activity = await self._seed_status_data(db_session)
+
+        first = await ActivityService.get_activity(db_session, activity.id)
+        assert await ActivityService.get_activity(db_session, activity.id) is first
+
+        await ActivityService.update_activity(
+            db_session, activity.id, ActivityUpdate(order_index=5)
+        )
+        updated = await ActivityService.get_activity(db_session, activity.id)
+        assert updated is not first
+        assert updated.order_index == 5
+
+    async def test_get_active_activity_cached_until_write(
+        self, db_session: AsyncSession
+    ):
+        """Test the active activity lookup is cached per session until a write."""
+        session, activity = await self._seed_status_data(db_session)
+
+        first = await ActivityService.get_active_activity(
+            db=db_session, session_id=session.id
+        )
+        assert first.id == activity.id
+        assert (
+            await ActivityService.get_active_activity(
+                db=db_session, session_id=session.id
+            )
+            is first
+        )
+
+        await ActivityService.update_activity_status(
+            db=db_session, activity_id=activity.id, status=ActivityStatus.COMPLETED
+        )
+        assert (
+            await ActivityService.get_active_activity(
+                db=db_session, session_id=session.id
+            )
+            is None
+        )
+
+        created = await ActivityService.create_activity(
+            db=db_session,
+            session_id=session.id,
+            activity_data=ActivityCreate(
+                type="poll", config={}, order_index=1, status=ActivityStatus.ACTIVE
+            ),
+        )
+        active = await ActivityService.get_active_activity(
+            db=db_session, session_id=session.id
+        )
+        assert active.id == created.id
+
+    async def test_get_activity_results_cached_per_response_count(
+        self, db_session: AsyncSession
+    ):
+        """Test results are reused until the response count changes."""
+        from sqlalchemy import select
+
+        from app.db.models import UserResponse
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            session, activity = await self._seed_status_data(db_session)
+
+            first = await ActivityService.get_activity_results(
+                db=db_session, activity_id=activity.id
+            )
+            assert first["total_responses"] == 2
+            assert (
+                await ActivityService.get_activity_results(
+                    db=db_session, activity_id=activity.id
+                )
+                is first
+            )
+
+            # A response written outside the service still changes the count
+            participant_id = (
+                await db_session.execute(select(UserResponse.participant_id).limit(1))
+            ).scalar_one()
+            db_session.add(
+                UserResponse(
+                    session_id=session.id,
+                    activity_id=activity.id,
+                    participant_id=participant_id,
+                    response_data={"choice": 2},
+                )
+            )
+            await db_session.commit()
+
+            refreshed = await ActivityService.get_activity_results(
+                db=db_session, activity_id=activity.id
+            )
+            assert refreshed["total_responses"] == 3
+        finally:
+            registration.clear_registrations()
+
+    async def test_poll_results_tallied_in_database(self, db_session: AsyncSession):
+        """Test poll results from the SQL tally match the Python calculation."""
+        from datetime import datetime, timedelta, UTC
+
+        from sqlalchemy import select
+
+        from app.db.models import Activity as DBActivity, UserResponse
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            session, _ = await self._seed_status_data(db_session)
+            participant_id = (
+                await db_session.execute(select(UserResponse.participant_id).limit(1))
+            ).scalar_one()
+            poll = await ActivityService.create_framework_activity(
+                db=db_session,
+                session_id=session.id,
+                activity_type="poll",
+                title="Favourite",
+                configuration={"question": "Pick", "options": ["A", "B", "C"]},
+            )
+            # Inserted out of order, with timestamps of mixed JSON types, so
+            # the tally path must match calculate_results order and values
+            now = datetime.now(UTC)
+            db_session.add_all(
+                UserResponse(
+                    session_id=session.id,
+                    activity_id=poll.id,
+                    participant_id=participant_id,
+                    response_data=data,
+                    created_at=now + timedelta(seconds=offset),
+                )
+                for offset, data in (
+                    (3, {"selected_options": ["A"], "timestamp": "t1"}),
+                    (1, {"selected_options": ["A", "B"], "timestamp": 2}),
+                    (2, {"selected_options": ["Z"]}),
+                    (0, {"selected_options": ["C"], "timestamp": None}),
+                )
+            )
+            await db_session.commit()
+
+            assert await ActivityService.get_vote_tally(db_session, poll.id) == {
+                "A": 2,
+                "B": 1,
+                "C": 1,
+                "Z": 1,
+            }
+
+            results = await ActivityService.get_activity_results(
+                db=db_session, activity_id=poll.id
+            )
+            responses = (
+                await db_session.scalars(
+                    select(UserResponse)
+                    .where(UserResponse.activity_id == poll.id)
+                    .order_by(UserResponse.created_at, UserResponse.id)
+                )
+            ).all()
+            db_poll = await db_session.get(DBActivity, poll.id)
+            expected = ActivityService._calculate_results(db_poll, responses)
+
+            for result in (results, expected):
+                result.pop("last_updated")
+            assert results == expected
+            assert results["vote_counts"] == {"A": 2, "B": 1, "C": 1}
+            assert results["response_timestamps"] == [None, 2, "t1"]
+        finally:
+            registration.clear_registrations()
+
+    async def test_get_activity_results_without_responses(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Test results for an activity with no responses skip the tally."""
+        from app.services.activity_framework import registration
+
+        async def fail_tally(db, activity_id):
+            raise AssertionError("vote tally should not run without responses")
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            session, _ = await self._seed_status_data(db_session)
+            poll = await ActivityService.create_framework_activity(
+                db=db_session,
+                session_id=session.id,
+                activity_type="poll",
+                title="Favourite",
+                configuration={"question": "Pick", "options": ["A", "B"]},
+            )
+            monkeypatch.setattr(ActivityService, "get_vote_tally", fail_tally)
+
+            results = await ActivityService.get_activity_results(
+                db=db_session, activity_id=poll.id
+            )
+            assert results["total_responses"] == 0
+            assert results["vote_counts"] == {"A": 0, "B": 0}
+        finally:
+            registration.clear_registrations()
+
+    async def test_get_activity_results_streams_responses(
+        self, db_session: AsyncSession
+    ):
+        """Test non-poll results are calculated from streamed responses."""
+        from sqlalchemy import select
+
+        from app.db.models import UserResponse
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            session, _ = await self._seed_status_data(db_session)
+            participant_id = (
+                await db_session.execute(select(UserResponse.participant_id).limit(1))
+            ).scalar_one()
+            cloud = await ActivityService.create_activity(
+                db=db_session,
+                session_id=session.id,
+                activity_data=ActivityCreate(type="word_cloud", config={}),
+            )
+            db_session.add_all(
+                UserResponse(
+                    session_id=session.id,
+                    activity_id=cloud.id,
+                    participant_id=participant_id,
+                    response_data={"type": "word_submission", "words": words},
+                )
+                for words in (["fast", "async"], ["fast"])
+            )
+            await db_session.commit()
+
+            results = await ActivityService.get_activity_results(
+                db=db_session, activity_id=cloud.id
+            )
+            assert results["word_frequencies"] == {"fast": 2, "async": 1}
+            assert results["participant_count"] == 2
+        finally:
+            registration.clear_registrations()
+
+    async def test_activity_writes_publish_events(self, db_session: AsyncSession):
+        """Test activity writes notify live subscribers."""
+        from app.core.events import activity_events
+
+        session, activity = await self._seed_status_data(db_session)
+
+        async with activity_events.subscribe(activity.id) as queue:
+            await ActivityService.update_activity_status(
+                db=db_session, activity_id=activity.id, status=ActivityStatus.ACTIVE
+            )
+            await ActivityService.delete_activity(
+                db=db_session, activity_id=activity.id
+            )
+
+            assert queue.get_nowait() == {
+                "event": "updated",
+                "activity_id": str(activity.id),
+                "status": "active",
+            }
+            assert queue.get_nowait()["event"] == "deleted"
+
+    async def test_process_activity_response_service(self, db_session: AsyncSession):
+        """Test a processed framework response is stored for the activity."""
+        from sqlalchemy import func, select
+
+        from app.db.models import Activity as DBActivity, Participant, UserResponse
+        from app.services.activity_framework import registration
+
+        session, activity = await self._seed_status_data(db_session)
+        db_activity = await db_session.get(DBActivity, activity.id)
+        db_activity.state = "active"
+        db_activity.configuration = {"question": "Pick one", "options": ["A", "B"]}
+        participant = Participant(session_id=session.id, nickname="voter")
+        db_session.add(participant)
+        await db_session.commit()
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            processed = await ActivityService.process_activity_response(
+                db=db_session,
+                activity_id=activity.id,
+                participant_id=participant.id,
+                response_data={"selected_options": ["A"]},
+            )
+        finally:
+            registration.clear_registrations()
+
+        assert processed["selected_options"] == ["A"]
+        count = await db_session.scalar(
+            select(func.count(UserResponse.id)).where(
+                UserResponse.participant_id == participant.id
+            )
+        )
+        assert count == 1
+
+    async def test_get_activity_status_serves_stale_on_database_error(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Test an expired status entry is served when reloading it fails."""
+        from sqlalchemy.exc import OperationalError
+
+        from app.services import activity_service
+
+        session, activity = await self._seed_status_data(db_session)
+        first = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+
+        async def failing_load(db, activity_id):
+            raise OperationalError("SELECT", {}, Exception("database is down"))
+
+        monkeypatch.setattr(
+            activity_service._status_cache,
+            "get",
+            lambda key: None,
+        )
+        monkeypatch.setattr(
+            ActivityService, "_load_activity_status", staticmethod(failing_load)
+        )
+
+        stale = await ActivityService.get_activity_status(
+            db=db_session, session_id=session.id, activity_id=activity.id
+        )
+        assert stale is first
+
+        with pytest.raises(OperationalError):
+            await ActivityService.get_activity_status(
+                db=db_session, session_id=session.id, activity_id=uuid4()
+            )
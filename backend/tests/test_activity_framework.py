@@ -0,0 +1,504 @@
+"""
+Tests for the activity framework state machine and registry.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.enums import ActivityState, ActivityStatus, SessionStatus
+from app.db.models import Activity, Session
+from app.services.activity_framework import (
+    ActivityRegistry,
+    ActivityStateMachine,
+    BaseActivity,
+)
+from app.services.activity_framework.config_checks import compile_config_checker
+
+
+class TestActivityStateMachine:
+    """Test ActivityStateMachine behaviour."""
+
+    async def _create_session(self, db_session: AsyncSession) -> Session:
+        session = Session(
+            title="State Machine Session",
+            status=SessionStatus.ACTIVE,
+            qr_code="SMQR0001",
+            admin_code="SMADM1",
+        )
+        db_session.add(session)
+        await db_session.commit()
+        await db_session.refresh(session)
+        return session
+
+    async def test_expire_due_activities(self, db_session: AsyncSession):
+        """Test bulk expiration only touches active, overdue activities."""
+        session = await self._create_session(db_session)
+        now = datetime.utcnow()
+
+        overdue = Activity(
+            session_id=session.id,
+            type="poll",
+            order_index=0,
+            state=ActivityState.ACTIVE,
+            expires_at=now - timedelta(minutes=1),
+        )
+        not_due = Activity(
+            session_id=session.id,
+            type="poll",
+            order_index=1,
+            state=ActivityState.ACTIVE,
+            expires_at=now + timedelta(minutes=5),
+        )
+        no_expiry = Activity(
+            session_id=session.id,
+            type="poll",
+            order_index=2,
+            state=ActivityState.ACTIVE,
+        )
+        draft = Activity(
+            session_id=session.id,
+            type="poll",
+            order_index=3,
+            state=ActivityState.DRAFT,
+            expires_at=now - timedelta(minutes=1),
+        )
+        db_session.add_all([overdue, not_due, no_expiry, draft])
+        await db_session.commit()
+
+        expired = await ActivityStateMachine.expire_due_activities(db_session, now=now)
+        await db_session.commit()
+
+        assert [(row.id, row.session_id) for row in expired] == [
+            (overdue.id, session.id)
+        ]
+
+        result = await db_session.execute(
+            select(Activity.order_index, Activity.state, Activity.status).order_by(
+                Activity.order_index
+            )
+        )
+        rows = {index: (state, status) for index, state, status in result}
+        assert rows[0] == (ActivityState.EXPIRED, ActivityStatus.COMPLETED)
+        assert [rows[index][0] for index in (1, 2, 3)] == [
+            ActivityState.ACTIVE,
+            ActivityState.ACTIVE,
+            ActivityState.DRAFT,
+        ]
+
+    def test_check_expired_activities_logs_single_summary(self, caplog):
+        """Test the per-object sweep emits one INFO line regardless of size."""
+        past = datetime.utcnow() - timedelta(minutes=1)
+        activities = [
+            SimpleNamespace(
+                id=uuid4(),
+                state=ActivityState.ACTIVE,
+                expires_at=past,
+                updated_at=None,
+            )
+            for _ in range(5)
+        ]
+
+        with caplog.at_level(
+            logging.INFO, logger="app.services.activity_framework.state_machine"
+        ):
+            with pytest.warns(DeprecationWarning):
+                expired = ActivityStateMachine.check_expired_activities(activities)
+
+        assert len(expired) == 5
+        assert all(a.state == ActivityState.EXPIRED for a in activities)
+        info_messages = [
+            r.getMessage() for r in caplog.records if r.levelno == logging.INFO
+        ]
+        assert info_messages == ["Expired 5 activities"]
+
+    def test_validate_state_transition_request(self):
+        """Test transition request validation for valid and invalid moves."""
+        result = ActivityStateMachine.validate_state_transition_request(
+            ActivityState.PUBLISHED, "active", "poll", {}
+        )
+        assert result == {"valid": True, "errors": [], "warnings": []}
+
+        result = ActivityStateMachine.validate_state_transition_request(
+            "draft", "expired", "poll", {}
+        )
+        assert result["valid"] is False
+        assert result["errors"] == ["Invalid state transition: draft -> expired"]
+
+        result = ActivityStateMachine.validate_state_transition_request(
+            "bogus", "active", "poll", {}
+        )
+        assert result["valid"] is False
+
+    def test_transition_table(self):
+        """Test transition lookups and ordered state info."""
+        assert ActivityStateMachine.can_transition("published", "active")
+        assert not ActivityStateMachine.can_transition("expired", "active")
+        assert not ActivityStateMachine.can_transition("bogus", "active")
+
+        assert ActivityStateMachine.get_valid_transitions("published") == [
+            "active",
+            "draft",
+        ]
+
+        info = ActivityStateMachine.get_state_info()
+        assert info["transitions"]["published"] == ["active", "draft"]
+        assert info["terminal_states"] == ["expired"]
+
+
+class TestActivityRegistry:
+    """Test ActivityRegistry behaviour."""
+
+    def test_register_rejects_incomplete_activity_class(self):
+        """Test registering a class with unimplemented abstract methods fails."""
+
+        class IncompleteActivity(BaseActivity):
+            def validate_config(self, config):
+                return True
+
+            def get_schema(self):
+                return {}
+
+            def process_response(self, participant_id, response_data):
+                return response_data
+
+        with pytest.raises(ValueError, match="calculate_results"):
+            ActivityRegistry.register(
+                activity_type="incomplete",
+                activity_class=IncompleteActivity,
+                schema={},
+            )
+
+        assert not ActivityRegistry.is_registered("incomplete")
+
+    def test_validate_registrations_skips_already_validated(self, monkeypatch):
+        """Test repeated validation does not re-instantiate activity types."""
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+            assert len(registration._validated) == 3
+
+            calls = []
+            original = ActivityRegistry.create_activity.__func__
+
+            def counting_create(cls, *args, **kwargs):
+                calls.append(args[0])
+                return original(cls, *args, **kwargs)
+
+            monkeypatch.setattr(
+                ActivityRegistry, "create_activity", classmethod(counting_create)
+            )
+            registration._validate_registrations()
+            assert calls == []
+        finally:
+            registration.clear_registrations()
+
+        assert registration._validated == set()
+
+    def test_cached_validation_and_default_metadata(self):
+        """Test per-type validators and metadata are reused and invalidated."""
+        from app.services.activity_framework import registration
+
+        registration.clear_registrations()
+        try:
+            registration.register_activity_types()
+
+            assert ActivityRegistry.validate_config_static(
+                "poll", {"question": "Pick one", "options": ["A", "B"]}
+            )
+            assert not ActivityRegistry.validate_config_static("poll", {})
+            for invalid in (
+                {"question": "  ", "options": ["A", "B"]},
+                {"question": "Pick one", "options": ["A"]},
+                {"question": "Pick one", "options": ["A", ""]},
+                {"question": "Pick one", "options": ["A", "x" * 201]},
+                {"question": "Pick one", "options": ["A", "B"], "anonymous_voting": 1},
+            ):
+                assert not ActivityRegistry.validate_config_static("poll", invalid)
+
+            assert ActivityRegistry.validate_config_static(
+                "word_cloud", {"prompt": "One word", "banned_words": ["spam"]}
+            )
+            for invalid in (
+                {"prompt": "  "},
+                {"prompt": "One word", "max_word_length": 2},
+                {"prompt": "One word", "banned_words": [" "]},
+            ):
+                assert not ActivityRegistry.validate_config_static(
+                    "word_cloud", invalid
+                )
+
+            assert ActivityRegistry.validate_config_static("qna", {"topic": "Ask"})
+            for invalid in (
+                {"topic": "x" * 201},
+                {"topic": "Ask", "max_question_length": 5},
+                {"topic": "Ask", "enable_voting": "yes"},
+            ):
+                assert not ActivityRegistry.validate_config_static("qna", invalid)
+            validator = ActivityRegistry._validators["poll"]
+            ActivityRegistry.validate_config_static("poll", {})
+            assert ActivityRegistry._validators["poll"] is validator
+
+            # Results are memoized by config content, regardless of key order
+            calls = []
+            original = validator.validate_config
+            validator.validate_config = lambda config: calls.append(config) or True
+            assert not ActivityRegistry.validate_config_static("poll", {})
+            assert ActivityRegistry.validate_config_static(
+                "poll", {"options": ["A", "B"], "question": "Pick one"}
+            )
+            assert calls == []
+            validator.validate_config = original
+
+            metadata = ActivityRegistry.get_default_metadata("poll")
+            assert metadata["activity_type"] == "poll"
+            assert ActivityRegistry.get_default_metadata("poll") is metadata
+            for activity_type in ("word_cloud", "qna"):
+                metadata = ActivityRegistry.get_default_metadata(activity_type)
+                assert metadata["activity_type"] == activity_type
+                with pytest.raises(TypeError):
+                    metadata["max_responses"] = 1
+
+            ActivityRegistry.unregister("poll")
+            assert "poll" not in ActivityRegistry._validators
+            assert "poll" not in ActivityRegistry._default_metadata
+            with pytest.raises(ValueError, match="Unknown activity type"):
+                ActivityRegistry.validate_config_static("poll", {})
+        finally:
+            registration.clear_registrations()
+
+
+class TestConfigChecker:
+    """Test the schema-driven config checker shared by activity types."""
+
+    SCHEMA = {
+        "properties": {
+            "title": {"type": "string", "maxLength": 5},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 3},
+            "enabled": {"type": "boolean"},
+        },
+        "required": ["title"],
+    }
+
+    def test_generic_checks(self):
+        """Test required, string, integer and boolean fields are checked."""
+        check = compile_config_checker(self.SCHEMA)
+
+        assert check({"title": "ok", "limit": 2, "enabled": True}) is None
+        assert check([]) == "config must be an object"
+        assert check({}) == "missing 'title' field"
+        assert check({"title": " "}) == "title must be a non-empty string"
+        assert check({"title": "too long"}) == (
+            "title exceeds maximum length of 5 characters"
+        )
+        assert check({"title": "ok", "limit": 4}) == (
+            "limit must be integer between 1 and 3"
+        )
+        assert check({"title": "ok", "enabled": "yes"}) == (
+            "field 'enabled' must be boolean"
+        )
+
+    def test_extra_checks_run_after_generic_checks(self):
+        """Test type-specific checks only see structurally valid configs."""
+        seen = []
+
+        def no_ok_title(config):
+            seen.append(config)
+            return "title must not be ok" if config["title"] == "ok" else None
+
+        check = compile_config_checker(self.SCHEMA, no_ok_title)
+
+        assert check({}) == "missing 'title' field"
+        assert seen == []
+        assert check({"title": "ok"}) == "title must not be ok"
+        assert check({"title": "fine"}) is None
+
+
+class TestPollingActivity:
+    """Test PollingActivity result aggregation."""
+
+    def test_calculate_results(self):
+        """Test votes are tallied per option and unknown options are ignored."""
+        from app.services.activity_types.polling import PollingActivity
+
+        activity = PollingActivity(
+            uuid4(), {"question": "Pick", "options": ["A", "B", "C"]}
+        )
+        responses = [
+            {"response_data": {"selected_options": ["A"], "timestamp": "t1"}},
+            {"response_data": {"selected_options": ["A", "B"]}},
+            {"response_data": {"selected_options": ["Z"]}},
+            {"response_data": None},
+        ]
+
+        results = activity.calculate_results(responses)
+
+        assert results["vote_counts"] == {"A": 2, "B": 1, "C": 0}
+        assert results["percentages"] == {"A": 50.0, "B": 25.0, "C": 0.0}
+        assert results["total_responses"] == 4
+        assert results["most_popular"] == ["A"]
+        assert results["response_timestamps"] == ["t1"]
+
+        empty = activity.calculate_results([])
+        assert empty["percentages"] == {"A": 0.0, "B": 0.0, "C": 0.0}
+
+    def test_process_response_validates_selection(self):
+        """Test selections are checked against the configured options."""
+        from app.services.activity_types.polling import PollingActivity
+
+        activity = PollingActivity(
+            uuid4(),
+            {"question": "Pick", "options": ["A", "B"], "anonymous_voting": False},
+        )
+
+        processed = activity.process_response(7, {"selected_options": ["B"]})
+        assert processed["selected_options"] == ["B"]
+        assert processed["anonymous"] is False
+        assert processed["participant_info"] == {"id": 7}
+
+        with pytest.raises(ValueError, match="Invalid option selected: 'C'"):
+            activity.process_response(7, {"selected_options": ["A", "C"]})
+        with pytest.raises(ValueError, match="Multiple choices not allowed"):
+            activity.process_response(7, {"selected_options": ["A", "B"]})
+
+
+class TestWordCloudActivity:
+    """Test WordCloudActivity word processing."""
+
+    def test_process_word_normalizes_submissions(self):
+        """Test words are lowercased and stripped of special characters."""
+        from app.services.activity_types.word_cloud import WordCloudActivity
+
+        activity = WordCloudActivity(
+            uuid4(), {"prompt": "Describe it", "allow_phrases": True}
+        )
+
+        assert activity._process_word("  Hello!  ") == "hello"
+        assert activity._process_word("well ! done") == "well done"
+        assert activity._process_word("Café-au_lait") == "café-au_lait"
+        assert activity._process_word("日本\t語!") == "日本 語"
+        with pytest.raises(ValueError, match="becomes empty"):
+            activity._process_word("?!")
+
+    def test_process_word_rejects_banned_words(self):
+        """Test banned words are matched case-insensitively."""
+        from app.services.activity_types.word_cloud import WordCloudActivity
+
+        activity = WordCloudActivity(
+            uuid4(),
+            {
+                "prompt": "Describe it",
+                "allow_phrases": True,
+                "case_sensitive": True,
+                "banned_words": ["Spam"],
+            },
+        )
+
+        assert activity._process_word("Eggs") == "Eggs"
+        for word in ("spam", "SPAM!", "no Spam please"):
+            with pytest.raises(ValueError, match="is not allowed"):
+                activity._process_word(word)
+
+    def test_calculate_results(self):
+        """Test only approved submissions are counted."""
+        from app.services.activity_types.word_cloud import WordCloudActivity
+
+        activity = WordCloudActivity(uuid4(), {"prompt": "Describe it"})
+        submission = {"type": "word_submission", "status": "approved"}
+        responses = [
+            {
+                "response_data": {
+                    **submission,
+                    "words": ["fast", "fun"],
+                    "timestamp": "t",
+                }
+            },
+            {"response_data": {**submission, "words": ["fast"]}},
+            {"response_data": {**submission, "words": ["slow"], "status": "pending"}},
+        ]
+
+        results = activity.calculate_results(responses)
+
+        assert results["word_frequencies"] == {"fast": 2, "fun": 1}
+        assert results["total_word_submissions"] == 3
+        assert results["participant_count"] == 2
+        assert results["submission_timestamps"] == ["t"]
+        assert results["word_cloud_data"][0] == {
+            "word": "fast",
+            "frequency": 2,
+            "size": 100,
+            "percentage": 66.7,
+        }
+
+
+class TestQnaActivity:
+    """Test QnaActivity result aggregation."""
+
+    def _responses(self) -> list[dict]:
+        question = {"type": "question", "question_text": "Why?", "status": "approved"}
+        votes = [("q2", 3), ("q2", 3), ("q1", 4), ("q9", 4)]
+        return [
+            {"response_data": {**question, "question_id": "q1", "participant_id": 1}},
+            {"response_data": {**question, "question_id": "q2", "participant_id": 2}},
+        ] + [
+            {"response_data": {"type": "vote", "question_id": q, "participant_id": p}}
+            for q, p in votes
+        ]
+
+    def test_calculate_results_counts_unique_voters(self):
+        """Test repeat votes by one participant count once by default."""
+        from app.services.activity_types.qna import QnaActivity
+
+        results = QnaActivity(uuid4(), {"topic": "AMA"}).calculate_results(
+            self._responses()
+        )
+
+        assert results["total_questions"] == 2
+        assert results["total_votes"] == 4
+        counts = {q["id"]: q["vote_count"] for q in results["approved_questions"]}
+        assert counts == {"q1": 1, "q2": 1}
+        assert results["approved_questions"][1]["voters"] == [3]
+
+    def test_calculate_results_allows_multiple_votes(self):
+        """Test every vote counts when multiple votes are allowed."""
+        from app.services.activity_types.qna import QnaActivity
+
+        activity = QnaActivity(uuid4(), {"topic": "AMA", "allow_multiple_votes": True})
+        results = activity.calculate_results(self._responses())
+
+        assert [q["id"] for q in results["approved_questions"]] == ["q2", "q1"]
+        assert results["most_popular_question"]["vote_count"] == 2
+        assert results["most_popular_question"]["voters"] == [3, 3]
+
+    def test_calculate_results_hides_pending_when_moderated(self):
+        """Test pending questions are only listed without moderation."""
+        from app.services.activity_types.qna import QnaActivity
+
+        responses = self._responses()
+        responses[0]["response_data"]["status"] = "pending"
+
+        results = QnaActivity(uuid4(), {"topic": "AMA"}).calculate_results(responses)
+        assert [q["id"] for q in results["pending_questions"]] == ["q1"]
+        assert [q["id"] for q in results["approved_questions"]] == ["q2"]
+
+        moderated = QnaActivity(uuid4(), {"topic": "AMA", "moderate_questions": True})
+        assert moderated.calculate_results(responses)["pending_questions"] == []
+
+    def test_question_ids_unique_within_same_millisecond(self):
+        """Test rapid submissions by one participant get distinct IDs."""
+        from app.services.activity_types.qna import QnaActivity
+
+        activity = QnaActivity(uuid4(), {"topic": "AMA"})
+        submission = {"type": "question", "question_text": "Why?"}
+        question_ids = {
+            activity.process_response(1, submission)["question_id"] for _ in range(50)
+        }
+
+        assert len(question_ids) == 50
@@ -0,0 +1,52 @@
+"""
+Tests for in-process caching helpers.
+"""
+
+from app.core import cache
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test values are returned until their TTL elapses."""
+        now = [100.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+        ttl_cache = TTLCache(ttl_seconds=1.0)
+        ttl_cache.set("key", {"value": 1})
+        assert ttl_cache.get("key") == {"value": 1}
+
+        now[0] += 1.0
+        assert ttl_cache.get("key") is None
+        assert ttl_cache.get_stale("key") == {"value": 1}
+        assert ttl_cache.get_stale("missing") is None
+
+    def test_delete_and_clear(self):
+        """Test explicit invalidation."""
+        ttl_cache = TTLCache(ttl_seconds=60)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+
+        ttl_cache.delete("a")
+        ttl_cache.delete("missing")
+        assert ttl_cache.get("a") is None
+        assert ttl_cache.get("b") == 2
+
+        ttl_cache.clear()
+        assert ttl_cache.get("b") is None
+
+    def test_purges_expired_entries_when_full(self, monkeypatch):
+        """Test the cache stays bounded by dropping expired entries."""
+        now = [0.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+        ttl_cache = TTLCache(ttl_seconds=1.0, max_entries=2)
+        ttl_cache.set("old", 1)
+        now[0] += 0.5
+        ttl_cache.set("fresh", 2)
+        now[0] += 0.6
+        ttl_cache.set("new", 3)
+
+        assert ttl_cache._entries.keys() == {"fresh", "new"}
@@ -0,0 +1,74 @@
+"""
+Tests for in-process event publishing.
+"""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.core.events import EventBroker, activity_events
+
+
+class TestEventBroker:
+    """Test EventBroker behaviour."""
+
+    async def test_publish_reaches_channel_subscribers_only(self):
+        """Test events are delivered to subscribers of the same channel."""
+        broker = EventBroker()
+
+        async with broker.subscribe("a") as queue_a, broker.subscribe("b") as queue_b:
+            assert broker.publish("a", {"event": "ping"}) == 1
+            assert queue_a.get_nowait() == {"event": "ping"}
+            assert queue_b.empty()
+
+        assert broker.subscriber_count("a") == 0
+        assert broker.publish("a", {"event": "ping"}) == 0
+
+    async def test_full_queue_drops_oldest_event(self):
+        """Test slow subscribers never block publishers."""
+        broker = EventBroker(max_queue_size=2)
+
+        async with broker.subscribe("a") as queue:
+            for index in range(3):
+                broker.publish("a", {"index": index})
+
+            assert queue.get_nowait() == {"index": 1}
+            assert queue.get_nowait() == {"index": 2}
+
+
+def test_activity_events_socket_pushes_published_events():
+    """Test the WebSocket endpoint forwards events for its activity."""
+    from app.main import app
+
+    activity_id = uuid4()
+    client = TestClient(app)
+    with client.websocket_connect(f"/api/v1/activities/{activity_id}/events") as ws:
+        ws.send_text("hello")
+        delivered = ws.portal.call(
+            activity_events.publish, activity_id, {"event": "response_received"}
+        )
+        assert delivered == 1
+        assert ws.receive_json() == {"event": "response_received"}
+
+    assert activity_events.subscriber_count(activity_id) == 0
+
+
+async def test_activity_events_stream_formats_server_sent_events(monkeypatch):
+    """Test the SSE endpoint frames published events and keepalives."""
+    from app.core.settings import settings
+    from app.routes.activities import activity_events_stream
+
+    monkeypatch.setattr(settings, "event_keepalive_seconds", 0.01)
+    activity_id = uuid4()
+    response = await activity_events_stream(activity_id)
+    stream = response.body_iterator
+
+    assert response.media_type == "text/event-stream"
+    assert await anext(stream) == ": keepalive\n\n"
+    activity_events.publish(activity_id, {"event": "response_received"})
+    assert await anext(stream) == (
+        'event: response_received\ndata: {"event": "response_received"}\n\n'
+    )
+
+    await stream.aclose()
+    assert activity_events.subscriber_count(activity_id) == 0
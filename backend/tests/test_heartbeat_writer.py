@@ -0,0 +1,76 @@
+"""
+Tests for the batched heartbeat writer.
+"""
+
+import asyncio
+from datetime import datetime, UTC
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.models import Participant, Session
+from app.services.heartbeat_writer import HeartbeatWriter
+
+
+async def _seed(db):
+    session = Session(title="Beat Session", qr_code="HBQR0001", admin_code="HBADM1")
+    db.add(session)
+    await db.flush()
+    participants = [
+        Participant(session_id=session.id, nickname=f"beat{i}") for i in range(5)
+    ]
+    db.add_all(participants)
+    await db.commit()
+    return session, participants
+
+
+class TestHeartbeatWriter:
+    """Test HeartbeatWriter batching."""
+
+    async def test_concurrent_beats_share_one_commit(self, file_engine):
+        """Test simultaneous heartbeats are written in a single transaction."""
+        commits = []
+        event.listen(
+            file_engine.sync_engine, "commit", lambda conn: commits.append(conn)
+        )
+
+        writer = HeartbeatWriter(max_wait=0.05)
+        now = datetime.now(UTC)
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, participants = await _seed(db)
+            commits.clear()
+            session_ids = await asyncio.gather(
+                *(
+                    writer.write(
+                        db,
+                        participant_id=participant.id,
+                        last_seen=now,
+                        connection_data={"screen": participant.nickname},
+                    )
+                    for participant in participants
+                )
+            )
+            stored = await db.get(
+                Participant, participants[3].id, populate_existing=True
+            )
+
+        assert session_ids == [session.id] * 5
+        assert stored.connection_data == {"screen": "beat3"}
+        assert len(commits) == 1
+        assert writer._queues == {}
+
+    async def test_unknown_participant_fails_only_its_producer(self, file_engine):
+        """Test a missing participant does not fail the rest of the batch."""
+        writer = HeartbeatWriter(max_wait=0.05)
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, participants = await _seed(db)
+            results = await asyncio.gather(
+                writer.write(
+                    db, participant_id=participants[0].id, last_seen=datetime.now(UTC)
+                ),
+                writer.write(db, participant_id=99999, last_seen=datetime.now(UTC)),
+                return_exceptions=True,
+            )
+
+        assert results[0] == session.id
+        assert isinstance(results[1], ValueError)
@@ -5,6 +5,11 @@ Unit tests for ParticipantService.
 from datetime import datetime, timedelta, UTC
 from uuid import uuid4
 
+import pytest
+
+from app.db.enums import ActivityStatus, SessionStatus
+from app.db.models import Activity, Participant, Session
+from app.models.schemas import ParticipantHeartbeatRequest, ParticipantJoinRequest
 from app.services.participant_service import ParticipantService
 
 
@@ -112,6 +117,161 @@ class TestIntegrationWithRealDB:
         assert result is False
 
 
+class TestJoinSession:
+    """Test joining sessions against the database."""
+
+    async def _create_session(self, db_session, max_participants: int = 100):
+        session = Session(
+            title="Join Session",
+            status=SessionStatus.ACTIVE,
+            qr_code="JOINQR01",
+            admin_code="JOINAD",
+            max_participants=max_participants,
+        )
+        db_session.add(session)
+        await db_session.commit()
+        return session
+
+    async def test_join_session(self, db_session):
+        """Test a participant joins and gets the current session state."""
+        session = await self._create_session(db_session)
+        service = ParticipantService(db_session)
+
+        response = await service.join_session(
+            session.id, ParticipantJoinRequest(nickname="alice")
+        )
+
+        assert response.participant_id
+        assert response.session_state["session_title"] == "Join Session"
+        assert response.session_state["participant_count"] == 1
+        assert response.session_state["current_activity"] is None
+        participant = await db_session.get(Participant, int(response.participant_id))
+        assert participant.display_name == "alice"
+
+    async def test_join_session_suggests_free_nickname(self, db_session):
+        """Test a taken nickname is replaced by the first free suggestion."""
+        session = await self._create_session(db_session)
+        service = ParticipantService(db_session)
+        for nickname in ("bob", "bob1"):
+            request = ParticipantJoinRequest(nickname=nickname)
+            await service.join_session(session.id, request)
+
+        request = ParticipantJoinRequest(nickname="bob")
+        response = await service.join_session(session.id, request)
+
+        assert request.nickname == "bob2"
+        assert response.session_state["participant_count"] == 3
+
+    async def test_nickname_suggestion_respects_max_length(self, db_session):
+        """Test no suggestion is made when every candidate is too long."""
+        session = await self._create_session(db_session)
+        service = ParticipantService(db_session)
+        for nickname in ("x" * 49, "y" * 50):
+            request = ParticipantJoinRequest(nickname=nickname)
+            await service.join_session(session.id, request)
+
+        assert (
+            await service._generate_nickname_suggestion(session.id, "x" * 49)
+            == "x" * 49 + "1"
+        )
+        assert await service._generate_nickname_suggestion(session.id, "y" * 50) is None
+        with pytest.raises(ValueError, match="no alternatives found"):
+            await service.join_session(
+                session.id, ParticipantJoinRequest(nickname="y" * 50)
+            )
+
+    async def test_join_session_rejects_full_or_missing_session(self, db_session):
+        """Test joining fails for a full or unknown session."""
+        session = await self._create_session(db_session, max_participants=1)
+        service = ParticipantService(db_session)
+        await service.join_session(session.id, ParticipantJoinRequest(nickname="a"))
+
+        with pytest.raises(ValueError, match="Session is full"):
+            await service.join_session(session.id, ParticipantJoinRequest(nickname="b"))
+        with pytest.raises(ValueError, match="Session not found"):
+            await service.join_session(999, ParticipantJoinRequest(nickname="b"))
+
+    async def test_join_and_heartbeat_include_active_activity(self, db_session):
+        """Test join and heartbeat report the session's active activity."""
+        session = await self._create_session(db_session)
+        activity = Activity(
+            session_id=session.id,
+            type="poll",
+            config={"question": "Pick", "instructions": "Vote now"},
+            order_index=0,
+            status=ActivityStatus.ACTIVE,
+        )
+        db_session.add(activity)
+        await db_session.commit()
+        service = ParticipantService(db_session)
+
+        response = await service.join_session(
+            session.id, ParticipantJoinRequest(nickname="carol")
+        )
+        assert response.session_state["current_activity"] == {
+            "id": str(activity.id),
+            "type": "poll",
+            "config": {"question": "Pick", "instructions": "Vote now"},
+        }
+
+        heartbeat = await service.update_heartbeat(
+            int(response.participant_id),
+            ParticipantHeartbeatRequest(activity_context={"screen": "poll"}),
+        )
+        assert heartbeat.status == "online"
+        assert heartbeat.activity_context["activity_id"] == str(activity.id)
+        assert heartbeat.activity_context["instructions"] == "Vote now"
+        participant = await db_session.get(Participant, int(response.participant_id))
+        assert participant.connection_data == {"screen": "poll"}
+
+    async def test_join_reports_most_recently_updated_activity(self, db_session):
+        """Test join picks the same active activity as get_active_activity."""
+        session = await self._create_session(db_session)
+        now = datetime.now(UTC)
+        stale, current = (
+            Activity(
+                session_id=session.id,
+                type="poll",
+                config={"question": question},
+                order_index=index,
+                status=ActivityStatus.ACTIVE,
+                updated_at=now - timedelta(minutes=minutes),
+            )
+            for index, (question, minutes) in enumerate((("Old", 10), ("New", 1)))
+        )
+        db_session.add_all([stale, current])
+        await db_session.commit()
+
+        response = await ParticipantService(db_session).join_session(
+            session.id, ParticipantJoinRequest(nickname="dave")
+        )
+
+        assert response.session_state["current_activity"]["id"] == str(current.id)
+
+    async def test_get_session_participants_computes_status(self, db_session):
+        """Test participants are classified by how recently they were seen."""
+        session = await self._create_session(db_session)
+        now = datetime.now(UTC)
+        for nickname, seconds_ago in (("on", 5), ("idle", 60), ("gone", 600)):
+            db_session.add(
+                Participant(
+                    session_id=session.id,
+                    nickname=nickname,
+                    last_seen=now - timedelta(seconds=seconds_ago),
+                )
+            )
+        await db_session.commit()
+        service = ParticipantService(db_session)
+
+        participants = await service.get_session_participants(session.id)
+
+        assert {p.nickname: p.status for p in participants} == {
+            "on": "online",
+            "idle": "idle",
+            "gone": "disconnected",
+        }
+
+
 class TestServiceMethods:
     """Test that service methods are properly structured."""
 
@@ -0,0 +1,114 @@
+"""
+Tests for the batched response writer.
+"""
+
+import asyncio
+
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.enums import ActivityStatus
+from app.db.models import Activity, Participant, Session, UserResponse
+from app.services.response_writer import ResponseWriter
+
+
+async def _seed(db):
+    session = Session(title="Writer Session", qr_code="WRQR0001", admin_code="WRADM1")
+    db.add(session)
+    await db.flush()
+    activity = Activity(
+        session_id=session.id, type="poll", order_index=0, status=ActivityStatus.ACTIVE
+    )
+    participants = [
+        Participant(session_id=session.id, nickname=f"voter{i}") for i in range(5)
+    ]
+    db.add(activity)
+    db.add_all(participants)
+    await db.commit()
+    return session, activity, participants
+
+
+class TestResponseWriter:
+    """Test ResponseWriter batching."""
+
+    async def test_concurrent_writes_share_one_insert(self, file_engine):
+        """Test simultaneous responses for an activity are inserted together."""
+        inserts = []
+
+        @event.listens_for(file_engine.sync_engine, "before_cursor_execute")
+        def count_inserts(conn, cursor, statement, *args):
+            if statement.startswith("INSERT INTO user_responses"):
+                inserts.append(statement)
+
+        writer = ResponseWriter(max_wait=0.05)
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, activity, participants = await _seed(db)
+            ids = await asyncio.gather(
+                *(
+                    writer.write(
+                        db,
+                        session_id=session.id,
+                        activity_id=activity.id,
+                        participant_id=participant.id,
+                        response_data={"choice": "A"},
+                    )
+                    for participant in participants
+                )
+            )
+            count = await db.scalar(select(func.count(UserResponse.id)))
+
+        assert len(set(ids)) == 5
+        assert count == 5
+        assert len(inserts) == 1
+        assert writer._queues == {}
+
+    async def test_invalid_row_fails_only_its_producer(self, file_engine):
+        """Test a constraint violation does not discard the rest of the batch."""
+        writer = ResponseWriter(max_wait=0.05)
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, activity, participants = await _seed(db)
+            results = await asyncio.gather(
+                writer.write(
+                    db,
+                    session_id=session.id,
+                    activity_id=activity.id,
+                    participant_id=participants[0].id,
+                    response_data={"choice": "A"},
+                ),
+                writer.write(
+                    db,
+                    session_id=session.id,
+                    activity_id=activity.id,
+                    participant_id=99999,
+                    response_data={"choice": "B"},
+                ),
+                return_exceptions=True,
+            )
+            count = await db.scalar(select(func.count(UserResponse.id)))
+
+        assert not isinstance(results[0], Exception)
+        assert isinstance(results[1], IntegrityError)
+        assert count == 1
+
+    async def test_flush_waits_for_queued_responses(self, file_engine):
+        """Test flush returns only once every queued response is committed."""
+        writer = ResponseWriter(max_wait=0.05)
+        async with async_sessionmaker(file_engine, expire_on_commit=False)() as db:
+            session, activity, participants = await _seed(db)
+            for participant in participants:
+                asyncio.ensure_future(
+                    writer.write(
+                        db,
+                        session_id=session.id,
+                        activity_id=activity.id,
+                        participant_id=participant.id,
+                        response_data={"choice": "A"},
+                    )
+                )
+            await asyncio.sleep(0)
+            await writer.flush()
+            count = await db.scalar(select(func.count(UserResponse.id)))
+
+        assert count == 5
+        assert writer._queues == {}
@@ -2,10 +2,13 @@
 Simplified tests for session management functionality.
 """
 
+import pytest
 from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.enums import SessionStatus
+from app.db.models import Activity, Participant
 from app.models.schemas import SessionCreate
 from app.services.session_service import SessionService
 
@@ -117,6 +120,55 @@ class TestSessionService:
         assert session.qr_code is not None
         assert session.admin_code is not None
 
+    def test_generate_code(self):
+        """Test codes have the requested length and use only the alphabet."""
+        codes = [SessionService._generate_code(8) for _ in range(50)]
+
+        assert all(len(code) == 8 for code in codes)
+        assert all(code.isalnum() and code == code.upper() for code in codes)
+        assert len(set(codes)) == 50
+
+    async def test_create_session_regenerates_colliding_codes(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Test a code collision on insert is retried with fresh codes."""
+        session_data = SessionCreate(title="Collision Session")
+        first = await SessionService.create_session(db_session, session_data)
+
+        codes = iter([first.qr_code, "ADMIN2", "QRCODE02", "ADMIN3"])
+        monkeypatch.setattr(
+            SessionService, "_generate_code", staticmethod(lambda length: next(codes))
+        )
+        second = await SessionService.create_session(db_session, session_data)
+
+        assert (second.qr_code, second.admin_code) == ("QRCODE02", "ADMIN3")
+
+        monkeypatch.setattr(
+            SessionService, "_generate_code", staticmethod(lambda length: "SAME")
+        )
+        await SessionService.create_session(db_session, session_data)
+        with pytest.raises(ValueError, match="unique session codes"):
+            await SessionService.create_session(db_session, session_data)
+
+    async def test_create_session_reraises_other_integrity_errors(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Test integrity errors unrelated to the codes are not retried."""
+        attempts = []
+
+        async def failing_commit():
+            attempts.append(1)
+            raise IntegrityError(
+                "INSERT INTO sessions", {}, Exception("NOT NULL constraint failed")
+            )
+
+        monkeypatch.setattr(db_session, "commit", failing_commit)
+        with pytest.raises(IntegrityError):
+            await SessionService.create_session(
+                db_session, SessionCreate(title="Broken Session")
+            )
+        assert len(attempts) == 1
+
     async def test_get_session_service(self, db_session: AsyncSession):
         """Test getting a session via service layer."""
         # Create session first
@@ -178,3 +230,25 @@ class TestSessionService:
         assert stats["participant_count"] == 0
         assert stats["activity_count"] == 0
         assert stats["status"] == SessionStatus.DRAFT
+        assert await SessionService.get_session_stats(db_session, 999999) == {}
+
+    async def test_list_sessions_includes_counts(self, db_session: AsyncSession):
+        """Test listed sessions carry their participant and activity counts."""
+        session = await SessionService.create_session(
+            db_session, SessionCreate(title="Counted Session")
+        )
+        db_session.add_all(
+            [
+                Participant(session_id=session.id, nickname="one"),
+                Participant(session_id=session.id, nickname="two"),
+                Activity(session_id=session.id, type="poll", order_index=0),
+            ]
+        )
+        await db_session.commit()
+
+        (row,) = await SessionService.list_sessions(db_session)
+
+        assert row.id == session.id
+        assert row.title == "Counted Session"
+        assert row.participant_count == 2
+        assert row.activity_count == 1
@@ -1,8 +1,13 @@
 """Tests for real-time status polling endpoints."""
 
+import asyncio
 from datetime import datetime, UTC
+from types import SimpleNamespace
+import time
 
 import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import (
@@ -63,9 +68,9 @@ class TestStatusPolling:
         assert activity1.status == ActivityStatus.ACTIVE
         assert activity2.status == ActivityStatus.DRAFT
 
-    async def test_activity_status_polling(self, db_session: AsyncSession):
-        """Test activity status endpoint returns real-time data."""
-        # Create session and activity
+    @pytest.fixture
+    async def seed(self, db_session: AsyncSession):
+        """Create an active session with an active activity and two participants."""
         session = Session(
             title="Test Session",
             description="Test description",
@@ -87,29 +92,30 @@ class TestStatusPolling:
             order_index=1,
             status=ActivityStatus.ACTIVE,
         )
-        db_session.add(activity)
+        participants = [
+            Participant(session_id=session.id, display_name=name, role="participant")
+            for name in ("User 1", "User 2")
+        ]
+        db_session.add_all([activity, *participants])
         await db_session.flush()
-
-        # Create participants first
-        participant1 = Participant(
-            session_id=session.id, display_name="User 1", role="participant"
-        )
-        participant2 = Participant(
-            session_id=session.id, display_name="User 2", role="participant"
+        return SimpleNamespace(
+            session=session, activity=activity, participants=participants
         )
-        db_session.add_all([participant1, participant2])
-        await db_session.flush()
+
+    async def test_activity_status_polling(self, db_session: AsyncSession, seed):
+        """Test activity status endpoint returns real-time data."""
+        participant1, participant2 = seed.participants
 
         # Create some user responses using participant IDs
         response1 = UserResponse(
-            session_id=session.id,
-            activity_id=activity.id,
+            session_id=seed.session.id,
+            activity_id=seed.activity.id,
             participant_id=participant1.id,  # Use integer ID
             response_data={"card_value": 5, "confidence": "high"},
         )
         response2 = UserResponse(
-            session_id=session.id,
-            activity_id=activity.id,
+            session_id=seed.session.id,
+            activity_id=seed.activity.id,
             participant_id=participant2.id,  # Use integer ID
             response_data={"card_value": 8, "confidence": "medium"},
         )
@@ -118,50 +124,20 @@ class TestStatusPolling:
         await db_session.commit()
 
         # Verify test data
-        assert activity.id is not None
+        assert seed.activity.id is not None
         assert response1.id is not None
         assert response2.id is not None
 
-    async def test_incremental_response_updates(self, db_session: AsyncSession):
+    async def test_incremental_response_updates(self, db_session: AsyncSession, seed):
         """Test incremental response updates endpoint."""
-        # Create session and activity
-        session = Session(
-            title="Test Session",
-            description="Test description",
-            qr_code="TEST9999",
-            admin_code="ADMIN789",
-            max_participants=10,
-            status=SessionStatus.ACTIVE,
-        )
-        db_session.add(session)
-        await db_session.flush()
-
-        activity = Activity(
-            session_id=session.id,
-            type="survey",
-            config={"questions": [{"id": 1, "text": "Rate this feature"}]},
-            order_index=1,
-            status=ActivityStatus.ACTIVE,
-        )
-        db_session.add(activity)
-        await db_session.flush()
-
-        # Create participants first
-        participant1 = Participant(
-            session_id=session.id, display_name="User 1", role="participant"
-        )
-        participant2 = Participant(
-            session_id=session.id, display_name="User 2", role="participant"
-        )
-        db_session.add_all([participant1, participant2])
-        await db_session.flush()
+        participant1, participant2 = seed.participants
 
         # Create initial responses with different timestamps
         base_time = datetime.now(UTC)
 
         response1 = UserResponse(
-            session_id=session.id,
-            activity_id=activity.id,
+            session_id=seed.session.id,
+            activity_id=seed.activity.id,
             participant_id=participant1.id,  # Use integer ID
             response_data={"rating": 5, "comment": "Great!"},
             created_at=base_time,
@@ -171,8 +147,8 @@ class TestStatusPolling:
 
         # Create additional response later
         response2 = UserResponse(
-            session_id=session.id,
-            activity_id=activity.id,
+            session_id=seed.session.id,
+            activity_id=seed.activity.id,
             participant_id=participant2.id,  # Use integer ID
             response_data={"rating": 4, "comment": "Good"},
         )
@@ -184,3 +160,48 @@ class TestStatusPolling:
         assert response2.id is not None
         assert response1.created_at is not None
         assert response2.created_at is not None
+
+    async def test_polling_performance(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test polling endpoints performance with multiple requests."""
+        session = Session(
+            title="Test Session",
+            qr_code="TEST9012",
+            admin_code="ADMIN789",
+            status=SessionStatus.ACTIVE,
+        )
+        db_session.add(session)
+        await db_session.flush()
+
+        # Create multiple participants in one executemany INSERT
+        rows = [
+            {
+                "session_id": session.id,
+                "nickname": f"Participant {i}",
+                "display_name": f"Participant {i}",
+                "role": "participant",
+            }
+            for i in range(10)
+        ]
+        await db_session.execute(insert(Participant), rows)
+        await db_session.commit()
+
+        # Fire the polling requests concurrently
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                async_client.get(f"/api/v1/sessions/{session.id}/status")
+                for _ in range(10)
+            )
+        )
+        avg_response_time = (time.perf_counter() - start_time) / 10
+
+        for response in responses:
+            assert response.status_code == 200
+            assert response.json()["participant_count"] == 10
+
+        # Should stay within a 20ms budget per request on average
+        assert (
+            avg_response_time < 0.02
+        ), f"Average response time {avg_response_time}s exceeds 20ms"
@@ -2,8 +2,10 @@
 Comprehensive tests for UserResponseService to improve test coverage.
 """
 
+import json
+
 import pytest
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from uuid import uuid4
 
 from app.services.user_response_service import UserResponseService
@@ -92,6 +94,61 @@ class TestUserResponseService:
         assert response.id is not None
         assert response.created_at is not None
 
+    async def test_create_response_notifies_subscribers(
+        self, db_session, sample_session_activity_participant, sample_user_response_data
+    ):
+        """Test a created response reaches live subscribers and fresh status."""
+        from app.core.events import activity_events
+        from app.services.activity_service import ActivityService
+
+        data = sample_session_activity_participant
+        status = await ActivityService.get_activity_status(
+            db_session, data["session_id"], data["activity_id"]
+        )
+        assert status["response_count"] == 0
+
+        async with activity_events.subscribe(data["activity_id"]) as queue:
+            await UserResponseService.create_response(
+                db=db_session,
+                session_id=data["session_id"],
+                activity_id=data["activity_id"],
+                participant_id=data["participant_id"],
+                response_data=sample_user_response_data,
+            )
+            assert queue.get_nowait() == {
+                "event": "response_received",
+                "activity_id": str(data["activity_id"]),
+            }
+
+        status = await ActivityService.get_activity_status(
+            db_session, data["session_id"], data["activity_id"]
+        )
+        assert status["response_count"] == 1
+
+    async def test_create_responses_bulk(
+        self, db_session, sample_session_activity_participant
+    ):
+        """Test inserting several responses in one call."""
+        data = sample_session_activity_participant
+        rows = [
+            {**data, "response_data": {"answer": answer}}
+            for answer in ("Python", "Go", "Rust")
+        ]
+
+        await UserResponseService.create_responses_bulk(db_session, rows)
+        await UserResponseService.create_responses_bulk(db_session, [])
+
+        responses = await UserResponseService.get_activity_responses(
+            db=db_session,
+            session_id=data["session_id"],
+            activity_id=data["activity_id"],
+        )
+        assert sorted(r.response_data["answer"] for r in responses) == [
+            "Go",
+            "Python",
+            "Rust",
+        ]
+
     async def test_get_activity_responses(
         self, db_session, sample_session_activity_participant, sample_user_response_data
     ):
@@ -171,6 +228,86 @@ class TestUserResponseService:
         assert len(responses_page1) == 2
         assert len(responses_page2) == 1
 
+    async def test_get_activity_responses_with_cursor(
+        self, db_session, sample_session_activity_participant
+    ):
+        """Test keyset pagination walks every response exactly once."""
+        data = sample_session_activity_participant
+        now = datetime.now(UTC)
+        # Two responses share a timestamp so the id tiebreak is exercised
+        rows = [
+            {**data, "response_data": {"index": i}, "created_at": created_at}
+            for i, created_at in enumerate(
+                [now - timedelta(seconds=2), now, now, now - timedelta(seconds=1)]
+            )
+        ]
+        await UserResponseService.create_responses_bulk(db_session, rows)
+
+        seen = []
+        cursor = None
+        for _ in range(len(rows)):
+            page = await UserResponseService.get_activity_responses(
+                db=db_session,
+                session_id=data["session_id"],
+                activity_id=data["activity_id"],
+                limit=3,
+                cursor=cursor,
+            )
+            seen.extend(page)
+            if len(page) < 3:
+                break
+            cursor = UserResponseService.decode_cursor(
+                UserResponseService.encode_cursor(page[-1])
+            )
+
+        assert len(seen) == 4
+        assert len({r.id for r in seen}) == 4
+        assert [r.response_data["index"] for r in seen][2:] == [3, 0]
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            UserResponseService.decode_cursor("not-a-cursor")
+
+    async def test_activity_responses_cursor_with_default_timestamps(
+        self, async_client, db_session, sample_session_activity_participant
+    ):
+        """Test following next_cursor ends when created_at is left to defaults."""
+        data = sample_session_activity_participant
+        rows = [{**data, "response_data": {"index": i}} for i in range(3)]
+        await UserResponseService.create_responses_bulk(db_session, rows)
+        url = (
+            f"/api/v1/sessions/{data['session_id']}/activities/"
+            f"{data['activity_id']}/responses"
+        )
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(len(rows)):
+            page = (await async_client.get(url, params=params)).json()
+            seen.extend(r["response_data"]["index"] for r in page["responses"])
+            if not page["next_cursor"]:
+                break
+            params["cursor"] = page["next_cursor"]
+
+        assert sorted(seen) == [0, 1, 2]
+
+    async def test_export_activity_responses(
+        self, async_client, db_session, sample_session_activity_participant
+    ):
+        """Test the export endpoint streams every response as NDJSON."""
+        data = sample_session_activity_participant
+        rows = [{**data, "response_data": {"index": i}} for i in range(3)]
+        await UserResponseService.create_responses_bulk(db_session, rows)
+
+        response = await async_client.get(
+            f"/api/v1/sessions/{data['session_id']}/activities/"
+            f"{data['activity_id']}/responses/export"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        exported = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(r["response_data"]["index"] for r in exported) == [0, 1, 2]
+        assert all(r["activity_id"] == str(data["activity_id"]) for r in exported)
+
     async def test_get_participant_response(
         self, db_session, sample_session_activity_participant, sample_user_response_data
     ):
@@ -495,6 +632,62 @@ class TestUserResponseService:
         assert len(result["items"]) == 1
         assert result["items"][0].id == response.id
 
+    async def test_get_responses_since_cursor(
+        self, async_client, db_session, sample_session_activity_participant
+    ):
+        """Test polling with next_cursor returns each response exactly once."""
+        data = sample_session_activity_participant
+        now = datetime.now(UTC)
+        url = (
+            f"/api/v1/sessions/{data['session_id']}/activities/"
+            f"{data['activity_id']}/responses/since/2020-01-01T00:00:00Z"
+        )
+        # With a page break between responses sharing a timestamp, resuming
+        # from the last timestamp would skip the rest of them
+        rows = [
+            {**data, "response_data": {"index": i}, "created_at": now} for i in range(3)
+        ]
+        await UserResponseService.create_responses_bulk(db_session, rows)
+
+        first = (await async_client.get(url, params={"limit": 2})).json()
+        second = (
+            await async_client.get(url, params={"cursor": first["next_cursor"]})
+        ).json()
+        third = (
+            await async_client.get(url, params={"cursor": second["next_cursor"]})
+        ).json()
+
+        assert first["count"] == 2
+        assert second["count"] == 1
+        indexes = [item["response_data"]["index"] for item in first["items"]]
+        indexes += [item["response_data"]["index"] for item in second["items"]]
+        assert sorted(indexes) == [0, 1, 2]
+        assert third["count"] == 0
+        assert third["next_cursor"] == second["next_cursor"]
+
+    async def test_get_responses_since_cursor_with_default_timestamps(
+        self, async_client, db_session, sample_session_activity_participant
+    ):
+        """Test a response added after a poll is returned on the next poll."""
+        data = sample_session_activity_participant
+        url = (
+            f"/api/v1/sessions/{data['session_id']}/activities/"
+            f"{data['activity_id']}/responses/since/2020-01-01T00:00:00Z"
+        )
+        row = {**data, "response_data": {"index": 0}}
+        await UserResponseService.create_responses_bulk(db_session, [row])
+
+        first = (await async_client.get(url)).json()
+        await UserResponseService.create_responses_bulk(
+            db_session, [{**row, "response_data": {"index": 1}}]
+        )
+        second = (
+            await async_client.get(url, params={"cursor": first["next_cursor"]})
+        ).json()
+
+        assert [item["response_data"]["index"] for item in first["items"]] == [0]
+        assert [item["response_data"]["index"] for item in second["items"]] == [1]
+
     async def test_get_responses_since_empty(
         self, db_session, sample_session_activity_participant
     ):